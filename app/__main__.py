@@ -0,0 +1,84 @@
+"""
+Command-line entry point: `python -m app <command>`.
+
+Commands:
+    import-participants PATH  Stream a CSV or NDJSON file into participants.
+    migrate [--to VERSION]    Upgrade or downgrade the schema (to the latest
+                              version by default).
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from app.business_logic.participant_import import iter_records
+from app.business_logic.participant_service import ParticipantService
+from app.config import get_settings
+from app.data_access_layer import migrations
+from app.data_access_layer.database import get_engine, get_sessionmaker
+
+
+def import_participants(args: argparse.Namespace) -> None:
+    """
+    Import participants from a file, reading it line by line.
+    """
+    file_format = args.format or args.path.suffix.lstrip(".").lower()
+    chunk_size = args.chunk_size or get_settings().participant_import_chunk_size
+    db = get_sessionmaker()()
+    try:
+        with args.path.open(encoding="utf-8", newline="") as lines:
+            report = ParticipantService(db).import_records(
+                iter_records(lines, file_format), chunk_size=chunk_size
+            )
+    finally:
+        db.close()
+    print(json.dumps(report))
+
+
+def migrate(args: argparse.Namespace) -> None:
+    """
+    Move the schema to version `--to`, upgrading or downgrading as needed.
+    """
+    engine = get_engine()
+    with engine.connect() as connection:
+        version = migrations.current_version(connection)
+        connection.commit()
+    target = migrations.head() if args.to is None else args.to
+    if target >= version:
+        applied = migrations.upgrade(engine, target)
+        print(json.dumps({"from": version, "to": target, "applied": applied}))
+    else:
+        reverted = migrations.downgrade(engine, target)
+        print(json.dumps({"from": version, "to": target, "reverted": reverted}))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser(
+        "import-participants", help="import participants from a CSV or NDJSON file"
+    )
+    importer.add_argument("path", type=Path)
+    importer.add_argument(
+        "--format",
+        choices=["csv", "ndjson"],
+        help="file format (defaults to the file extension)",
+    )
+    importer.add_argument("--chunk-size", type=int, help="records per transaction")
+    importer.set_defaults(handler=import_participants, migrates=True)
+
+    migrator = commands.add_parser("migrate", help="upgrade or downgrade the schema")
+    migrator.add_argument(
+        "--to", type=int, help="target version (defaults to the latest)"
+    )
+    migrator.set_defaults(handler=migrate, migrates=False)
+
+    args = parser.parse_args(argv)
+    if args.migrates:
+        migrations.upgrade(get_engine())
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
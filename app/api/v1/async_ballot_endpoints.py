@@ -0,0 +1,116 @@
+"""
+Defines all /ballots endpoints via APIRouter, served by async handlers.
+"""
+
+from typing import List
+from fastapi import APIRouter
+from fastapi import Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.v1.ballot_endpoints import BULK_REQUEST_BODY, create_ballots_bulk
+from app.business_logic.ballot_service import AsyncBallotService
+from app.business_logic.group_commit import get_ballot_write_buffer
+from app.business_logic.pagination import CURSOR_DESCRIPTION, NEXT_CURSOR_HEADER
+from app.config import get_settings
+from app.rate_limit import limit_ballot_rate
+from app.data_access_layer.database import get_async_db
+from app.api.v1.fast_json import async_list_rows_response
+from app.api.v1.idempotency import (
+    AsyncIdempotencyService,
+    IdempotencyKeyHeader,
+    get_async_idempotency_service,
+    async_idempotent_create,
+)
+from app.api.v1.schemas.ballot import (
+    BallotCreate,
+    Ballot,
+    BallotBulkResult,
+)
+
+router = APIRouter()
+
+
+def get_ballot_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncBallotService:
+    """
+    Dependency to provide an AsyncBallotService instance for use cases.
+    """
+    return AsyncBallotService(db=db, write_buffer=get_ballot_write_buffer())
+
+
+@router.post("/", response_model=Ballot, summary="Create ballot")
+async def create_ballot(
+    payload: BallotCreate,
+    request: Request,
+    service: AsyncBallotService = Depends(get_ballot_service),
+    idempotency_key: str | None = IdempotencyKeyHeader,
+    idempotency: AsyncIdempotencyService = Depends(get_async_idempotency_service),
+) -> Ballot:
+    """
+    Create a new ballot using service layer.
+    A retry carrying the same Idempotency-Key gets the original response.
+    Over-eager participants and clients are turned away with 429 before the
+    ballot is written; a replayed retry is not charged.
+    """
+
+    async def create() -> Ballot:
+        limit_ballot_rate(request, [payload.participant_id])
+        return await service.create(payload.model_dump(exclude_unset=True))
+
+    return await async_idempotent_create(
+        idempotency, idempotency_key, "POST /ballots/", payload, create, Ballot
+    )
+
+
+# Bulk inserts run on the sync service in one executemany, in both modes
+router.post(
+    "/bulk",
+    response_model=BallotBulkResult,
+    summary="Create ballots in bulk",
+    openapi_extra={"requestBody": BULK_REQUEST_BODY},
+)(create_ballots_bulk)
+
+
+@router.get("/", response_model=List[Ballot], summary="List ballots")
+async def list_ballots(
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    service: AsyncBallotService = Depends(get_ballot_service),
+) -> List[Ballot]:
+    """
+    List ballots with pagination via service.
+    Pages are fetched by keyset unless an offset is given; the cursor of the
+    next page is returned in the X-Next-Cursor header.
+    """
+    if get_settings().fast_list_responses:
+        return await async_list_rows_response(service, Ballot, skip, cursor, limit)
+    if skip and cursor is None:
+        return await service.list_all(skip=skip, limit=limit)
+    ballots, next_cursor = await service.list_page(cursor=cursor, limit=limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return ballots
+
+
+@router.get("/{ballot_id}", response_model=Ballot, summary="Get ballot by ID")
+async def get_ballot(
+    ballot_id: int,
+    service: AsyncBallotService = Depends(get_ballot_service),
+) -> Ballot:
+    """
+    Fetch a single ballot by ID via service.
+    """
+    return await service.get(ballot_id)
+
+
+@router.delete("/{ballot_id}", response_model=Ballot, summary="Delete ballot")
+async def delete_ballot(
+    ballot_id: int,
+    service: AsyncBallotService = Depends(get_ballot_service),
+) -> Ballot:
+    """
+    Delete a ballot via service.
+    """
+    return await service.delete(ballot_id)
@@ -0,0 +1,194 @@
+"""
+Defines all /draws endpoints via APIRouter, served by async handlers.
+"""
+
+from datetime import date
+from typing import List
+
+from fastapi import APIRouter
+from fastapi import Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.draw_endpoints import draw_event_socket, draw_event_stream
+from app.business_logic.ballot_service import EXPORT_FIELDS, AsyncBallotService
+from app.business_logic.draw_service import AsyncDrawService
+from app.business_logic.pagination import CURSOR_DESCRIPTION, NEXT_CURSOR_HEADER
+from app.config import get_settings
+from app.data_access_layer.database import get_async_db
+from app.api.v1.fast_json import async_list_rows_response
+from app.api.v1.export import ExportFormat, export_response
+from app.api.v1.http_cache import draw_validators, not_modified, page_validators
+from app.api.v1.schemas.draw import (
+    DrawCreate,
+    Draw,
+    DrawHistoryItem,
+    DrawOdds,
+    DrawResult,
+)
+
+router = APIRouter()
+
+
+def get_draw_service(db: AsyncSession = Depends(get_async_db)) -> AsyncDrawService:
+    """
+    Dependency to provide an AsyncDrawService instance for use cases.
+    """
+    return AsyncDrawService(db=db)
+
+
+@router.post("/", response_model=Draw, summary="Create draw")
+async def create_draw(
+    payload: DrawCreate,
+    service: AsyncDrawService = Depends(get_draw_service),
+) -> Draw:
+    """
+    Create a new draw using service layer.
+    """
+    return await service.create(payload.model_dump(exclude_unset=True))
+
+
+@router.get("/", response_model=List[Draw], summary="List draws")
+async def list_draws(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    service: AsyncDrawService = Depends(get_draw_service),
+) -> List[Draw]:
+    """
+    List draws with pagination via service.
+    Pages are fetched by keyset unless an offset is given; the cursor of the
+    next page is returned in the X-Next-Cursor header. Pages carry an ETag and
+    answer a matching If-None-Match with 304.
+    """
+    if get_settings().fast_list_responses:
+        page = await async_list_rows_response(service, Draw, skip, cursor, limit)
+        page.headers.update(page_validators(page.body))
+        return not_modified(request, page.headers) or page
+    if skip and cursor is None:
+        draws, next_cursor = await service.list_all(skip=skip, limit=limit), None
+    else:
+        draws, next_cursor = await service.list_page(cursor=cursor, limit=limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    keys = [(draw.id, draw.draw_date, draw.winner_id) for draw in draws]
+    response.headers.update(page_validators((keys, next_cursor)))
+    return not_modified(request, response.headers) or draws
+
+
+@router.get("/daily-draw", response_model=Draw, summary="Daily Draw")
+async def daily_draw(
+    service: AsyncDrawService = Depends(get_draw_service),
+) -> Draw:
+    """
+    Retrieve the draw closed by the last midnight with its winner; 404 until
+    the midnight job has drawn it. Requests never trigger the winner selection.
+    """
+    return await service.last_drawn()
+
+
+@router.get("/history", response_model=List[DrawHistoryItem], summary="Draw history")
+async def draw_history(
+    response: Response,
+    from_date: date | None = Query(None, alias="from"),
+    to_date: date | None = Query(None, alias="to"),
+    limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    service: AsyncDrawService = Depends(get_draw_service),
+) -> List[DrawHistoryItem]:
+    """
+    List draws between two dates (inclusive) with their winner and ballot
+    totals, by date. Every page costs the same few queries; the cursor of the
+    next page is returned in the X-Next-Cursor header.
+    """
+    items, next_cursor = await service.history(
+        from_date, to_date, cursor=cursor, limit=limit
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return items
+
+
+@router.get("/current/odds", response_model=DrawOdds, summary="Odds of today's draw")
+async def current_draw_odds(db: AsyncSession = Depends(get_async_db)) -> DrawOdds:
+    """
+    Ballot totals of today's draw, answered from in-process counters without
+    querying the database.
+    """
+    return await AsyncBallotService(db=db).odds()
+
+
+router.get(
+    "/events",
+    response_class=StreamingResponse,
+    summary="Subscribe to draw results (Server-Sent Events)",
+)(draw_event_stream)
+router.websocket("/events/ws")(draw_event_socket)
+
+
+@router.get("/{draw_id}", response_model=Draw, summary="Get draw by ID")
+async def get_draw(
+    draw_id: int,
+    request: Request,
+    response: Response,
+    service: AsyncDrawService = Depends(get_draw_service),
+) -> Draw:
+    """
+    Fetch a single draw by ID via service.
+    Finalized draws are cacheable for long, the open draw only briefly; a
+    matching If-None-Match is answered with 304.
+    """
+    draw = await service.get(draw_id)
+    response.headers.update(draw_validators(draw))
+    return not_modified(request, response.headers) or draw
+
+
+@router.get(
+    "/{draw_id}/results",
+    response_model=List[DrawResult],
+    summary="List the winners of a draw",
+)
+async def list_draw_results(
+    draw_id: int,
+    service: AsyncDrawService = Depends(get_draw_service),
+) -> List[DrawResult]:
+    """
+    List the winners of a draw by rank, one per prize; empty until it is drawn.
+    """
+    await service.get(draw_id)
+    return await service.results(draw_id)
+
+
+@router.get(
+    "/{draw_id}/ballots/export",
+    response_class=StreamingResponse,
+    summary="Export the ballots of a draw",
+)
+async def export_ballots(
+    draw_id: int,
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    gzip: bool = Query(False, description="Compress the export with gzip"),
+    db: AsyncSession = Depends(get_async_db),
+) -> StreamingResponse:
+    """
+    Stream every ballot of a draw as NDJSON or CSV.
+    Rows are fetched in batches of EXPORT_BATCH_SIZE and sent as they are
+    encoded, so memory use does not grow with the number of ballots.
+    """
+    rows = await AsyncBallotService(db=db).export_rows(draw_id)
+    return export_response(
+        rows, EXPORT_FIELDS, export_format, gzip, f"draw-{draw_id}-ballots"
+    )
+
+
+@router.delete("/{draw_id}", response_model=Draw, summary="Delete draw")
+async def delete_draw(
+    draw_id: int,
+    service: AsyncDrawService = Depends(get_draw_service),
+) -> Draw:
+    """
+    Delete a draw via service.
+    """
+    return await service.delete(draw_id)
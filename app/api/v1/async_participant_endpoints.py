@@ -0,0 +1,148 @@
+"""
+Defines all /participants endpoints via APIRouter, served by async handlers.
+"""
+
+from typing import List
+from fastapi import APIRouter
+from fastapi import Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.v1.participant_endpoints import IMPORT_REQUEST_BODY, import_participants
+from app.business_logic.ballot_service import AsyncBallotService
+from app.business_logic.participant_service import AsyncParticipantService
+from app.business_logic.pagination import CURSOR_DESCRIPTION, NEXT_CURSOR_HEADER
+from app.config import get_settings
+from app.data_access_layer.database import get_async_db
+from app.api.v1.fast_json import async_list_rows_response
+from app.api.v1.idempotency import (
+    AsyncIdempotencyService,
+    IdempotencyKeyHeader,
+    get_async_idempotency_service,
+    async_idempotent_create,
+)
+from app.api.v1.schemas.participant import (
+    ParticipantCreate,
+    ParticipantUpdate,
+    Participant,
+    ParticipantImportResult,
+    ParticipantOdds,
+)
+
+router = APIRouter()
+
+
+def get_participant_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncParticipantService:
+    """
+    Dependency to provide an AsyncParticipantService instance for use cases.
+    """
+    return AsyncParticipantService(db)
+
+
+@router.post("/", response_model=Participant, summary="Create participant")
+async def create_participant(
+    payload: ParticipantCreate,
+    service: AsyncParticipantService = Depends(get_participant_service),
+    idempotency_key: str | None = IdempotencyKeyHeader,
+    idempotency: AsyncIdempotencyService = Depends(get_async_idempotency_service),
+) -> Participant:
+    """
+    Create a new participant using service layer.
+    A retry carrying the same Idempotency-Key gets the original response.
+    """
+    return await async_idempotent_create(
+        idempotency,
+        idempotency_key,
+        "POST /participants/",
+        payload,
+        lambda: service.create(payload.model_dump(exclude_unset=True)),
+        Participant,
+    )
+
+
+# Bulk import streams into the sync service in chunks, in both modes
+router.post(
+    "/import",
+    response_model=ParticipantImportResult,
+    summary="Import participants",
+    openapi_extra={"requestBody": IMPORT_REQUEST_BODY},
+)(import_participants)
+
+
+@router.get("/", response_model=List[Participant], summary="List participants")
+async def list_participants(
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    service: AsyncParticipantService = Depends(get_participant_service),
+) -> List[Participant]:
+    """
+    List participants with pagination via service.
+    Pages are fetched by keyset unless an offset is given; the cursor of the
+    next page is returned in the X-Next-Cursor header.
+    """
+    if get_settings().fast_list_responses:
+        return await async_list_rows_response(service, Participant, skip, cursor, limit)
+    if skip and cursor is None:
+        return await service.list_all(skip=skip, limit=limit)
+    participants, next_cursor = await service.list_page(cursor=cursor, limit=limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return participants
+
+
+@router.get(
+    "/{participant_id}", response_model=Participant, summary="Get participant by ID"
+)
+async def get_participant(
+    participant_id: int,
+    service: AsyncParticipantService = Depends(get_participant_service),
+) -> Participant:
+    """
+    Fetch a single participant by ID via service.
+    """
+    return await service.get(participant_id)
+
+
+@router.get(
+    "/{participant_id}/odds",
+    response_model=ParticipantOdds,
+    summary="Participant's odds in today's draw",
+)
+async def get_participant_odds(
+    participant_id: int,
+    db: AsyncSession = Depends(get_async_db),
+) -> ParticipantOdds:
+    """
+    A participant's ballots in today's draw and chance of the grand prize,
+    answered from in-process counters without querying the database.
+    """
+    return await AsyncBallotService(db=db).participant_odds(participant_id)
+
+
+@router.patch(
+    "/{participant_id}", response_model=Participant, summary="Update participant"
+)
+async def patch_participant(
+    participant_id: int,
+    payload: ParticipantUpdate,
+    service: AsyncParticipantService = Depends(get_participant_service),
+) -> Participant:
+    """
+    Partially update a participant via service.
+    """
+    return await service.update(participant_id, payload.model_dump(exclude_unset=True))
+
+
+@router.delete(
+    "/{participant_id}", response_model=Participant, summary="Delete participant"
+)
+async def delete_participant(
+    participant_id: int,
+    service: AsyncParticipantService = Depends(get_participant_service),
+) -> Participant:
+    """
+    Delete a participant via service.
+    """
+    return await service.delete(participant_id)
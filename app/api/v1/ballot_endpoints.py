@@ -2,48 +2,212 @@
 Defines all /ballots endpoints via APIRouter.
 """
 
-from typing import List
+import json
+from typing import List, Any
 from fastapi import APIRouter
-from fastapi import Depends, Query
+from fastapi import Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError as SchemaValidationError
 from sqlalchemy.orm import Session
 from app.business_logic.ballot_service import BallotService
+from app.business_logic.group_commit import get_ballot_write_buffer
+from app.business_logic.pagination import CURSOR_DESCRIPTION, NEXT_CURSOR_HEADER
+from app.config import get_settings
+from app.rate_limit import limit_ballot_rate
 from app.data_access_layer.database import get_db
+from app.exceptions import ValidationError
+from app.api.v1.fast_json import list_rows_response
+from app.api.v1.idempotency import (
+    IdempotencyService,
+    IdempotencyKeyHeader,
+    get_idempotency_service,
+    idempotent_create,
+)
 from app.api.v1.schemas.ballot import (
     BallotCreate,
     Ballot,
+    BallotBulkItemResult,
+    BallotBulkResult,
 )
 
 router = APIRouter()
 
+BULK_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "array",
+                "items": {"$ref": "#/components/schemas/BallotCreate"},
+            }
+        },
+        "application/x-ndjson": {
+            "schema": {"$ref": "#/components/schemas/BallotCreate"}
+        },
+    },
+}
+
 
 def get_ballot_service(db: Session = Depends(get_db)) -> BallotService:
     """
     Dependency to provide a BallotService instance for use cases.
     """
-    return BallotService(db=db)
+    return BallotService(db=db, write_buffer=get_ballot_write_buffer())
 
 
 @router.post("/", response_model=Ballot, summary="Create ballot")
 def create_ballot(
     payload: BallotCreate,
+    request: Request,
     service: BallotService = Depends(get_ballot_service),
+    idempotency_key: str | None = IdempotencyKeyHeader,
+    idempotency: IdempotencyService = Depends(get_idempotency_service),
 ) -> Ballot:
     """
     Create a new ballot using service layer.
+    A retry carrying the same Idempotency-Key gets the original response.
+    Over-eager participants and clients are turned away with 429 before the
+    ballot is written; a replayed retry is not charged.
+    """
+
+    def create() -> Ballot:
+        limit_ballot_rate(request, [payload.participant_id])
+        return service.create(payload.model_dump(exclude_unset=True))
+
+    return idempotent_create(
+        idempotency, idempotency_key, "POST /ballots/", payload, create, Ballot
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=BallotBulkResult,
+    summary="Create ballots in bulk",
+    openapi_extra={"requestBody": BULK_REQUEST_BODY},
+)
+async def create_ballots_bulk(
+    request: Request,
+    service: BallotService = Depends(get_ballot_service),
+) -> BallotBulkResult:
+    """
+    Create many ballots in one transaction from a JSON array or an NDJSON body.
+    Invalid items and ballots of unknown participants are reported by index
+    and do not prevent the others from being created. Each valid item is
+    charged to the ballot rate limits.
     """
-    return service.create(payload.model_dump(exclude_unset=True))
+    settings = get_settings()
+    items = await _read_bulk_items(
+        request, settings.ballot_bulk_max_items, settings.ballot_bulk_max_bytes
+    )
+
+    results: list[BallotBulkItemResult] = []
+    valid: list[tuple[int, dict[str, Any]]] = []
+    for index, item in enumerate(items):
+        if isinstance(item, ValueError):
+            results.append(BallotBulkItemResult(index=index, error=str(item)))
+            continue
+        try:
+            payload = BallotCreate.model_validate(item)
+        except SchemaValidationError as exc:
+            results.append(BallotBulkItemResult(index=index, error=_describe(exc)))
+            continue
+        valid.append((index, payload.model_dump(exclude_unset=True)))
+
+    limit_ballot_rate(request, [data["participant_id"] for _, data in valid])
+    ids = await run_in_threadpool(service.create_many, [data for _, data in valid])
+    created = 0
+    for (index, data), ballot_id in zip(valid, ids):
+        if ballot_id is None:
+            error = f"Participant {data['participant_id']} not found"
+            results.append(BallotBulkItemResult(index=index, error=error))
+        else:
+            results.append(BallotBulkItemResult(index=index, id=ballot_id))
+            created += 1
+    results.sort(key=lambda result: result.index)
+    return BallotBulkResult(created=created, failed=len(items) - created, items=results)
+
+
+async def _read_bulk_items(
+    request: Request, max_items: int, max_bytes: int
+) -> list[Any]:
+    """
+    Read a bulk body into items, turning it away as soon as it is over
+    `max_bytes` or holds more than `max_items` items. NDJSON lines are decoded
+    as they arrive; undecodable ones are kept as ValueError items so that they
+    can be reported by index.
+    """
+    too_large = ValidationError(f"A bulk submission holds at most {max_bytes} bytes.")
+    too_many = ValidationError(f"A bulk submission holds at most {max_items} ballots.")
+    if int(request.headers.get("content-length") or 0) > max_bytes:
+        raise too_large
+    ndjson = "ndjson" in request.headers.get("content-type", "")
+    items: list[Any] = []
+    buffer = bytearray()
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise too_large
+        buffer += chunk
+        if ndjson:
+            *lines, rest = buffer.split(b"\n")
+            _decode_lines(lines, items)
+            buffer = bytearray(rest)
+            if len(items) > max_items:
+                raise too_many
+    if ndjson:
+        _decode_lines([buffer], items)
+    else:
+        try:
+            items = json.loads(buffer)
+        except ValueError as exc:
+            raise ValidationError(f"Invalid JSON: {exc}")
+        if not isinstance(items, list):
+            raise ValidationError("Expected a JSON array of ballots.")
+    if len(items) > max_items:
+        raise too_many
+    return items
+
+
+def _decode_lines(lines: list[bytes], items: list[Any]) -> None:
+    """Append the items of NDJSON `lines` to `items`, skipping blank lines."""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            items.append(json.loads(line))
+        except ValueError as exc:
+            items.append(ValueError(f"Invalid JSON: {exc}"))
+
+
+def _describe(exc: SchemaValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, error['loc'])) or 'body'}: {error['msg']}"
+        for error in exc.errors()
+    )
 
 
 @router.get("/", response_model=List[Ballot], summary="List ballots")
 def list_ballots(
+    response: Response,
     skip: int = 0,
     limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     service: BallotService = Depends(get_ballot_service),
 ) -> List[Ballot]:
     """
     List ballots with pagination via service.
+    Pages are fetched by keyset unless an offset is given; the cursor of the
+    next page is returned in the X-Next-Cursor header.
     """
-    return service.list_all(skip=skip, limit=limit)
+    if get_settings().fast_list_responses:
+        return list_rows_response(service, Ballot, skip, cursor, limit)
+    if skip and cursor is None:
+        return service.list_all(skip=skip, limit=limit)
+    ballots, next_cursor = service.list_page(cursor=cursor, limit=limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return ballots
 
 
 @router.get("/{ballot_id}", response_model=Ballot, summary="Get ballot by ID")
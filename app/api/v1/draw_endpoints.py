@@ -2,20 +2,30 @@
 Defines all /draws endpoints via APIRouter.
 """
 
-import secrets
-from datetime import datetime
+from datetime import date
 from typing import List
 
 from fastapi import APIRouter
-from fastapi import Depends, Query
+from fastapi import Depends, Header, Query, Request, Response, WebSocket
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.business_logic.ballot_service import BallotService
+from app.business_logic.ballot_service import EXPORT_FIELDS, BallotService
+from app.business_logic.draw_events import get_draw_events
 from app.business_logic.draw_service import DrawService
+from app.business_logic.pagination import CURSOR_DESCRIPTION, NEXT_CURSOR_HEADER
+from app.config import get_settings
 from app.data_access_layer.database import get_db
+from app.api.v1.fast_json import list_rows_response
+from app.api.v1.event_stream import sse_response, stream_to_websocket
+from app.api.v1.export import ExportFormat, export_response
+from app.api.v1.http_cache import draw_validators, not_modified, page_validators
 from app.api.v1.schemas.draw import (
     DrawCreate,
     Draw,
+    DrawHistoryItem,
+    DrawOdds,
+    DrawResult,
 )
 
 router = APIRouter()
@@ -41,14 +51,32 @@ def create_draw(
 
 @router.get("/", response_model=List[Draw], summary="List draws")
 def list_draws(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     service: DrawService = Depends(get_draw_service),
 ) -> List[Draw]:
     """
     List draws with pagination via service.
+    Pages are fetched by keyset unless an offset is given; the cursor of the
+    next page is returned in the X-Next-Cursor header. Pages carry an ETag and
+    answer a matching If-None-Match with 304.
     """
-    return service.list_all(skip=skip, limit=limit)
+    if get_settings().fast_list_responses:
+        page = list_rows_response(service, Draw, skip, cursor, limit)
+        page.headers.update(page_validators(page.body))
+        return not_modified(request, page.headers) or page
+    if skip and cursor is None:
+        draws, next_cursor = service.list_all(skip=skip, limit=limit), None
+    else:
+        draws, next_cursor = service.list_page(cursor=cursor, limit=limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    keys = [(draw.id, draw.draw_date, draw.winner_id) for draw in draws]
+    response.headers.update(page_validators((keys, next_cursor)))
+    return not_modified(request, response.headers) or draws
 
 
 @router.get("/daily-draw", response_model=Draw, summary="Daily Draw")
@@ -56,28 +84,120 @@ def daily_draw(
     service: DrawService = Depends(get_draw_service),
 ) -> Draw:
     """
-    Draw or retrieve a winner via service.
+    Retrieve the draw closed by the last midnight with its winner; 404 until
+    the midnight job has drawn it. Requests never trigger the winner selection.
     """
-    draw = service.get_by_attributes(attributes={"draw_date": datetime.now().date()})[0]
-    if draw.winner_id is None:
-        ballot_service = BallotService(service.db)
-        ballots = ballot_service.get_by_attributes({"draw_id": draw.id})
-        winner = secrets.choice(ballots)
-        draw = service.update(
-            item_id=draw.id, data={"winner_id": winner.participant_id}
-        )
-    return draw
+    return service.last_drawn()
+
+
+@router.get("/history", response_model=List[DrawHistoryItem], summary="Draw history")
+def draw_history(
+    response: Response,
+    from_date: date | None = Query(None, alias="from"),
+    to_date: date | None = Query(None, alias="to"),
+    limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    service: DrawService = Depends(get_draw_service),
+) -> List[DrawHistoryItem]:
+    """
+    List draws between two dates (inclusive) with their winner and ballot
+    totals, by date. Every page costs the same few queries; the cursor of the
+    next page is returned in the X-Next-Cursor header.
+    """
+    items, next_cursor = service.history(from_date, to_date, cursor=cursor, limit=limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return items
+
+
+@router.get("/current/odds", response_model=DrawOdds, summary="Odds of today's draw")
+def current_draw_odds(db: Session = Depends(get_db)) -> DrawOdds:
+    """
+    Ballot totals of today's draw, answered from in-process counters without
+    querying the database.
+    """
+    return BallotService(db=db).odds()
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    summary="Subscribe to draw results (Server-Sent Events)",
+)
+async def draw_event_stream(
+    last_event_id: int | None = Header(None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """
+    Hold a Server-Sent Events stream open and receive each draw's winners as
+    soon as they are drawn, instead of polling. The latest result is sent on
+    connect unless Last-Event-ID shows the client already has it.
+    """
+    keepalive = get_settings().draw_events_keepalive_seconds
+    return sse_response(get_draw_events(), last_event_id, keepalive)
+
+
+@router.websocket("/events/ws")
+async def draw_event_socket(websocket: WebSocket, last_event_id: int | None = None):
+    """
+    WebSocket counterpart of the draw event stream: each result is sent as a
+    JSON text message.
+    """
+    await stream_to_websocket(websocket, get_draw_events(), last_event_id)
 
 
 @router.get("/{draw_id}", response_model=Draw, summary="Get draw by ID")
 def get_draw(
     draw_id: int,
+    request: Request,
+    response: Response,
     service: DrawService = Depends(get_draw_service),
 ) -> Draw:
     """
     Fetch a single draw by ID via service.
+    Finalized draws are cacheable for long, the open draw only briefly; a
+    matching If-None-Match is answered with 304.
+    """
+    draw = service.get(draw_id)
+    response.headers.update(draw_validators(draw))
+    return not_modified(request, response.headers) or draw
+
+
+@router.get(
+    "/{draw_id}/results",
+    response_model=List[DrawResult],
+    summary="List the winners of a draw",
+)
+def list_draw_results(
+    draw_id: int,
+    service: DrawService = Depends(get_draw_service),
+) -> List[DrawResult]:
+    """
+    List the winners of a draw by rank, one per prize; empty until it is drawn.
+    """
+    service.get(draw_id)
+    return service.results(draw_id)
+
+
+@router.get(
+    "/{draw_id}/ballots/export",
+    response_class=StreamingResponse,
+    summary="Export the ballots of a draw",
+)
+def export_ballots(
+    draw_id: int,
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    gzip: bool = Query(False, description="Compress the export with gzip"),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream every ballot of a draw as NDJSON or CSV.
+    Rows are fetched in batches of EXPORT_BATCH_SIZE and sent as they are
+    encoded, so memory use does not grow with the number of ballots.
     """
-    return service.get(draw_id)
+    rows = BallotService(db=db).export_rows(draw_id)
+    return export_response(
+        rows, EXPORT_FIELDS, export_format, gzip, f"draw-{draw_id}-ballots"
+    )
 
 
 @router.delete("/{draw_id}", response_model=Draw, summary="Delete draw")
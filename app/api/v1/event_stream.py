@@ -0,0 +1,80 @@
+"""
+Delivery of draw events to clients over Server-Sent Events and WebSockets.
+"""
+
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.business_logic.draw_events import DrawEventBroker, Subscription
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# Keep proxies from buffering or caching the stream
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+SSE_EVENT = "draw-result"
+
+
+async def sse_events(
+    broker: DrawEventBroker, last_event_id: int | None, keepalive: float
+) -> AsyncIterator[bytes]:
+    """
+    Yield the events of a new subscription in SSE framing, with a comment
+    line after `keepalive` idle seconds. The subscription is opened when the
+    stream starts and closed when it ends or the client goes away.
+    """
+    with broker.subscribe(last_event_id) as subscription:
+        async for event in subscription.events(keepalive):
+            if event is None:
+                yield b": keepalive\n\n"
+            else:
+                yield f"id: {event.id}\nevent: {SSE_EVENT}\ndata: {event.data}\n\n".encode()
+
+
+def sse_response(
+    broker: DrawEventBroker, last_event_id: int | None, keepalive: float
+) -> StreamingResponse:
+    """Stream the events of `broker` to the client as Server-Sent Events."""
+    return StreamingResponse(
+        sse_events(broker, last_event_id, keepalive),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
+
+
+async def _send_events(websocket: WebSocket, subscription: Subscription) -> None:
+    async for event in subscription.events():
+        await websocket.send_text(event.data)
+
+
+async def _wait_disconnect(websocket: WebSocket) -> None:
+    # Anything the client sends is ignored
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+async def stream_to_websocket(
+    websocket: WebSocket, broker: DrawEventBroker, last_event_id: int | None
+) -> None:
+    """
+    Send the events of `broker` as text messages until the client disconnects
+    or the broker ends the stream, which closes the socket.
+    """
+    await websocket.accept()
+    with broker.subscribe(last_event_id) as subscription:
+        sender = asyncio.create_task(_send_events(websocket, subscription))
+        receiver = asyncio.create_task(_wait_disconnect(websocket))
+        done, pending = await asyncio.wait(
+            {sender, receiver}, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        if sender in done:
+            try:
+                sender.result()
+                await websocket.close()
+            except (WebSocketDisconnect, RuntimeError):
+                pass
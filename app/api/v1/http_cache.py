@@ -0,0 +1,95 @@
+"""
+HTTP caching for draws: ETag and Last-Modified validators, Cache-Control
+lifetimes and If-None-Match handling.
+
+A draw with a winner whose date has passed never changes again, so clients and
+CDNs may keep it for a long time. The open draw and list pages may still change
+and are cached only briefly.
+"""
+
+import hashlib
+from datetime import date, datetime, time, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, Mapping
+from zoneinfo import ZoneInfo
+
+from fastapi import Request, Response
+
+from app.business_logic.draw_service import lottery_today
+from app.config import get_settings
+from app.data_access_layer.models import Draw
+
+# Headers a 304 response repeats from the response it stands in for
+NOT_MODIFIED_HEADERS = ("etag", "cache-control", "last-modified", "x-next-cursor")
+
+
+def make_etag(content: Any) -> str:
+    """Strong ETag of `content`: raw bytes, or any value with a stable repr."""
+    if not isinstance(content, bytes):
+        content = repr(content).encode()
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def is_final(draw: Draw, today: date) -> bool:
+    """Whether `draw` can no longer change: it has a winner and its day is over."""
+    return draw.winner_id is not None and draw.draw_date < today
+
+
+def draw_validators(draw: Draw, today: date | None = None) -> dict[str, str]:
+    """
+    Caching headers for a single draw.
+    """
+    settings = get_settings()
+    today = today or lottery_today()
+    headers = {"ETag": make_etag((draw.id, draw.draw_date, draw.winner_id))}
+    if is_final(draw, today):
+        # The winner is drawn at the midnight that closes the draw
+        closed_at = datetime.combine(
+            draw.draw_date + timedelta(days=1),
+            time.min,
+            tzinfo=ZoneInfo(settings.lottery_timezone),
+        )
+        headers["Last-Modified"] = format_datetime(
+            closed_at.astimezone(timezone.utc), usegmt=True
+        )
+        headers["Cache-Control"] = (
+            f"public, max-age={settings.draw_final_max_age_seconds}, immutable"
+        )
+    else:
+        headers["Cache-Control"] = (
+            f"public, max-age={settings.draw_open_max_age_seconds}"
+        )
+    return headers
+
+
+def page_validators(content: Any) -> dict[str, str]:
+    """
+    Caching headers for a page of draws, whose ETag is derived from `content`.
+    """
+    max_age = get_settings().draw_open_max_age_seconds
+    return {"ETag": make_etag(content), "Cache-Control": f"public, max-age={max_age}"}
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header value covers `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified(request: Request, headers: Mapping[str, str]) -> Response | None:
+    """
+    Return a 304 response carrying the caching `headers` if the client's copy,
+    named by If-None-Match, is current; otherwise None.
+    """
+    if not etag_matches(request.headers.get("if-none-match"), headers["etag"]):
+        return None
+    kept = {
+        name: value
+        for name, value in headers.items()
+        if name.lower() in NOT_MODIFIED_HEADERS
+    }
+    return Response(status_code=304, headers=kept)
@@ -0,0 +1,109 @@
+"""
+Idempotency-Key support for create endpoints.
+
+A client that retries a request with the same key gets the original response,
+marked with the Idempotent-Replayed header, and the request is not executed
+again.
+"""
+
+from typing import Any, Awaitable, Callable
+
+from fastapi import Depends, Header
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.business_logic.idempotency_service import (
+    AsyncIdempotencyService,
+    IdempotencyService,
+    StoredResponse,
+)
+from app.data_access_layer.database import get_async_db, get_db
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+IdempotencyKeyHeader = Header(
+    None,
+    alias="Idempotency-Key",
+    max_length=255,
+    description="Unique key of this request; retries with the same key are "
+    "answered with the original response",
+)
+
+
+def get_idempotency_service(db: Session = Depends(get_db)) -> IdempotencyService:
+    """
+    Dependency to provide an IdempotencyService sharing the request's session.
+    """
+    return IdempotencyService(db)
+
+
+def get_async_idempotency_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncIdempotencyService:
+    """
+    Dependency to provide an AsyncIdempotencyService sharing the request's session.
+    """
+    return AsyncIdempotencyService(db)
+
+
+def replay(stored: StoredResponse) -> JSONResponse:
+    """Build the response of a replayed request."""
+    return JSONResponse(
+        stored.body, status_code=stored.status_code, headers={REPLAYED_HEADER: "true"}
+    )
+
+
+def idempotent_create(
+    service: IdempotencyService,
+    key: str | None,
+    scope: str,
+    payload: BaseModel,
+    create: Callable[[], Any],
+    schema: type[BaseModel],
+) -> Any:
+    """
+    Run `create` once per idempotency `key` and return its result, or replay
+    the response recorded for `key`. Without a key `create` simply runs.
+    """
+    if key is None:
+        return create()
+    stored = service.begin(scope, key, payload.model_dump(mode="json"))
+    if stored is not None:
+        return replay(stored)
+    try:
+        created = create()
+    except Exception:
+        service.abandon(scope, key)
+        raise
+    body = jsonable_encoder(schema.model_validate(created))
+    service.complete(scope, key, 200, body)
+    return created
+
+
+async def async_idempotent_create(
+    service: AsyncIdempotencyService,
+    key: str | None,
+    scope: str,
+    payload: BaseModel,
+    create: Callable[[], Awaitable[Any]],
+    schema: type[BaseModel],
+) -> Any:
+    """
+    Async counterpart of `idempotent_create`.
+    """
+    if key is None:
+        return await create()
+    stored = await service.begin(scope, key, payload.model_dump(mode="json"))
+    if stored is not None:
+        return replay(stored)
+    try:
+        created = await create()
+    except Exception:
+        await service.abandon(scope, key)
+        raise
+    body = jsonable_encoder(schema.model_validate(created))
+    await service.complete(scope, key, 200, body)
+    return created
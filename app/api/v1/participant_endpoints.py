@@ -2,21 +2,44 @@
 Defines all /participants endpoints via APIRouter.
 """
 
-from typing import List
+from typing import List, Literal
 from fastapi import APIRouter
-from fastapi import Depends, Query
+from fastapi import Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from app.business_logic.ballot_service import BallotService
+from app.business_logic.participant_import import achunked, aiter_records
+from app.business_logic.pagination import CURSOR_DESCRIPTION, NEXT_CURSOR_HEADER
 from app.business_logic.participant_service import ParticipantService
+from app.config import get_settings
 from app.data_access_layer.database import get_db
+from app.exceptions import ValidationError
+from app.api.v1.fast_json import list_rows_response
+from app.api.v1.idempotency import (
+    IdempotencyService,
+    IdempotencyKeyHeader,
+    get_idempotency_service,
+    idempotent_create,
+)
 from app.api.v1.schemas.participant import (
     ParticipantCreate,
     ParticipantUpdate,
     Participant,
+    ParticipantImportResult,
+    ParticipantOdds,
 )
 
 
 router = APIRouter()
 
+IMPORT_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "text/csv": {"schema": {"type": "string"}},
+        "application/x-ndjson": {"schema": {"type": "string"}},
+    },
+}
+
 
 def get_participant_service(db: Session = Depends(get_db)) -> ParticipantService:
     """
@@ -29,23 +52,76 @@ def get_participant_service(db: Session = Depends(get_db)) -> ParticipantService
 def create_participant(
     payload: ParticipantCreate,
     service: ParticipantService = Depends(get_participant_service),
+    idempotency_key: str | None = IdempotencyKeyHeader,
+    idempotency: IdempotencyService = Depends(get_idempotency_service),
 ) -> Participant:
     """
     Create a new participant using service layer.
+    A retry carrying the same Idempotency-Key gets the original response.
+    """
+    return idempotent_create(
+        idempotency,
+        idempotency_key,
+        "POST /participants/",
+        payload,
+        lambda: service.create(payload.model_dump(exclude_unset=True)),
+        Participant,
+    )
+
+
+@router.post(
+    "/import",
+    response_model=ParticipantImportResult,
+    summary="Import participants",
+    openapi_extra={"requestBody": IMPORT_REQUEST_BODY},
+)
+async def import_participants(
+    request: Request,
+    file_format: Literal["csv", "ndjson"] | None = Query(None, alias="format"),
+    service: ParticipantService = Depends(get_participant_service),
+) -> ParticipantImportResult:
+    """
+    Stream a CSV (with a name,email header) or NDJSON body into participants.
+    Records are imported in chunks; emails already taken are counted as duplicates.
     """
-    return service.create(payload.model_dump(exclude_unset=True))
+    content_type = request.headers.get("content-type", "")
+    file_format = file_format or next(
+        (known for known in ("csv", "ndjson") if known in content_type), None
+    )
+    if file_format is None:
+        raise ValidationError("Send text/csv or application/x-ndjson, or set format.")
+    records = aiter_records(request.stream(), file_format)
+    chunk_size = get_settings().participant_import_chunk_size
+
+    report = {"created": 0, "duplicates": 0, "invalid": 0}
+    async for chunk in achunked(records, chunk_size):
+        counts = await run_in_threadpool(service.import_chunk, chunk)
+        for outcome, count in counts.items():
+            report[outcome] += count
+    return ParticipantImportResult(**report)
 
 
 @router.get("/", response_model=List[Participant], summary="List participants")
 def list_participants(
+    response: Response,
     skip: int = 0,
     limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     service: ParticipantService = Depends(get_participant_service),
 ) -> List[Participant]:
     """
     List participants with pagination via service.
+    Pages are fetched by keyset unless an offset is given; the cursor of the
+    next page is returned in the X-Next-Cursor header.
     """
-    return service.list_all(skip=skip, limit=limit)
+    if get_settings().fast_list_responses:
+        return list_rows_response(service, Participant, skip, cursor, limit)
+    if skip and cursor is None:
+        return service.list_all(skip=skip, limit=limit)
+    participants, next_cursor = service.list_page(cursor=cursor, limit=limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return participants
 
 
 @router.get(
@@ -61,6 +137,22 @@ def get_participant(
     return service.get(participant_id)
 
 
+@router.get(
+    "/{participant_id}/odds",
+    response_model=ParticipantOdds,
+    summary="Participant's odds in today's draw",
+)
+def get_participant_odds(
+    participant_id: int,
+    db: Session = Depends(get_db),
+) -> ParticipantOdds:
+    """
+    A participant's ballots in today's draw and chance of the grand prize,
+    answered from in-process counters without querying the database.
+    """
+    return BallotService(db=db).participant_odds(participant_id)
+
+
 @router.patch(
     "/{participant_id}", response_model=Participant, summary="Update participant"
 )
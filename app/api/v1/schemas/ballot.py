@@ -34,3 +34,33 @@ class Ballot(BallotBase):
     id: int = Field(..., description="Unique ID")
     draw_id: int = Field(..., description="Draw's ID")
     model_config = ConfigDict(from_attributes=True)
+
+
+class BallotBulkItemResult(BaseModel):
+    """
+    Outcome of a single item of a bulk ballot submission.
+
+    Attributes:
+        index: Position of the item in the submitted batch.
+        id: ID of the created ballot, if it was created.
+        error: Reason the item was rejected, if it was rejected.
+    """
+
+    index: int = Field(..., description="Position in the submitted batch")
+    id: int | None = Field(None, description="Created ballot's ID")
+    error: str | None = Field(None, description="Reason the item was rejected")
+
+
+class BallotBulkResult(BaseModel):
+    """
+    Properties returned for a bulk ballot submission.
+
+    Attributes:
+        created: Number of ballots created.
+        failed: Number of items rejected.
+        items: Per-item outcome, in submission order.
+    """
+
+    created: int = Field(..., description="Number of ballots created")
+    failed: int = Field(..., description="Number of items rejected")
+    items: list[BallotBulkItemResult] = Field(..., description="Per-item outcome")
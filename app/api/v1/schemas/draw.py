@@ -5,6 +5,8 @@ Pydantic models for request validation and response serialization.
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 
+from app.api.v1.schemas.participant import Participant
+
 
 class DrawBase(BaseModel):
     """
@@ -35,3 +37,54 @@ class Draw(DrawBase):
     id: int = Field(..., description="Unique ID")
     draw_date: datetime = Field(..., description="Date of the draw")
     model_config = ConfigDict(from_attributes=True)
+
+
+class DrawResult(BaseModel):
+    """
+    One winner of a draw, returned in API responses.
+
+    Attributes:
+        rank: Position of the winner, from 1 (the grand prize).
+        tier: Name of the prize tier won.
+        participant_id: ID of the winning participant.
+    """
+
+    rank: int = Field(..., description="Position of the winner, from 1")
+    tier: str = Field(..., description="Prize tier won")
+    participant_id: int = Field(..., description="Winner's participant ID")
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DrawHistoryItem(BaseModel):
+    """
+    A past or current draw with its winner and ballot totals.
+
+    Attributes:
+        id: Unique identifier.
+        draw_date: Date of the draw.
+        winner: The grand prize winner, once drawn.
+        ballots: Number of ballots entered into the draw.
+        participants: Number of distinct participants holding ballots.
+    """
+
+    id: int = Field(..., description="Unique ID")
+    draw_date: datetime = Field(..., description="Date of the draw")
+    winner: Participant | None = Field(None, description="Grand prize winner")
+    ballots: int = Field(..., description="Ballots entered")
+    participants: int = Field(..., description="Participants holding ballots")
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DrawOdds(BaseModel):
+    """
+    Ballot totals of the open draw.
+
+    Attributes:
+        draw_id: ID of today's draw.
+        ballots: Number of ballots entered so far.
+        participants: Number of distinct participants holding ballots.
+    """
+
+    draw_id: int = Field(..., description="ID of today's draw")
+    ballots: int = Field(..., description="Ballots entered so far")
+    participants: int = Field(..., description="Participants holding ballots")
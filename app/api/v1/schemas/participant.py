@@ -46,3 +46,37 @@ class ParticipantUpdate(ParticipantBase):
     email: Optional[str] = Field(None, description="Participant email")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ParticipantImportResult(BaseModel):
+    """
+    Properties returned for a participant import.
+
+    Attributes:
+        created: Number of participants created.
+        duplicates: Number of records whose email already exists.
+        invalid: Number of records missing a name or email.
+    """
+
+    created: int = Field(..., description="Number of participants created")
+    duplicates: int = Field(..., description="Records whose email already exists")
+    invalid: int = Field(..., description="Records missing a name or email")
+
+
+class ParticipantOdds(BaseModel):
+    """
+    A participant's chance in the open draw.
+
+    Attributes:
+        participant_id: ID of the participant.
+        draw_id: ID of today's draw.
+        ballots: Number of ballots the participant entered.
+        total_ballots: Number of ballots entered by everyone.
+        chance: Probability of drawing the grand prize, ballots / total_ballots.
+    """
+
+    participant_id: int = Field(..., description="Participant ID")
+    draw_id: int = Field(..., description="ID of today's draw")
+    ballots: int = Field(..., description="Ballots entered by the participant")
+    total_ballots: int = Field(..., description="Ballots entered by everyone")
+    chance: float = Field(..., description="Probability of drawing the grand prize")
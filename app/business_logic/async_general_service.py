@@ -0,0 +1,125 @@
+"""
+General async business-logic layer.
+"""
+
+from typing import List, Any, Generic, Type, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.business_logic.general_service import Item
+from app.business_logic.entity_cache import get_entity_cache
+from app.business_logic.pagination import encode_cursor, decode_cursor
+from app.data_access_layer.async_general_repository import AsyncGeneralRepository
+from app.exceptions import NotFoundError
+
+
+class AsyncGeneralService(Generic[Item]):
+    """
+    Async counterpart of GeneralService, backed by an AsyncGeneralRepository.
+    """
+
+    # Unique column that keyset pagination orders by
+    pagination_key = "id"
+
+    def __init__(self, db: AsyncSession, model=Type[Item]):
+        self.repo = AsyncGeneralRepository(db=db, model=model)
+        self.model = model
+        self.db = db
+        self.cache = get_entity_cache()
+
+    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Item]:
+        return await self.repo.list(skip=skip, limit=limit)
+
+    async def list_page(
+        self, cursor: str | None = None, limit: int = 100
+    ) -> Tuple[List[Item], str | None]:
+        """
+        List a page of items after `cursor` and return it with the cursor of the
+        next page (None on the last page).
+        """
+        key = getattr(self.model, self.pagination_key)
+        after = decode_cursor(cursor, key.type.python_type) if cursor else None
+        items = await self.repo.list_after(key, after=after, limit=limit)
+        next_cursor = None
+        if len(items) == limit:
+            next_cursor = encode_cursor(getattr(items[-1], self.pagination_key))
+        return items, next_cursor
+
+    async def list_all_rows(
+        self, fields: List[str], skip: int = 0, limit: int = 100
+    ) -> List[tuple]:
+        """
+        List the `fields` of items as plain tuples, with offset pagination.
+        """
+        columns = [getattr(self.model, field) for field in fields]
+        return await self.repo.list_rows(columns, skip=skip, limit=limit)
+
+    async def list_page_rows(
+        self, fields: List[str], cursor: str | None = None, limit: int = 100
+    ) -> Tuple[List[tuple], str | None]:
+        """
+        Like `list_page`, but fetch only `fields` as plain tuples. `fields` must
+        include the pagination key.
+        """
+        columns = [getattr(self.model, field) for field in fields]
+        key = getattr(self.model, self.pagination_key)
+        after = decode_cursor(cursor, key.type.python_type) if cursor else None
+        rows = await self.repo.list_rows_after(columns, key, after=after, limit=limit)
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = encode_cursor(rows[-1][fields.index(self.pagination_key)])
+        return rows, next_cursor
+
+    async def get(self, item_id: int) -> Item:
+        if self.cache is not None:
+            row = self.cache.get(self.model, item_id)
+            if row is not None:
+                # load=False attaches the cached state without re-selecting it
+                item = self.cache.detached(self.model, row)
+                return await self.db.merge(item, load=False)
+        item = await self.repo.get(item_id)
+        if not item:
+            raise NotFoundError(f"Item with id {item_id} not found")
+        if self.cache is not None:
+            self.cache.put(item)
+        return item
+
+    async def get_by_attributes(
+        self,
+        attributes: dict[str, Any],
+        limit: int = 10,
+        order_by: str | None = None,
+        descending: bool = False,
+    ) -> List[Item]:
+        if order_by:
+            try:
+                order_by = getattr(self.model, order_by)
+            except AttributeError:
+                raise ValueError(f"Item does not have attribute: {order_by}")
+            order_by = order_by.desc() if descending else order_by.asc()
+        items = await self.repo.find_by(limit=limit, order_by=order_by, **attributes)
+        if not items:
+            raise NotFoundError(f"Items with attributes {attributes} not found")
+        return items
+
+    async def create(self, item_data: dict[str, Any]) -> Item:
+        created = await self.repo.add(**item_data)
+        self._invalidate(created.id)
+        return created
+
+    async def update(self, item_id: int, data: dict[str, Any]) -> Item:
+        updated = await self.repo.update(item_id, data)
+        if not updated:
+            raise NotFoundError(f"Item {item_id} not found")
+        self._invalidate(item_id)
+        return updated
+
+    async def delete(self, item_id: int) -> Item:
+        deleted = await self.repo.delete(item_id)
+        if not deleted:
+            raise NotFoundError(f"Item {item_id} not found")
+        self._invalidate(item_id)
+        return deleted
+
+    def _invalidate(self, item_id: int) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(self.model, item_id)
@@ -2,33 +2,288 @@
 Business-logic layer orchestrating ballot use-cases.
 """
 
-from typing import Any
-from datetime import datetime
+import asyncio
+from typing import Any, AsyncIterator, Iterator
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.business_logic.draw_service import DrawService
+from app.business_logic.async_general_service import AsyncGeneralService
+from app.business_logic.draw_cache import get_current_draw_cache
+from app.business_logic.draw_service import (
+    AsyncDrawService,
+    DrawService,
+    lottery_today,
+)
 from app.business_logic.general_service import GeneralService
-from app.data_access_layer.models import Ballot
+from app.business_logic.group_commit import GroupCommitBuffer
+from app.business_logic.odds_counter import get_current_odds
+from app.config import get_settings
+from app.data_access_layer.async_general_repository import AsyncGeneralRepository
+from app.data_access_layer.general_repository import GeneralRepository
+from app.data_access_layer.models import Ballot, BallotCount, Participant
 from app.exceptions import NotFoundError
 
+# Columns of a ballot written by draw exports, in output order
+EXPORT_FIELDS = ("id", "participant_id", "draw_id", "timestamp")
+
+
+def _odds_of(
+    participant_id: int, draw_id: int, ballots: int, total: int
+) -> dict[str, Any]:
+    """Odds of a participant holding `ballots` of the `total` ballots of a draw."""
+    return {
+        "participant_id": participant_id,
+        "draw_id": draw_id,
+        "ballots": ballots,
+        "total_ballots": total,
+        "chance": ballots / total if total else 0.0,
+    }
+
 
 class BallotService(GeneralService[Ballot]):
     """
     Orchestrates business rules and use-cases for Ballot.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, write_buffer: GroupCommitBuffer | None = None):
         super().__init__(db, Ballot)
+        self.write_buffer = write_buffer
 
-    def create(self, ballot_data: dict[str, Any]) -> Ballot:
+    def current_draw_id(self) -> int:
+        """
+        Return the id of today's draw, which new ballots are entered into.
+        """
+        date = lottery_today()
+        draw_id = get_current_draw_cache().get(date)
+        if draw_id is not None:
+            return draw_id
         draw_service = DrawService(db=self.db)
-        date = datetime.now().date()
         try:
             daily_draw = draw_service.get_by_attributes(attributes={"draw_date": date})
         except NotFoundError:
             raise NotFoundError(
                 f"A lottery with date '{date}' has not been created yet."
             )
-        ballot_data["draw_id"] = daily_draw[0].id
-        return self.repo.add(**ballot_data)
+        get_current_draw_cache().set(date, daily_draw[0].id)
+        return daily_draw[0].id
+
+    def create(self, ballot_data: dict[str, Any]) -> Ballot:
+        ballot_data["draw_id"] = self.current_draw_id()
+        if self.write_buffer is not None:
+            # Blocks until the group commit holding this ballot is durable
+            ballot_id = self.write_buffer.submit(ballot_data).result()
+            self._invalidate(ballot_id)
+            created = Ballot(id=ballot_id, **ballot_data)
+        else:
+            created = super().create(ballot_data)
+        get_current_odds().add(ballot_data["draw_id"], [ballot_data["participant_id"]])
+        return created
+
+    def create_many(self, ballots_data: list[dict[str, Any]]) -> list[int | None]:
+        """
+        Enter many ballots into today's draw in one transaction. Returns their
+        ids in input order, with None for ballots whose participant does not
+        exist; those are left out and the others entered all the same.
+        Participants are looked up with a single IN query.
+        """
+        if not ballots_data:
+            return []
+        draw_id = self.current_draw_id()
+        known = GeneralRepository(self.db, Participant).existing_values(
+            Participant.id, list({data["participant_id"] for data in ballots_data})
+        )
+        entered = [data for data in ballots_data if data["participant_id"] in known]
+        ids = iter(
+            self.repo.add_many(
+                [{**ballot_data, "draw_id": draw_id} for ballot_data in entered]
+            )
+        )
+        get_current_odds().add(draw_id, [data["participant_id"] for data in entered])
+        return [
+            next(ids) if data["participant_id"] in known else None
+            for data in ballots_data
+        ]
+
+    def delete(self, item_id: int) -> Ballot:
+        deleted = super().delete(item_id)
+        get_current_odds().remove(deleted.draw_id, deleted.participant_id)
+        return deleted
+
+    def odds(self) -> dict[str, int]:
+        """
+        Return the number of ballots and participants of today's draw, from the
+        in-process counters.
+        """
+        draw_id = self._counted_draw_id()
+        ballots, participants = get_current_odds().totals()
+        return {"draw_id": draw_id, "ballots": ballots, "participants": participants}
+
+    def participant_odds(self, participant_id: int) -> dict[str, Any]:
+        """
+        Return a participant's ballots in today's draw and their chance of
+        drawing the grand prize, from the in-process counters. A participant
+        without ballots (or unknown) has no chance.
+        """
+        draw_id = self._counted_draw_id()
+        ballots, total = get_current_odds().ballots_of(participant_id)
+        return _odds_of(participant_id, draw_id, ballots, total)
+
+    def refresh_odds(self) -> None:
+        """
+        Reload the odds counters of today's draw from the database, unless
+        another request of this process is already reloading them.
+        """
+        draw_id = self.current_draw_id()
+        odds = get_current_odds()
+        with odds.loading(draw_id) as token:
+            if token is None:
+                return
+            repo = GeneralRepository(self.db, BallotCount)
+            rows = repo.find_rows(
+                [BallotCount.participant_id, BallotCount.ballots], draw_id=draw_id
+            )
+            odds.load(draw_id, dict(rows), token)
+
+    def _counted_draw_id(self) -> int:
+        draw_id = self.current_draw_id()
+        if not get_current_odds().is_loaded(draw_id):
+            self.refresh_odds()
+        return draw_id
+
+    def export_rows(
+        self, draw_id: int, fields: tuple[str, ...] = EXPORT_FIELDS
+    ) -> Iterator[tuple]:
+        """
+        Iterate over the `fields` of every ballot of a draw, in id order, fetching
+        them in batches so memory stays constant however many ballots there are.
+        Raises NotFoundError up front if the draw does not exist.
+
+        The rows are read through a session of their own, closed when the
+        iteration ends: a streamed response outlives the request's session.
+        """
+        DrawService(db=self.db).get(draw_id)
+        return self._export_rows(draw_id, fields)
+
+    def _export_rows(self, draw_id: int, fields: tuple[str, ...]) -> Iterator[tuple]:
+        columns = [getattr(Ballot, field) for field in fields]
+        db = Session(bind=self.db.get_bind())
+        try:
+            yield from GeneralRepository(db, Ballot).stream_rows(
+                columns,
+                order_by=Ballot.id,
+                batch_size=get_settings().export_batch_size,
+                draw_id=draw_id,
+            )
+        finally:
+            db.close()
+
+
+class AsyncBallotService(AsyncGeneralService[Ballot]):
+    """
+    Async counterpart of BallotService.
+    """
+
+    def __init__(self, db: AsyncSession, write_buffer: GroupCommitBuffer | None = None):
+        super().__init__(db, Ballot)
+        self.write_buffer = write_buffer
+
+    async def current_draw_id(self) -> int:
+        """
+        Return the id of today's draw, which new ballots are entered into.
+        """
+        date = lottery_today()
+        draw_id = get_current_draw_cache().get(date)
+        if draw_id is not None:
+            return draw_id
+        draw_service = AsyncDrawService(db=self.db)
+        try:
+            daily_draw = await draw_service.get_by_attributes(
+                attributes={"draw_date": date}
+            )
+        except NotFoundError:
+            raise NotFoundError(
+                f"A lottery with date '{date}' has not been created yet."
+            )
+        get_current_draw_cache().set(date, daily_draw[0].id)
+        return daily_draw[0].id
+
+    async def create(self, ballot_data: dict[str, Any]) -> Ballot:
+        ballot_data["draw_id"] = await self.current_draw_id()
+        if self.write_buffer is not None:
+            future = self.write_buffer.submit(ballot_data)
+            ballot_id = await asyncio.wrap_future(future)
+            self._invalidate(ballot_id)
+            created = Ballot(id=ballot_id, **ballot_data)
+        else:
+            created = await super().create(ballot_data)
+        get_current_odds().add(ballot_data["draw_id"], [ballot_data["participant_id"]])
+        return created
+
+    async def delete(self, item_id: int) -> Ballot:
+        deleted = await super().delete(item_id)
+        get_current_odds().remove(deleted.draw_id, deleted.participant_id)
+        return deleted
+
+    async def odds(self) -> dict[str, int]:
+        """
+        Async counterpart of `BallotService.odds`.
+        """
+        draw_id = await self._counted_draw_id()
+        ballots, participants = get_current_odds().totals()
+        return {"draw_id": draw_id, "ballots": ballots, "participants": participants}
+
+    async def participant_odds(self, participant_id: int) -> dict[str, Any]:
+        """
+        Async counterpart of `BallotService.participant_odds`.
+        """
+        draw_id = await self._counted_draw_id()
+        ballots, total = get_current_odds().ballots_of(participant_id)
+        return _odds_of(participant_id, draw_id, ballots, total)
+
+    async def refresh_odds(self) -> None:
+        """
+        Async counterpart of `BallotService.refresh_odds`.
+        """
+        draw_id = await self.current_draw_id()
+        odds = get_current_odds()
+        with odds.loading(draw_id) as token:
+            if token is None:
+                return
+            repo = AsyncGeneralRepository(self.db, BallotCount)
+            rows = await repo.find_rows(
+                [BallotCount.participant_id, BallotCount.ballots], draw_id=draw_id
+            )
+            odds.load(draw_id, dict(rows), token)
+
+    async def _counted_draw_id(self) -> int:
+        draw_id = await self.current_draw_id()
+        if not get_current_odds().is_loaded(draw_id):
+            await self.refresh_odds()
+        return draw_id
+
+    async def export_rows(
+        self, draw_id: int, fields: tuple[str, ...] = EXPORT_FIELDS
+    ) -> AsyncIterator[tuple]:
+        """
+        Async counterpart of `BallotService.export_rows`.
+        """
+        await AsyncDrawService(db=self.db).get(draw_id)
+        return self._export_rows(draw_id, fields)
+
+    async def _export_rows(
+        self, draw_id: int, fields: tuple[str, ...]
+    ) -> AsyncIterator[tuple]:
+        columns = [getattr(Ballot, field) for field in fields]
+        db = AsyncSession(bind=self.db.bind)
+        try:
+            rows = AsyncGeneralRepository(db, Ballot).stream_rows(
+                columns,
+                order_by=Ballot.id,
+                batch_size=get_settings().export_batch_size,
+                draw_id=draw_id,
+            )
+            async for row in rows:
+                yield row
+        finally:
+            await db.close()
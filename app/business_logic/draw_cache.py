@@ -0,0 +1,53 @@
+"""
+Process-local cache of the draw that new ballots are entered into.
+"""
+
+import threading
+import time
+from datetime import date
+from functools import lru_cache
+
+from app.config import get_settings
+
+
+class CurrentDrawCache:
+    """
+    Remembers the id of the draw held on a given date.
+
+    A lookup for any other date is a miss, so the entry expires by itself at
+    midnight. Entries also expire after `ttl` seconds, which bounds how long a
+    draw deleted by another worker process can still be served.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entry: tuple[date, int, float] | None = None
+
+    def get(self, draw_date: date) -> int | None:
+        """Return the cached draw id for `draw_date`, or None on a miss."""
+        entry = self._entry
+        if entry is None:
+            return None
+        cached_date, draw_id, expires_at = entry
+        if cached_date != draw_date or time.monotonic() >= expires_at:
+            return None
+        return draw_id
+
+    def set(self, draw_date: date, draw_id: int) -> None:
+        """Cache `draw_id` as the draw held on `draw_date`."""
+        with self._lock:
+            self._entry = (draw_date, draw_id, time.monotonic() + self.ttl)
+
+    def invalidate(self) -> None:
+        """Drop the cached draw."""
+        with self._lock:
+            self._entry = None
+
+
+@lru_cache
+def get_current_draw_cache() -> CurrentDrawCache:
+    """
+    Return the process-wide cache of the current draw.
+    """
+    return CurrentDrawCache(ttl=get_settings().draw_cache_ttl_seconds)
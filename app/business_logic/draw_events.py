@@ -0,0 +1,175 @@
+"""
+In-process fan-out of draw results to subscribed clients.
+
+The job that draws the winner publishes the result once; every client holding
+a subscription open gets it from memory, so delivering a result costs one
+database write and a socket write per client rather than a query per client.
+"""
+
+import asyncio
+import json
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncIterator, List
+
+from app.config import get_settings
+from app.data_access_layer.models import Draw, DrawResult
+from app.metrics import Counter, registry
+
+draw_events_dropped = registry.register(
+    Counter(
+        "draw_events_dropped_total",
+        "Draw events dropped because a subscriber's queue was full.",
+    )
+)
+
+
+@dataclass(frozen=True)
+class DrawEvent:
+    """A draw result, encoded once as JSON for every subscriber."""
+
+    id: int
+    data: str
+
+
+def draw_event(draw: Draw, results: List[DrawResult]) -> DrawEvent:
+    """Build the event announcing the winners of `draw`."""
+    data = {
+        "id": draw.id,
+        "draw_date": draw.draw_date.isoformat(),
+        "winner_id": draw.winner_id,
+        "results": [
+            {
+                "rank": result.rank,
+                "tier": result.tier,
+                "participant_id": result.participant_id,
+            }
+            for result in results
+        ],
+    }
+    return DrawEvent(id=draw.id, data=json.dumps(data, separators=(",", ":")))
+
+
+class Subscription:
+    """
+    One client's queue of events, holding at most `max_queued` of them; when
+    it is full the oldest is dropped. Created and consumed on an event loop,
+    fed from any thread.
+    """
+
+    def __init__(self, broker: "DrawEventBroker", max_queued: int):
+        self.broker = broker
+        self.loop = asyncio.get_running_loop()
+        # One slot more than events, so the end of stream always fits
+        self._queue: asyncio.Queue[DrawEvent | None] = asyncio.Queue(max_queued + 1)
+        self._max_queued = max_queued
+
+    def offer(self, event: DrawEvent | None) -> None:
+        """Queue `event` (None ends the stream). Must run on the loop."""
+        if event is not None and self._queue.qsize() >= self._max_queued:
+            self._queue.get_nowait()
+            draw_events_dropped.inc()
+        self._queue.put_nowait(event)
+
+    async def events(
+        self, keepalive: float | None = None
+    ) -> AsyncIterator[DrawEvent | None]:
+        """
+        Yield events until the broker ends the stream. With `keepalive`, None
+        is yielded after that many idle seconds so callers can ping the client.
+        """
+        while True:
+            try:
+                event = await asyncio.wait_for(self._queue.get(), keepalive)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if event is None:
+                return
+            yield event
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self.broker.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class DrawEventBroker:
+    """
+    Publishes draw events to every open subscription of this process.
+
+    The latest event is retained and sent to new subscribers that have not
+    seen it, so a client connecting just after midnight still gets the
+    result. Events are identified by draw id; republishing one is a no-op.
+    """
+
+    def __init__(self, max_queued: int):
+        self.max_queued = max_queued
+        self.latest: DrawEvent | None = None
+        self._lock = threading.Lock()
+        self._subscriptions: set[Subscription] = set()
+
+    def subscribe(self, last_event_id: int | None = None) -> Subscription:
+        """
+        Open a subscription on the running event loop. The latest event is
+        queued first unless the client already saw it (`last_event_id`).
+        """
+        subscription = Subscription(self, self.max_queued)
+        with self._lock:
+            latest = self.latest
+            self._subscriptions.add(subscription)
+        if latest is not None and (last_event_id is None or latest.id > last_event_id):
+            subscription.offer(latest)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+
+    def publish(self, event: DrawEvent) -> bool:
+        """
+        Send `event` to every subscriber, from any thread. Returns False if
+        it was already published.
+        """
+        with self._lock:
+            if self.latest is not None and event.id <= self.latest.id:
+                return False
+            self.latest = event
+            subscriptions = list(self._subscriptions)
+        self._fan_out(subscriptions, event)
+        return True
+
+    def close_all(self) -> None:
+        """End every open subscription, e.g. on shutdown."""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+            self._subscriptions.clear()
+        self._fan_out(subscriptions, None)
+
+    def _fan_out(
+        self, subscriptions: List[Subscription], event: DrawEvent | None
+    ) -> None:
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # The subscriber's event loop is closed
+                self.unsubscribe(subscription)
+
+
+@lru_cache
+def get_draw_events() -> DrawEventBroker:
+    """
+    Return the process-wide broker of draw events.
+    """
+    return DrawEventBroker(max_queued=get_settings().draw_events_queue_size)
@@ -2,14 +2,39 @@
 Business-logic layer orchestrating draw use-cases.
 """
 
-from typing import Any
-from datetime import datetime
+from typing import Any, List, Tuple
+from datetime import datetime, date, timedelta
+from zoneinfo import ZoneInfo
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 
+from app.business_logic.async_general_service import AsyncGeneralService
+from app.business_logic.draw_cache import get_current_draw_cache
 from app.business_logic.general_service import GeneralService
-from app.data_access_layer.models import Draw
-from app.exceptions import ValidationError
+from app.business_logic.pagination import decode_cursor, encode_cursor
+from app.business_logic.winner_selector import WinnerSelector, get_winner_selector
+from app.config import get_settings
+from app.data_access_layer.async_general_repository import AsyncGeneralRepository
+from app.data_access_layer.general_repository import GeneralRepository
+from app.data_access_layer.models import Draw, Ballot, BallotCount, DrawResult
+from app.exceptions import NotFoundError, ValidationError
+
+
+def lottery_today(now: datetime | None = None) -> date:
+    """
+    Today's date in LOTTERY_TIMEZONE: the date of the open draw, which new
+    ballots are entered into. `now` (aware) defaults to the current time.
+    """
+    zone = ZoneInfo(get_settings().lottery_timezone)
+    return (now.astimezone(zone) if now else datetime.now(zone)).date()
+
+
+def closed_draw_date(now: datetime | None = None) -> date:
+    """Date of the draw closed by the last midnight."""
+    return lottery_today(now) - timedelta(days=1)
 
 
 class DrawService(GeneralService[Draw]):
@@ -17,14 +42,226 @@ class DrawService(GeneralService[Draw]):
     Orchestrates business rules and use-cases for Draw.
     """
 
-    def __init__(self, db: Session):
+    # Draws are paged by date, which is unique
+    pagination_key = "draw_date"
+
+    def __init__(self, db: Session, selector: WinnerSelector | None = None):
         super().__init__(db, Draw)
+        self.selector = selector
+        self.results_repo = GeneralRepository(db, DrawResult)
 
     def create(self, draw_data: dict[str, Any]) -> Draw:
         # Business rule: One draw per day
-        draw_data["draw_date"] = datetime.now().date()
+        draw_data["draw_date"] = lottery_today()
         if self.repo.find_by(draw_date=draw_data["draw_date"]):
             raise ValidationError(
                 f"A draw with date '{draw_data["draw_date"]}' already exists."
             )
-        return self.repo.add(**draw_data)
+        draw = super().create(draw_data)
+        get_current_draw_cache().set(draw.draw_date, draw.id)
+        return draw
+
+    def delete(self, item_id: int) -> Draw:
+        deleted = super().delete(item_id)
+        get_current_draw_cache().invalidate()
+        return deleted
+
+    def open_upcoming(self, days: int) -> int:
+        """
+        Create the missing draws of today and the `days` days after it, so the
+        next draw is open before its day starts and midnight switches ballots
+        over without a gap. Returns the number of draws created; none are if
+        another process creates them at the same time.
+        """
+        today = lottery_today()
+        dates = [today + timedelta(days=offset) for offset in range(days + 1)]
+        existing = self.repo.existing_values(Draw.draw_date, dates)
+        missing = [{"draw_date": day} for day in dates if day not in existing]
+        try:
+            self.repo.add_many(missing)
+        except IntegrityError:
+            self.db.rollback()
+            return 0
+        return len(missing)
+
+    def last_drawn(self) -> Draw:
+        """
+        Return the draw closed by the last midnight, once its winners are
+        drawn. Winners are drawn by the midnight job, never by a request.
+        """
+        draw_date = closed_draw_date()
+        draw = self.get_by_attributes(attributes={"draw_date": draw_date})[0]
+        if draw.winner_id is None:
+            raise NotFoundError(f"The draw of '{draw_date}' has not been drawn yet.")
+        return draw
+
+    def draw_winner(self, draw_date: date) -> Draw:
+        """
+        Pick the winners of the draw held on `draw_date`, one distinct participant
+        per prize of DRAW_PRIZE_TIERS, unless it already has them. The grand prize
+        winner is the draw's `winner_id`.
+        """
+        draw = self.get_by_attributes(attributes={"draw_date": draw_date})[0]
+        if draw.winner_id is not None:
+            return draw
+        # Results left by an interrupted run are kept rather than redrawn
+        results = self.results(draw.id) or self._draw_results(draw.id)
+        winner_id = results[0].participant_id
+        return self.update(item_id=draw.id, data={"winner_id": winner_id})
+
+    def results(self, draw_id: int) -> List[DrawResult]:
+        """
+        Return the winners of a draw by rank; empty until it has been drawn.
+        """
+        return self.results_repo.find_by(
+            limit=None, order_by=DrawResult.rank, draw_id=draw_id
+        )
+
+    def history(
+        self,
+        from_date: date | None = None,
+        to_date: date | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> Tuple[List[dict[str, Any]], str | None]:
+        """
+        List draws dated `from_date` to `to_date` (inclusive), by date, with
+        their winner and ballot totals, and the cursor of the next page.
+        A page costs two queries however many draws it holds: the draws
+        joined with their winners, and the totals from ballot_counts.
+        """
+        after = decode_cursor(cursor, date) if cursor else None
+        draws = self.repo.list_range(
+            Draw.draw_date,
+            low=from_date,
+            high=to_date,
+            after=after,
+            limit=limit,
+            options=[joinedload(Draw.winner)],
+        )
+        totals = GeneralRepository(self.db, BallotCount).group_totals(
+            BallotCount.draw_id,
+            [draw.id for draw in draws],
+            func.sum(BallotCount.ballots),
+            func.count(),
+        )
+        items = []
+        for draw in draws:
+            ballots, participants = totals.get(draw.id, (0, 0))
+            items.append(
+                {
+                    "id": draw.id,
+                    "draw_date": draw.draw_date,
+                    "winner": draw.winner,
+                    "ballots": ballots,
+                    "participants": participants,
+                }
+            )
+        next_cursor = None
+        if len(draws) == limit:
+            next_cursor = encode_cursor(draws[-1].draw_date)
+        return items, next_cursor
+
+    def _draw_results(self, draw_id: int) -> List[DrawResult]:
+        prizes = [
+            tier
+            for tier, winners in get_settings().draw_prize_tiers.items()
+            for _ in range(winners)
+        ]
+        selector = self.selector or get_winner_selector(get_settings().winner_selector)
+        winner_ids = selector.sample(
+            GeneralRepository(self.db, Ballot), draw_id, len(prizes)
+        )
+        if not winner_ids:
+            raise NotFoundError(f"Draw {draw_id} has no ballots")
+        try:
+            self.results_repo.add_many(
+                [
+                    {
+                        "draw_id": draw_id,
+                        "rank": rank,
+                        "tier": tier,
+                        "participant_id": participant_id,
+                    }
+                    for rank, (tier, participant_id) in enumerate(
+                        zip(prizes, winner_ids), start=1
+                    )
+                ]
+            )
+        except IntegrityError:
+            # Another process drew the same draw first; its results stand
+            self.db.rollback()
+        return self.results(draw_id)
+
+
+class AsyncDrawService(AsyncGeneralService[Draw]):
+    """
+    Async counterpart of DrawService.
+    """
+
+    # Draws are paged by date, which is unique
+    pagination_key = "draw_date"
+
+    def __init__(self, db: AsyncSession, selector: WinnerSelector | None = None):
+        super().__init__(db, Draw)
+        self.selector = selector
+        self.results_repo = AsyncGeneralRepository(db, DrawResult)
+
+    async def create(self, draw_data: dict[str, Any]) -> Draw:
+        # Business rule: One draw per day
+        draw_data["draw_date"] = lottery_today()
+        if await self.repo.find_by(draw_date=draw_data["draw_date"]):
+            raise ValidationError(
+                f"A draw with date '{draw_data["draw_date"]}' already exists."
+            )
+        draw = await super().create(draw_data)
+        get_current_draw_cache().set(draw.draw_date, draw.id)
+        return draw
+
+    async def delete(self, item_id: int) -> Draw:
+        deleted = await super().delete(item_id)
+        get_current_draw_cache().invalidate()
+        return deleted
+
+    async def last_drawn(self) -> Draw:
+        """
+        Async counterpart of `DrawService.last_drawn`.
+        """
+        draw_date = closed_draw_date()
+        draw = (await self.get_by_attributes(attributes={"draw_date": draw_date}))[0]
+        if draw.winner_id is None:
+            raise NotFoundError(f"The draw of '{draw_date}' has not been drawn yet.")
+        return draw
+
+    async def draw_winner(self, draw_date: date) -> Draw:
+        """
+        Async counterpart of `DrawService.draw_winner`. Runs the sync selection
+        on the session's connection in a greenlet.
+        """
+        return await self.db.run_sync(
+            lambda session: DrawService(session, self.selector).draw_winner(draw_date)
+        )
+
+    async def history(
+        self,
+        from_date: date | None = None,
+        to_date: date | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> Tuple[List[dict[str, Any]], str | None]:
+        """
+        List draws with their winner and ballot totals, like DrawService.history.
+        """
+        return await self.db.run_sync(
+            lambda session: DrawService(session).history(
+                from_date, to_date, cursor=cursor, limit=limit
+            )
+        )
+
+    async def results(self, draw_id: int) -> List[DrawResult]:
+        """
+        Return the winners of a draw by rank; empty until it has been drawn.
+        """
+        return await self.results_repo.find_by(
+            limit=None, order_by=DrawResult.rank, draw_id=draw_id
+        )
@@ -0,0 +1,178 @@
+"""
+Read-through cache of entities fetched by id.
+
+Entries hold an entity's column values rather than ORM objects, so a backend may
+live outside the process. On a hit the service attaches the entity to its
+session without querying the database.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Type
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.config import get_settings
+from app.data_access_layer.database import Base
+from app.metrics import Counter, registry
+
+entity_cache_lookups = registry.register(
+    Counter(
+        "entity_cache_lookups_total",
+        "Entity cache lookups by entity and result.",
+        ("entity", "result"),
+    )
+)
+
+
+class CacheBackend(ABC):
+    """
+    Key-value store behind the entity cache. Values are dicts of column values;
+    backends shared between processes serialize them as they see fit.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the value stored under `key`, or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store `value` under `key`."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Drop `key` if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters, if the backend keeps any."""
+        return {}
+
+
+class LocalCacheBackend(CacheBackend):
+    """
+    In-process LRU cache holding at most `max_entries` entries, each for at most
+    `ttl` seconds.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
+
+
+# Name -> backend class, selected with the ENTITY_CACHE_BACKEND setting
+CACHE_BACKENDS: dict[str, Type[CacheBackend]] = {
+    "local": LocalCacheBackend,
+}
+
+
+class EntityCache:
+    """
+    Caches entities of any model by primary key on top of a CacheBackend.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+
+    @staticmethod
+    def key(model: Type[Base], identifier: Any) -> str:
+        return f"{model.__tablename__}:{identifier}"
+
+    def get(self, model: Type[Base], identifier: Any) -> dict[str, Any] | None:
+        """Return the cached column values of an entity, or None on a miss."""
+        row = self.backend.get(self.key(model, identifier))
+        entity_cache_lookups.inc(model.__name__, "miss" if row is None else "hit")
+        return row
+
+    @staticmethod
+    def detached(model: Type[Base], row: dict[str, Any]) -> Base:
+        """
+        Build a detached entity from cached column values, ready to be merged
+        into a session with load=False (no SELECT).
+        """
+        entity = model(**row)
+        make_transient_to_detached(entity)
+        return entity
+
+    def put(self, entity: Base) -> None:
+        """Cache the column values of a loaded entity."""
+        mapper = inspect(entity).mapper
+        row = {attr.key: getattr(entity, attr.key) for attr in mapper.column_attrs}
+        self.backend.set(self.key(type(entity), inspect(entity).identity[0]), row)
+
+    def invalidate(self, model: Type[Base], identifier: Any) -> None:
+        """Drop the entry of an entity that was created, changed or deleted."""
+        self.backend.delete(self.key(model, identifier))
+
+    def stats(self) -> dict[str, int]:
+        return self.backend.stats()
+
+
+@lru_cache
+def get_entity_cache() -> EntityCache | None:
+    """
+    Return the process-wide entity cache, or None when it is disabled.
+    """
+    settings = get_settings()
+    if not settings.entity_cache_enabled:
+        return None
+    try:
+        backend_class = CACHE_BACKENDS[settings.entity_cache_backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown entity cache backend: {settings.entity_cache_backend}"
+        )
+    backend = backend_class(
+        max_entries=settings.entity_cache_max_entries,
+        ttl=settings.entity_cache_ttl_seconds,
+    )
+    return EntityCache(backend)
@@ -2,10 +2,12 @@
 General business-logic layer.
 """
 
-from typing import List, Any, TypeVar, Generic, Type
+from typing import List, Any, TypeVar, Generic, Type, Tuple
 from sqlalchemy.orm import Session
 
 from app.data_access_layer.database import Base
+from app.business_logic.entity_cache import get_entity_cache
+from app.business_logic.pagination import encode_cursor, decode_cursor
 from app.data_access_layer.general_repository import GeneralRepository
 from app.exceptions import NotFoundError
 
@@ -19,18 +21,70 @@ class GeneralService(Generic[Item]):
     Provides methods for listing, retrieving, creating, updating, and deleting model instances.
     """
 
+    # Unique column that keyset pagination orders by
+    pagination_key = "id"
+
     def __init__(self, db: Session, model=Type[Item]):
         self.repo = GeneralRepository(db=db, model=model)
         self.model = model
         self.db = db
+        self.cache = get_entity_cache()
 
     def list_all(self, skip: int = 0, limit: int = 100) -> List[Item]:
         return self.repo.list(skip=skip, limit=limit)
 
+    def list_page(
+        self, cursor: str | None = None, limit: int = 100
+    ) -> Tuple[List[Item], str | None]:
+        """
+        List a page of items after `cursor` and return it with the cursor of the
+        next page (None on the last page).
+        """
+        key = getattr(self.model, self.pagination_key)
+        after = decode_cursor(cursor, key.type.python_type) if cursor else None
+        items = self.repo.list_after(key, after=after, limit=limit)
+        next_cursor = None
+        if len(items) == limit:
+            next_cursor = encode_cursor(getattr(items[-1], self.pagination_key))
+        return items, next_cursor
+
+    def list_all_rows(
+        self, fields: List[str], skip: int = 0, limit: int = 100
+    ) -> List[tuple]:
+        """
+        List the `fields` of items as plain tuples, with offset pagination.
+        """
+        columns = [getattr(self.model, field) for field in fields]
+        return self.repo.list_rows(columns, skip=skip, limit=limit)
+
+    def list_page_rows(
+        self, fields: List[str], cursor: str | None = None, limit: int = 100
+    ) -> Tuple[List[tuple], str | None]:
+        """
+        Like `list_page`, but fetch only `fields` as plain tuples. `fields` must
+        include the pagination key.
+        """
+        columns = [getattr(self.model, field) for field in fields]
+        key = getattr(self.model, self.pagination_key)
+        after = decode_cursor(cursor, key.type.python_type) if cursor else None
+        rows = self.repo.list_rows_after(columns, key, after=after, limit=limit)
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = encode_cursor(rows[-1][fields.index(self.pagination_key)])
+        return rows, next_cursor
+
     def get(self, item_id: int) -> Item:
+        if self.cache is not None:
+            row = self.cache.get(self.model, item_id)
+            if row is not None:
+                # load=False attaches the cached state without re-selecting it
+                item = self.cache.detached(self.model, row)
+                return self.db.merge(item, load=False)
         item = self.repo.get(item_id)
         if not item:
             raise NotFoundError(f"Item with id {item_id} not found")
+        if self.cache is not None:
+            self.cache.put(item)
         return item
 
     def get_by_attributes(
@@ -52,16 +106,24 @@ class GeneralService(Generic[Item]):
         return items
 
     def create(self, item_data: dict[str, Any]) -> Item:
-        return self.repo.add(**item_data)
+        created = self.repo.add(**item_data)
+        self._invalidate(created.id)
+        return created
 
     def update(self, item_id: int, data: dict[str, Any]) -> Item:
         updated = self.repo.update(item_id, data)
         if not updated:
             raise NotFoundError(f"Item {item_id} not found")
+        self._invalidate(item_id)
         return updated
 
     def delete(self, item_id: int) -> Item:
         deleted = self.repo.delete(item_id)
         if not deleted:
             raise NotFoundError(f"Item {item_id} not found")
+        self._invalidate(item_id)
         return deleted
+
+    def _invalidate(self, item_id: int) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(self.model, item_id)
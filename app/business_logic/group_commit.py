@@ -0,0 +1,136 @@
+"""
+Group commit: many callers' inserts flushed by one writer in one transaction.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, Callable, Type
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.data_access_layer.database import Base, get_sessionmaker
+from app.data_access_layer.general_repository import GeneralRepository
+from app.data_access_layer.models import Ballot
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class GroupCommitBuffer:
+    """
+    Queues rows from concurrent callers and inserts them with a single writer
+    thread, one transaction per flush.
+
+    A flush happens once `max_rows` rows are queued or `interval` seconds after
+    the first queued row, whichever comes first. `submit` returns a Future that
+    resolves to the row's id only after the flush holding it has committed, so
+    callers keep the durability of a per-row commit.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        model: Type[Base],
+        max_rows: int = 500,
+        interval: float = 0.005,
+    ):
+        self.session_factory = session_factory
+        self.model = model
+        self.max_rows = max_rows
+        self.interval = interval
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, row: dict[str, Any]) -> Future:
+        """Queue `row` for insertion; the Future resolves to its id."""
+        self.start()
+        future: Future = Future()
+        self._queue.put((row, future))
+        return future
+
+    def start(self) -> None:
+        """Start the writer thread if it is not running."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="group-commit-writer", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self) -> None:
+        """Flush queued rows and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.interval
+            while len(batch) < self.max_rows:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+
+    def _flush(self, batch: list[tuple[dict[str, Any], Future]]) -> None:
+        db = self.session_factory()
+        try:
+            repo = GeneralRepository(db, self.model)
+            try:
+                ids = repo.add_many([row for row, _ in batch])
+            except Exception:
+                db.rollback()
+                # Retry one by one so a bad row only fails its own caller
+                logger.warning("Group commit of %d rows failed, retrying", len(batch))
+                for row, future in batch:
+                    try:
+                        future.set_result(repo.add_many([row])[0])
+                    except Exception as exc:
+                        db.rollback()
+                        future.set_exception(exc)
+            else:
+                for (_, future), row_id in zip(batch, ids):
+                    future.set_result(row_id)
+        finally:
+            db.close()
+
+
+@lru_cache
+def get_ballot_write_buffer() -> GroupCommitBuffer | None:
+    """
+    Return the process-wide ballot write buffer, or None when group commit is off.
+    """
+    settings = get_settings()
+    if not settings.ballot_group_commit:
+        return None
+    buffer = GroupCommitBuffer(
+        get_sessionmaker(),
+        Ballot,
+        max_rows=settings.ballot_flush_max_rows,
+        interval=settings.ballot_flush_interval_ms / 1000,
+    )
+    atexit.register(buffer.stop)
+    return buffer
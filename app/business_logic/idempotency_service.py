@@ -0,0 +1,164 @@
+"""
+Business-logic layer for idempotency keys: replays the stored response of a
+request retried with the same Idempotency-Key instead of executing it again.
+
+Claiming a key, running the request and recording its response are separate
+commits. A worker that dies in between leaves the claim in progress: retries
+get a conflict until the claim's lease lapses, then the next retry takes the
+key over and runs the request again. If the worker died after the request's
+own commit, that runs it twice.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any, Callable, NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.clock import utcnow
+from app.config import get_settings
+from app.data_access_layer.idempotency_repository import (
+    AsyncIdempotencyRepository,
+    IdempotencyRepository,
+)
+from app.data_access_layer.models import IdempotencyKey
+from app.exceptions import ConflictError, ValidationError
+
+
+class StoredResponse(NamedTuple):
+    """Response recorded for an idempotency key."""
+
+    status_code: int
+    body: Any
+
+
+def fingerprint(payload: Any) -> str:
+    """Hash of a JSON-compatible request payload, independent of key order."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def stored_response(
+    record: IdempotencyKey | None, payload_fingerprint: str
+) -> StoredResponse | None:
+    """
+    Return the response to replay for the record holding a key, or None if the
+    key was free. Raises if the key is reused for another request or is still
+    in progress.
+    """
+    if record is None:
+        return None
+    if record.fingerprint != payload_fingerprint:
+        raise ValidationError(
+            "Idempotency-Key was already used with a different request"
+        )
+    if record.status_code is None:
+        raise ConflictError("A request with this Idempotency-Key is in progress")
+    return StoredResponse(record.status_code, json.loads(record.response))
+
+
+def _lifetimes(ttl: float | None, lease: float | None) -> tuple[timedelta, timedelta]:
+    """Key TTL and claim lease, defaulting to the settings."""
+    settings = get_settings()
+    if ttl is None:
+        ttl = settings.idempotency_key_ttl_seconds
+    if lease is None:
+        lease = settings.idempotency_lease_seconds
+    return timedelta(seconds=ttl), timedelta(seconds=lease)
+
+
+class IdempotencyService:
+    """
+    Records the response of each request carrying an idempotency key for
+    `ttl` seconds (IDEMPOTENCY_KEY_TTL_SECONDS by default). A request holds its
+    key for `lease` seconds (IDEMPOTENCY_LEASE_SECONDS) while it runs; a key
+    still in progress after that belongs to a dead worker and a retry takes it.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        ttl: float | None = None,
+        clock: Callable[[], datetime] = utcnow,
+        lease: float | None = None,
+    ):
+        self.db = db
+        self.repo = IdempotencyRepository(db)
+        self.ttl, self.lease = _lifetimes(ttl, lease)
+        self.clock = clock
+
+    def begin(self, scope: str, key: str, payload: Any) -> StoredResponse | None:
+        """
+        Claim `key` for a request to `scope` with `payload`. Returns None if the
+        request should run, or the response to replay if it already ran.
+        """
+        now = self.clock()
+        payload_fingerprint = fingerprint(payload)
+        record = self.repo.claim(
+            scope,
+            key,
+            payload_fingerprint,
+            now=now,
+            expired_before=now - self.ttl,
+            stale_before=now - self.lease,
+        )
+        return stored_response(record, payload_fingerprint)
+
+    def complete(self, scope: str, key: str, status_code: int, body: Any) -> None:
+        """Record the response of a request that ran under `key`."""
+        self.repo.complete(scope, key, status_code, json.dumps(body))
+
+    def abandon(self, scope: str, key: str) -> None:
+        """Free `key` after its request failed, so a retry runs again."""
+        self.db.rollback()
+        self.repo.release(scope, key)
+
+    def purge_expired(self) -> int:
+        """Delete the keys older than the TTL and return how many there were."""
+        return self.repo.purge(before=self.clock() - self.ttl)
+
+
+class AsyncIdempotencyService:
+    """
+    Async counterpart of IdempotencyService.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        ttl: float | None = None,
+        clock: Callable[[], datetime] = utcnow,
+        lease: float | None = None,
+    ):
+        self.db = db
+        self.repo = AsyncIdempotencyRepository(db)
+        self.ttl, self.lease = _lifetimes(ttl, lease)
+        self.clock = clock
+
+    async def begin(self, scope: str, key: str, payload: Any) -> StoredResponse | None:
+        """
+        Claim `key` for a request to `scope` with `payload`. Returns None if the
+        request should run, or the response to replay if it already ran.
+        """
+        now = self.clock()
+        payload_fingerprint = fingerprint(payload)
+        record = await self.repo.claim(
+            scope,
+            key,
+            payload_fingerprint,
+            now=now,
+            expired_before=now - self.ttl,
+            stale_before=now - self.lease,
+        )
+        return stored_response(record, payload_fingerprint)
+
+    async def complete(self, scope: str, key: str, status_code: int, body: Any) -> None:
+        """Record the response of a request that ran under `key`."""
+        await self.repo.complete(scope, key, status_code, json.dumps(body))
+
+    async def abandon(self, scope: str, key: str) -> None:
+        """Free `key` after its request failed, so a retry runs again."""
+        await self.db.rollback()
+        await self.repo.release(scope, key)
@@ -0,0 +1,99 @@
+"""
+Leader election over a database lease, so one process runs the scheduled jobs.
+"""
+
+import functools
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.clock import utcnow
+from app.data_access_layer.lease_repository import LeaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLease:
+    """
+    Elects one leader among any number of processes sharing a database.
+
+    Each process calls `acquire` as a heartbeat every `ttl / 3` seconds. The
+    leader renews its lease; the others take it over once it has lapsed, i.e. at
+    most `ttl` seconds after the leader died. Process clocks must agree to well
+    within `ttl`.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        name: str,
+        ttl: float = 30.0,
+        holder: str | None = None,
+        clock: Callable[[], datetime] = utcnow,
+    ):
+        self.session_factory = session_factory
+        self.name = name
+        self.ttl = timedelta(seconds=ttl)
+        self.holder = (
+            holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self.clock = clock
+        self.is_leader = False
+
+    def acquire(self) -> bool:
+        """
+        Claim or renew the lease; return whether this process is the leader.
+        """
+        now = self.clock()
+        db = self.session_factory()
+        try:
+            leader = LeaseRepository(db).claim(
+                self.name, self.holder, now, now + self.ttl
+            )
+        except Exception:
+            # A leader that cannot renew must assume it lost the lease
+            logger.exception("Could not claim lease %r", self.name)
+            leader = False
+        finally:
+            db.close()
+        if leader != self.is_leader:
+            logger.info(
+                "%s %s lease %r",
+                self.holder,
+                "acquired" if leader else "lost",
+                self.name,
+            )
+        self.is_leader = leader
+        return leader
+
+    def release(self) -> None:
+        """Give up the lease so another process can take over right away."""
+        if not self.is_leader:
+            return
+        db = self.session_factory()
+        try:
+            LeaseRepository(db).release(self.name, self.holder)
+        finally:
+            db.close()
+        self.is_leader = False
+
+    def only_leader(self, job: Callable) -> Callable:
+        """
+        Wrap `job` so it runs only in the process holding the lease. The lease
+        is claimed again when the job fires, so a lapsed leader is replaced on
+        the spot instead of after the next heartbeat.
+        """
+
+        @functools.wraps(job)
+        def wrapper(*args, **kwargs):
+            if not self.acquire():
+                logger.debug("Skipping %s: not the leader", job.__name__)
+                return None
+            return job(*args, **kwargs)
+
+        return wrapper
@@ -0,0 +1,135 @@
+"""
+Process-local ballot counters of the open draw, behind the live odds endpoints.
+"""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterable, Iterator, Mapping
+
+from app.config import get_settings
+
+
+class OddsCounter:
+    """
+    Holds the total number of ballots of one draw and the number per
+    participant, so odds are answered without querying the database.
+
+    The counters are loaded from `ballot_counts` and then kept up to date by
+    the ballots this process enters and deletes. Ballots written by other
+    worker processes are only seen on the next load, which happens when the
+    draw changes or the counters are older than `ttl` seconds.
+
+    A load runs inside `loading`: ballots counted while its query runs are
+    applied on top of the loaded counts, so none written after the query
+    are lost. One written just before it may be counted twice until the
+    next load. Only one load of a draw runs at a time; the counters being
+    reloaded are served meanwhile.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._draw_id: int | None = None
+        self._expires_at = 0.0
+        self._total = 0
+        self._counts: Counter[int] = Counter()
+        # Ballot changes seen since each load under way began, by token
+        self._loads: dict[int, tuple[int, Counter[int]]] = {}
+        self._next_token = 0
+
+    def is_loaded(self, draw_id: int) -> bool:
+        """Whether the counters hold current totals of draw `draw_id`."""
+        return self._draw_id == draw_id and time.monotonic() < self._expires_at
+
+    @contextmanager
+    def loading(self, draw_id: int) -> Iterator[int | None]:
+        """
+        Start a load of draw `draw_id`, yielding the token to pass to `load`
+        after querying the counts. Yields None, and no query should run, when
+        another load of that draw is under way and its counters are held.
+        """
+        with self._lock:
+            busy = self._draw_id == draw_id and any(
+                loading == draw_id for loading, _ in self._loads.values()
+            )
+            if not busy:
+                self._next_token += 1
+                token = self._next_token
+                self._loads[token] = (draw_id, Counter())
+        if busy:
+            yield None
+            return
+        try:
+            yield token
+        finally:
+            with self._lock:
+                self._loads.pop(token, None)
+
+    def load(
+        self, draw_id: int, counts: Mapping[int, int], token: int | None = None
+    ) -> None:
+        """
+        Replace the counters with the ballots per participant of a draw, plus
+        the ballots counted since the load of `token` began.
+        """
+        with self._lock:
+            loaded = Counter(counts)
+            if token in self._loads:
+                loaded.update(self._loads.pop(token)[1])
+            self._draw_id = draw_id
+            self._counts = +loaded
+            self._total = sum(self._counts.values())
+            self._expires_at = time.monotonic() + self.ttl
+
+    def _track(self, draw_id: int, participant_id: int, change: int) -> None:
+        for loading, changes in self._loads.values():
+            if loading == draw_id:
+                changes[participant_id] += change
+
+    def add(self, draw_id: int, participant_ids: Iterable[int]) -> None:
+        """Count one new ballot of draw `draw_id` per item of `participant_ids`."""
+        with self._lock:
+            for participant_id in participant_ids:
+                self._track(draw_id, participant_id, 1)
+                if draw_id == self._draw_id:
+                    self._counts[participant_id] += 1
+                    self._total += 1
+
+    def remove(self, draw_id: int, participant_id: int) -> None:
+        """Uncount a deleted ballot of draw `draw_id`."""
+        with self._lock:
+            self._track(draw_id, participant_id, -1)
+            if draw_id != self._draw_id or self._counts[participant_id] <= 0:
+                return
+            self._counts[participant_id] -= 1
+            if not self._counts[participant_id]:
+                del self._counts[participant_id]
+            self._total -= 1
+
+    def totals(self) -> tuple[int, int]:
+        """Return the number of ballots and of participants holding them."""
+        with self._lock:
+            return self._total, len(self._counts)
+
+    def ballots_of(self, participant_id: int) -> tuple[int, int]:
+        """Return the ballots of a participant and the total number of ballots."""
+        with self._lock:
+            return self._counts.get(participant_id, 0), self._total
+
+    def invalidate(self) -> None:
+        """Drop the counters; the next lookup loads them again."""
+        with self._lock:
+            self._draw_id = None
+            self._counts = Counter()
+            self._total = 0
+
+
+@lru_cache
+def get_current_odds() -> OddsCounter:
+    """
+    Return the process-wide ballot counters of the current draw.
+    """
+    return OddsCounter(ttl=get_settings().odds_resync_seconds)
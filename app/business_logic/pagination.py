@@ -0,0 +1,45 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor wraps the sort-key value of the last item of a page; the next page
+starts right after it, so every page costs an index seek regardless of depth.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date
+from typing import Any
+
+from app.exceptions import ValidationError
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+CURSOR_DESCRIPTION = (
+    "Opaque cursor taken from the X-Next-Cursor header of the previous page"
+)
+
+
+def encode_cursor(value: Any) -> str:
+    """
+    Encode the sort-key value of the last item of a page as an opaque cursor.
+    """
+    if isinstance(value, date):
+        value = value.isoformat()
+    raw = json.dumps({"after": value}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_type: type) -> Any:
+    """
+    Decode a cursor back into a sort-key value of type `key_type`.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded))["after"]
+        if key_type is date:
+            return date.fromisoformat(value)
+        return key_type(value)
+    except (binascii.Error, TypeError, KeyError, ValueError):
+        raise ValidationError(f"Invalid cursor: {cursor}")
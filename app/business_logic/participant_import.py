@@ -0,0 +1,132 @@
+"""
+Incremental parsers for participant import files (CSV and NDJSON).
+
+Parsers are fed one line at a time, so files and request bodies can be
+imported without holding them in memory.
+"""
+
+import codecs
+import csv
+import json
+from itertools import islice
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator
+
+
+class CsvRecordParser:
+    """
+    Parses CSV lines into dicts keyed by the header row.
+    Quoted fields spanning several lines are buffered until complete.
+    """
+
+    def __init__(self):
+        self.header: list[str] | None = None
+        self._pending = ""
+
+    def feed(self, line: str) -> dict[str, Any] | None:
+        """Consume a line and return the record it completes, if any."""
+        self._pending += line
+        if self._pending.count('"') % 2:
+            return None
+        text, self._pending = self._pending, ""
+        if not text.strip():
+            return None
+        row = next(csv.reader([text]))
+        if self.header is None:
+            self.header = [column.strip() for column in row]
+            return None
+        return dict(zip(self.header, row))
+
+
+class NdjsonRecordParser:
+    """
+    Parses newline-delimited JSON objects.
+    Lines that are not valid JSON yield an empty record, which fails validation.
+    """
+
+    def feed(self, line: str) -> Any:
+        """Consume a line and return the record it holds, if any."""
+        if not line.strip():
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            return {}
+
+
+RECORD_PARSERS = {
+    "csv": CsvRecordParser,
+    "ndjson": NdjsonRecordParser,
+}
+
+
+def get_record_parser(file_format: str) -> CsvRecordParser | NdjsonRecordParser:
+    """
+    Instantiate the parser for `file_format` ("csv" or "ndjson").
+    """
+    try:
+        return RECORD_PARSERS[file_format]()
+    except KeyError:
+        raise ValueError(f"Unsupported import format: {file_format}")
+
+
+def iter_records(lines: Iterable[str], file_format: str) -> Iterator[Any]:
+    """
+    Lazily parse `lines` into records.
+    """
+    parser = get_record_parser(file_format)
+    for line in lines:
+        record = parser.feed(line)
+        if record is not None:
+            yield record
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """
+    Split `items` into lists of at most `size` elements.
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+async def aiter_records(
+    chunks: AsyncIterable[bytes], file_format: str
+) -> AsyncIterator[Any]:
+    """
+    Lazily parse a stream of UTF-8 byte chunks (e.g. a request body) into records.
+    """
+    parser = get_record_parser(file_format)
+    async for line in aiter_lines(chunks):
+        record = parser.feed(line)
+        if record is not None:
+            yield record
+
+
+async def achunked(items: AsyncIterable[Any], size: int) -> AsyncIterator[list[Any]]:
+    """
+    Split an async iterable into lists of at most `size` elements.
+    """
+    chunk = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def aiter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """
+    Decode a stream of UTF-8 byte chunks into lines, keeping line endings.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line + "\n"
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
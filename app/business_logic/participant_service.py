@@ -2,11 +2,15 @@
 Business-logic layer orchestrating participant use-cases.
 """
 
-from typing import Any
+from typing import Any, Iterable
 
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.business_logic.async_general_service import AsyncGeneralService
 from app.business_logic.general_service import GeneralService
+from app.business_logic.participant_import import chunked
 from app.data_access_layer.models import Participant
 from app.exceptions import ValidationError
 
@@ -25,4 +29,71 @@ class ParticipantService(GeneralService[Participant]):
             raise ValidationError(
                 f"A participant with email '{participant_data["email"]}' already exists."
             )
-        return self.repo.add(**participant_data)
+        return super().create(participant_data)
+
+    def import_records(
+        self, records: Iterable[Any], chunk_size: int = 1000
+    ) -> dict[str, int]:
+        """
+        Import participants from an iterable of records, `chunk_size` at a time.
+        Returns the number of created, duplicate and invalid records.
+        """
+        report = {"created": 0, "duplicates": 0, "invalid": 0}
+        for chunk in chunked(records, chunk_size):
+            for outcome, count in self.import_chunk(chunk).items():
+                report[outcome] += count
+        return report
+
+    def import_chunk(self, records: list[Any]) -> dict[str, int]:
+        """
+        Insert the valid records whose email is not taken, in one transaction.
+        Email uniqueness is checked with a single IN query for the whole chunk.
+        If another import takes some of the emails before the insert, the
+        unique index rejects it and the chunk is checked again, counting those
+        as duplicates; each retry finds more emails taken, so it ends.
+        """
+        candidates: dict[str, dict[str, str]] = {}
+        invalid = duplicates = 0
+        for record in records:
+            if not isinstance(record, dict) or not all(
+                isinstance(record.get(field), str) and record[field].strip()
+                for field in ("name", "email")
+            ):
+                invalid += 1
+            elif record["email"] in candidates:
+                duplicates += 1
+            else:
+                candidates[record["email"]] = {
+                    "name": record["name"],
+                    "email": record["email"],
+                }
+        while True:
+            taken = self.repo.existing_values(Participant.email, list(candidates))
+            new = [data for email, data in candidates.items() if email not in taken]
+            try:
+                self.repo.add_many(new)
+                break
+            except IntegrityError:
+                self.db.rollback()
+        return {
+            "created": len(new),
+            "duplicates": duplicates + len(taken),
+            "invalid": invalid,
+        }
+
+
+class AsyncParticipantService(AsyncGeneralService[Participant]):
+    """
+    Async counterpart of ParticipantService.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, Participant)
+
+    async def create(self, participant_data: dict[str, Any]) -> Participant:
+        # Business rule: Participant email must be unique
+        if await self.repo.find_by(email=participant_data["email"]):
+            raise ValidationError(
+                f"A participant with email '{participant_data["email"]}' already exists."
+            )
+        return await super().create(participant_data)
@@ -0,0 +1,210 @@
+"""
+Pluggable strategies for picking the winning ballot of a draw.
+
+Every selector picks uniformly over all ballots of a draw without loading them
+into memory, and returns the participant id of the winning ballot.
+"""
+
+import secrets
+from abc import ABC, abstractmethod
+from typing import Any, List, Sequence
+
+from app.data_access_layer.general_repository import GeneralRepository
+from app.data_access_layer.models import Ballot, BallotCount
+
+
+class WinnerSelector(ABC):
+    """
+    Strategy interface for selecting a winning ballot.
+    """
+
+    @abstractmethod
+    def select(self, repo: GeneralRepository[Ballot], draw_id: int) -> int | None:
+        """
+        Return the participant id of a uniformly chosen ballot of the draw,
+        or None if the draw has no ballots.
+        """
+
+    def sample(
+        self, repo: GeneralRepository[Ballot], draw_id: int, k: int
+    ) -> List[int]:
+        """
+        Return up to `k` distinct participant ids in the order they were drawn.
+        Each is drawn like `select`, among the ballots of participants not yet
+        drawn. Fewer are returned if the draw has fewer participants.
+        """
+        if k == 1:
+            winner = self.select(repo, draw_id)
+            return [] if winner is None else [winner]
+        # Redrawing until k distinct participants come up degrades badly once
+        # a few participants hold most ballots; sample the aggregate instead
+        return WeightedWinnerSelector().sample(repo, draw_id, k)
+
+
+class OffsetWinnerSelector(WinnerSelector):
+    """
+    Counts the ballots of the draw and fetches the one at a random offset.
+
+    Runs two queries over the `(draw_id, id)` index and holds a single row in memory.
+    """
+
+    def select(self, repo: GeneralRepository[Ballot], draw_id: int) -> int | None:
+        total = repo.count_by(draw_id=draw_id)
+        if not total:
+            return None
+        return repo.value_at(
+            Ballot.participant_id,
+            offset=secrets.randbelow(total),
+            order_by=Ballot.id,
+            draw_id=draw_id,
+        )
+
+
+class IdRangeWinnerSelector(WinnerSelector):
+    """
+    Draws random ids between the lowest and highest ballot id of the draw and
+    keeps the first one that belongs to the draw (rejection sampling).
+
+    Each attempt is a primary-key lookup, so the cost does not grow with the
+    number of ballots. When ids of the draw are sparse and every attempt
+    misses, it falls back to `OffsetWinnerSelector`.
+    """
+
+    def __init__(self, max_attempts: int = 32):
+        self.max_attempts = max_attempts
+        self.fallback = OffsetWinnerSelector()
+
+    def select(self, repo: GeneralRepository[Ballot], draw_id: int) -> int | None:
+        low = repo.value_at(Ballot.id, order_by=Ballot.id.asc(), draw_id=draw_id)
+        if low is None:
+            return None
+        high = repo.value_at(Ballot.id, order_by=Ballot.id.desc(), draw_id=draw_id)
+        for _ in range(self.max_attempts):
+            candidate = low + secrets.randbelow(high - low + 1)
+            winner = repo.value_at(Ballot.participant_id, id=candidate, draw_id=draw_id)
+            if winner is not None:
+                return winner
+        return self.fallback.select(repo, draw_id)
+
+
+class ReservoirWinnerSelector(WinnerSelector):
+    """
+    Streams the participant ids of the draw through a server-side cursor and
+    keeps a single-slot reservoir sample.
+
+    Reads every ballot once but never holds more than `batch_size` rows.
+    """
+
+    def __init__(self, batch_size: int = 10_000):
+        self.batch_size = batch_size
+
+    def select(self, repo: GeneralRepository[Ballot], draw_id: int) -> int | None:
+        winner = None
+        participant_ids = repo.stream_values(
+            Ballot.participant_id, batch_size=self.batch_size, draw_id=draw_id
+        )
+        for seen, participant_id in enumerate(participant_ids, start=1):
+            if secrets.randbelow(seen) == 0:
+                winner = participant_id
+        return winner
+
+
+class FenwickTree:
+    """
+    Binary indexed tree over non-negative integer weights.
+
+    Builds in O(n); changing a weight and finding the index that a point in the
+    cumulative weight falls on both take O(log n).
+    """
+
+    def __init__(self, weights: Sequence[int]):
+        size = len(weights)
+        tree = [0, *weights]
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                tree[parent] += tree[index]
+        self._tree = tree
+        # Largest power of two within the tree, where the search starts
+        self._top = 1 << (size.bit_length() - 1) if size else 0
+        self.total = sum(weights)
+
+    def add(self, index: int, delta: int) -> None:
+        """Add `delta` to the weight at (0-based) `index`."""
+        self.total += delta
+        position = index + 1
+        while position < len(self._tree):
+            self._tree[position] += delta
+            position += position & -position
+
+    def find(self, point: int) -> int:
+        """
+        Return the index whose span of the cumulative weight holds `point`,
+        for 0 <= point < total.
+        """
+        position, step = 0, self._top
+        while step:
+            following = position + step
+            if following < len(self._tree) and self._tree[following] <= point:
+                position = following
+                point -= self._tree[following]
+            step >>= 1
+        return position
+
+
+class WeightedWinnerSelector(WinnerSelector):
+    """
+    Picks a participant with probability proportional to their ballot count,
+    read from the ballot_counts aggregate rather than from the ballots.
+
+    Equivalent to picking a uniform ballot, but runs one query and holds one
+    row per participant, so the cost follows the number of participants and
+    not the number of ballots.
+    """
+
+    def select(self, repo: GeneralRepository[Ballot], draw_id: int) -> int | None:
+        winners = self.sample(repo, draw_id, 1)
+        return winners[0] if winners else None
+
+    def sample(
+        self, repo: GeneralRepository[Ballot], draw_id: int, k: int
+    ) -> List[int]:
+        """
+        Draw `k` distinct participants without replacement: after each pick the
+        winner's weight drops to zero. Takes O(n) to build the tree over n
+        participants, then O(log n) per winner.
+        """
+        counts = GeneralRepository(repo.db, BallotCount).find_rows(
+            [BallotCount.participant_id, BallotCount.ballots],
+            order_by=BallotCount.participant_id,
+            draw_id=draw_id,
+        )
+        if not counts:
+            return []
+        participant_ids, weights = zip(*counts)
+        tree = FenwickTree(weights)
+        winners = []
+        while tree.total > 0 and len(winners) < k:
+            index = tree.find(secrets.randbelow(tree.total))
+            winners.append(participant_ids[index])
+            tree.add(index, -weights[index])
+        return winners
+
+
+WINNER_SELECTORS: dict[str, type[WinnerSelector]] = {
+    "weighted": WeightedWinnerSelector,
+    "id_range": IdRangeWinnerSelector,
+    "offset": OffsetWinnerSelector,
+    "reservoir": ReservoirWinnerSelector,
+}
+
+
+def get_winner_selector(name: str, **options: Any) -> WinnerSelector:
+    """
+    Instantiate the winner selector registered under `name`.
+    """
+    try:
+        selector_class = WINNER_SELECTORS[name]
+    except KeyError:
+        raise ValueError(f"Unknown winner selector: {name}")
+    return selector_class(**options)
@@ -0,0 +1,10 @@
+"""
+Wall-clock time as the application stores it.
+"""
+
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, as stored in the database."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
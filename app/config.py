@@ -2,8 +2,15 @@
 Application configuration using environment variables.
 """
 
+from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+JournalMode = Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL"]
+SynchronousLevel = Literal["OFF", "NORMAL", "FULL", "EXTRA"]
+SchedulerMode = Literal["local", "leader", "off"]
+
 
 class Settings(BaseSettings):
     """
@@ -12,11 +19,145 @@ class Settings(BaseSettings):
     Attributes:
         db_url: Database connection URL.
         debug: Enable FastAPI debug mode.
+        db_pool_size: Connections kept open in the pool.
+        db_max_overflow: Extra connections opened beyond the pool size under load.
+        db_pool_timeout: Seconds to wait for a pooled connection before failing.
+        db_pool_recycle: Seconds after which a connection is replaced (-1 never).
+        db_pool_pre_ping: Check connections for liveness when checked out.
+        sqlite_journal_mode: SQLite journal mode; WAL lets readers run during writes.
+        sqlite_synchronous: SQLite fsync level; NORMAL is durable in WAL mode
+            except for the last transactions on power loss.
+        sqlite_busy_timeout_ms: How long SQLite waits on a locked database.
+        sqlite_cache_size: SQLite page cache (negative values are KiB).
+        sqlite_mmap_size: Bytes of the SQLite file memory-mapped for reads.
+        async_db: Serve the CRUD endpoints with async handlers on an AsyncSession.
+        async_db_url: Async driver URL; derived from db_url when not set
+            (aiosqlite for SQLite, asyncpg for PostgreSQL).
+        winner_selector: Strategy used to pick the winning ballot of a draw
+            ("id_range", "weighted", "offset" or "reservoir").
+        draw_prize_tiers: Prize tiers of a draw in order of rank, as tier name
+            to number of winners; each winner is a distinct participant.
+        lottery_timezone: Time zone whose midnight closes a draw and opens the
+            next one; it decides which draw new ballots are entered into.
+        draw_precreate_days: Days ahead, beyond today, for which draws are
+            created in advance, so the next draw already exists at midnight.
+        draw_close_delay_seconds: Seconds after midnight (0-59) before the
+            winners of the closed draw are drawn, letting ballots submitted
+            just before midnight commit first.
+        draw_cache_ttl_seconds: How long the id of today's draw is cached per process.
+        draw_events_queue_size: Draw events queued per subscribed client before the
+            oldest is dropped.
+        draw_events_keepalive_seconds: Idle time after which an SSE comment is
+            sent to keep draw event streams open through proxies.
+        odds_resync_seconds: How often the per-process ballot counters behind the
+            odds endpoints are reloaded, which bounds how long ballots entered
+            through other worker processes go uncounted.
+        ballot_bulk_max_items: Maximum number of ballots in one bulk submission.
+        ballot_bulk_max_bytes: Maximum size of a bulk submission's body; larger
+            bodies are turned away while they are still being received.
+        ballot_group_commit: Insert single ballot submissions through a shared
+            writer that commits many of them per transaction.
+        ballot_flush_max_rows: Rows that trigger a group-commit flush.
+        ballot_flush_interval_ms: Longest a queued ballot waits for its flush.
+        ballot_rate_limit_enabled: Rate-limit ballot submissions per participant
+            and per client address (token buckets, per process).
+        ballot_rate_per_participant: Ballots per second a participant may submit
+            once its burst is spent.
+        ballot_burst_per_participant: Ballots a participant may submit at once.
+        ballot_rate_per_client: Ballots per second a client address may submit
+            once its burst is spent.
+        ballot_burst_per_client: Ballots a client address may submit at once.
+        max_in_flight_requests: Requests served at once before new ones are
+            answered with 503; by default db_pool_size + db_max_overflow, so
+            load is shed once the pool would saturate. 0 turns it off.
+        participant_import_chunk_size: Records checked and inserted per transaction
+            when importing participants.
+        draw_open_max_age_seconds: Cache-Control max-age of the open draw and of
+            draw list pages.
+        draw_final_max_age_seconds: Cache-Control max-age of draws that have a
+            winner and whose date has passed; they never change again.
+        entity_cache_enabled: Cache entities fetched by id (read-through), with
+            invalidation on create, update and delete.
+        entity_cache_backend: Entity cache backend ("local" is in-process).
+        entity_cache_max_entries: Entities kept by the local cache (LRU).
+        entity_cache_ttl_seconds: How long a cached entity is served; bounds
+            staleness after writes by other processes.
+        idempotency_key_ttl_seconds: How long the response to a request with an
+            Idempotency-Key is kept for replay.
+        idempotency_lease_seconds: How long a request with an Idempotency-Key
+            holds the key while running; a retry after that takes it over, in
+            case the worker died. Keep it above the slowest request.
+        export_batch_size: Rows fetched per round trip when streaming a draw's
+            ballot export.
+        fast_list_responses: Serve list endpoints from plain column rows encoded
+            straight to JSON (with orjson when installed), skipping ORM objects
+            and response-model validation.
+        migrate_on_startup: Apply pending schema migrations when the app starts;
+            turn off when migrations run as a separate deployment step.
+        scheduler_mode: How the midnight draw is scheduled: "local" runs it in
+            every process, "leader" only in the process holding the scheduler
+            lease in the database, "off" not at all.
+        scheduler_lease_ttl_seconds: How long the scheduler lease lasts without
+            a heartbeat; a dead leader is replaced within this time.
     """
 
     db_url: str = "sqlite:///./lottery.db"
     debug: bool = False
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    sqlite_journal_mode: JournalMode = "WAL"
+    sqlite_synchronous: SynchronousLevel = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size: int = -64_000
+    sqlite_mmap_size: int = 268_435_456
+    async_db: bool = False
+    async_db_url: str | None = None
+    winner_selector: str = "id_range"
+    draw_prize_tiers: dict[str, int] = {"grand": 1}
+    lottery_timezone: str = "Europe/Amsterdam"
+    draw_precreate_days: int = 2
+    draw_close_delay_seconds: int = 5
+    draw_cache_ttl_seconds: float = 60.0
+    draw_events_queue_size: int = 8
+    draw_events_keepalive_seconds: float = 15.0
+    odds_resync_seconds: float = 60.0
+    ballot_bulk_max_items: int = 10_000
+    ballot_bulk_max_bytes: int = 1_048_576
+    ballot_group_commit: bool = False
+    ballot_flush_max_rows: int = 500
+    ballot_flush_interval_ms: float = 5.0
+    ballot_rate_limit_enabled: bool = False
+    ballot_rate_per_participant: float = 1.0
+    ballot_burst_per_participant: int = 5
+    ballot_rate_per_client: float = 20.0
+    ballot_burst_per_client: int = 100
+    max_in_flight_requests: int | None = None
+    participant_import_chunk_size: int = 1000
+    draw_open_max_age_seconds: int = 5
+    draw_final_max_age_seconds: int = 86_400
+    entity_cache_enabled: bool = False
+    entity_cache_backend: str = "local"
+    entity_cache_max_entries: int = 10_000
+    entity_cache_ttl_seconds: float = 30.0
+    idempotency_key_ttl_seconds: float = 86_400
+    idempotency_lease_seconds: float = 60.0
+    export_batch_size: int = 1000
+    fast_list_responses: bool = False
+    migrate_on_startup: bool = True
+    scheduler_mode: SchedulerMode = "local"
+    scheduler_lease_ttl_seconds: float = 30.0
 
     model_config = SettingsConfigDict(
         env_file=".env",
     )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings, loaded once on first use.
+    """
+    return Settings()
@@ -0,0 +1,138 @@
+"""
+Generic async repository for data-access operations.
+"""
+
+from typing import AsyncIterator, Generic, Type, List, Optional, Dict, Any
+from sqlalchemy import select, func, ColumnElement
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data_access_layer.general_repository import Model
+
+
+class AsyncGeneralRepository(Generic[Model]):
+    """
+    Provides CRUD operations on an AsyncSession, mirroring GeneralRepository.
+    """
+
+    def __init__(self, db: AsyncSession, model: Type[Model]):
+        self.db = db
+        self.model = model
+
+    async def list(self, skip: int = 0, limit: int = 100) -> List[Model]:
+        """List objects with pagination."""
+        stmt = select(self.model).offset(skip).limit(limit)
+        return list((await self.db.scalars(stmt)).all())
+
+    async def list_after(
+        self, key: ColumnElement, after: Any = None, limit: int = 100
+    ) -> List[Model]:
+        """
+        List objects ordered by the unique column `key`, starting after the
+        key value `after` (keyset pagination).
+        """
+        stmt = select(self.model).order_by(key).limit(limit)
+        if after is not None:
+            stmt = stmt.where(key > after)
+        return list((await self.db.scalars(stmt)).all())
+
+    async def list_rows(
+        self, columns: List[ColumnElement], skip: int = 0, limit: int = 100
+    ) -> List[tuple]:
+        """List the given columns of objects as plain tuples, with pagination."""
+        stmt = select(*columns).offset(skip).limit(limit)
+        return list((await self.db.execute(stmt)).tuples().all())
+
+    async def list_rows_after(
+        self,
+        columns: List[ColumnElement],
+        key: ColumnElement,
+        after: Any = None,
+        limit: int = 100,
+    ) -> List[tuple]:
+        """
+        Like `list_after`, but fetch only `columns` as plain tuples instead of
+        building ORM objects.
+        """
+        stmt = select(*columns).order_by(key).limit(limit)
+        if after is not None:
+            stmt = stmt.where(key > after)
+        return list((await self.db.execute(stmt)).tuples().all())
+
+    async def get(self, identifier: int) -> Optional[Model]:
+        """Get an object by its ID."""
+        return await self.db.get(self.model, identifier)
+
+    async def find_by(
+        self, limit: int = 10, order_by: ColumnElement = None, **filters: Any
+    ) -> List[Model]:
+        """
+        Fetch up to `limit` objects matching provided filters.
+        Example: await repo.find_by(limit=2, name="Sushi Bar")
+        """
+        stmt = select(self.model).filter_by(**filters).order_by(order_by).limit(limit)
+        return list((await self.db.scalars(stmt)).all())
+
+    async def find_rows(
+        self,
+        columns: List[ColumnElement],
+        order_by: ColumnElement = None,
+        **filters: Any,
+    ) -> List[tuple]:
+        """Fetch `columns` of every object matching provided filters as plain tuples."""
+        stmt = select(*columns).filter_by(**filters).order_by(order_by)
+        return list((await self.db.execute(stmt)).all())
+
+    async def count_by(self, **filters: Any) -> int:
+        """Count the objects matching provided filters."""
+        stmt = select(func.count()).select_from(self.model).filter_by(**filters)
+        return await self.db.scalar(stmt)
+
+    async def stream_rows(
+        self,
+        columns: List[ColumnElement],
+        order_by: ColumnElement = None,
+        batch_size: int = 1000,
+        **filters: Any,
+    ) -> AsyncIterator[tuple]:
+        """
+        Iterate over `columns` of the objects matching filters as plain tuples,
+        fetching `batch_size` rows at a time (server-side cursor where supported).
+        """
+        stmt = (
+            select(*columns)
+            .select_from(self.model)
+            .filter_by(**filters)
+            .order_by(order_by)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(stmt)
+        async for row in result:
+            yield row
+
+    async def add(self, **fields: Any) -> Model:
+        """Create and persist a new object."""
+        obj = self.model(**fields)
+        self.db.add(obj)
+        await self.db.commit()
+        await self.db.refresh(obj)
+        return obj
+
+    async def update(self, identifier: int, data: Dict[str, Any]) -> Optional[Model]:
+        """Partially update an existing object."""
+        obj = await self.get(identifier)
+        if not obj:
+            return None
+        for attr, val in data.items():
+            setattr(obj, attr, val)
+        await self.db.commit()
+        await self.db.refresh(obj)
+        return obj
+
+    async def delete(self, identifier: int) -> Optional[Model]:
+        """Delete an object by its ID."""
+        obj = await self.get(identifier)
+        if not obj:
+            return None
+        await self.db.delete(obj)
+        await self.db.commit()
+        return obj
@@ -2,35 +2,153 @@
 Setup SQLAlchemy engine and session factory.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-from app.config import Settings
+from functools import lru_cache
 
-settings = Settings()
+from typing import Any
 
-# Engine configuration
-engine = create_engine(
-    settings.db_url,
+from sqlalchemy import Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
 )
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from app.config import Settings, get_settings
+
+
+def engine_options(url: str, settings: Settings) -> dict[str, Any]:
+    """
+    Pool keyword arguments for `create_engine` from the performance profile.
+    In-memory SQLite uses a single-connection pool and takes no sizing options.
+    """
+    options: dict[str, Any] = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite" or parsed.database not in (
+        None,
+        "",
+        ":memory:",
+    ):
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
+    return options
+
+
+def apply_sqlite_pragmas(engine: Engine, settings: Settings) -> None:
+    """
+    Run the SQLite pragma profile on every new connection of `engine`.
+    """
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        cursor.execute(f"PRAGMA cache_size={int(settings.sqlite_cache_size)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+        cursor.close()
+
+
+def create_tuned_engine(settings: Settings) -> Engine:
+    """
+    Create the sync engine with the pool and SQLite profile from settings.
+    """
+    engine = create_engine(settings.db_url, **engine_options(settings.db_url, settings))
+    if engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(engine, settings)
+    return engine
+
+
+@lru_cache
+def get_engine() -> Engine:
+    """
+    Return the application engine, created on first use rather than on import.
+    """
+    return create_tuned_engine(get_settings())
+
+
+@lru_cache
+def get_sessionmaker() -> sessionmaker[Session]:
+    """
+    Return the session factory bound to the application engine.
+    """
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=get_engine(),
+    )
 
-# Session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
 
 # Base class for models
 Base = declarative_base()
 
+# Async drivers used when only a sync URL is configured
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
 
 # Dependency to provide a database session
 def get_db():
     """
     Dependency to provide a database session and close it after use.
     """
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
         db.close()
+
+
+def async_url(url: str) -> str:
+    """
+    Translate a sync database URL into its async-driver equivalent.
+    """
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver known for '{parsed.drivername}'")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """
+    Return the async engine, created on first use so the async driver
+    is only required when async mode is enabled.
+    """
+    settings = get_settings()
+    url = settings.async_db_url or async_url(settings.db_url)
+    async_engine = create_async_engine(url, **engine_options(url, settings))
+    if async_engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(async_engine.sync_engine, settings)
+    return async_engine
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    Return the async session factory bound to the async engine.
+    """
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+# Dependency to provide an async database session
+async def get_async_db():
+    """
+    Dependency to provide an async database session and close it after use.
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -2,9 +2,10 @@
 Generic repository for data-access operations.
 """
 
-from typing import TypeVar, Generic, Type, List, Optional, Dict, Any
-from sqlalchemy import select, ColumnElement
+from typing import TypeVar, Generic, Type, List, Optional, Dict, Any, Iterator, Sequence
+from sqlalchemy import select, insert, func, ColumnElement
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import ExecutableOption
 
 from app.data_access_layer.database import Base
 
@@ -26,6 +27,76 @@ class GeneralRepository(Generic[Model]):
         stmt = select(self.model).offset(skip).limit(limit)
         return list(self.db.scalars(stmt).all())
 
+    def list_after(
+        self, key: ColumnElement, after: Any = None, limit: int = 100
+    ) -> List[Model]:
+        """
+        List objects ordered by the unique column `key`, starting after the
+        key value `after` (keyset pagination).
+        """
+        stmt = select(self.model).order_by(key).limit(limit)
+        if after is not None:
+            stmt = stmt.where(key > after)
+        return list(self.db.scalars(stmt).all())
+
+    def list_range(
+        self,
+        key: ColumnElement,
+        low: Any = None,
+        high: Any = None,
+        after: Any = None,
+        limit: int = 100,
+        options: Sequence[ExecutableOption] = (),
+    ) -> List[Model]:
+        """
+        List objects whose unique column `key` lies between `low` and `high`
+        (inclusive, either open when None), ordered by `key` and starting after
+        `after`. `options` are loader options, e.g. eager loads of relationships.
+        """
+        stmt = select(self.model).options(*options).order_by(key).limit(limit)
+        if low is not None:
+            stmt = stmt.where(key >= low)
+        if high is not None:
+            stmt = stmt.where(key <= high)
+        if after is not None:
+            stmt = stmt.where(key > after)
+        return list(self.db.scalars(stmt).unique().all())
+
+    def group_totals(
+        self, key: ColumnElement, values: List[Any], *aggregates: ColumnElement
+    ) -> Dict[Any, tuple]:
+        """
+        Compute `aggregates` per value of `key` over the objects whose `key` is
+        in `values`, in one GROUP BY query.
+        """
+        if not values:
+            return {}
+        stmt = select(key, *aggregates).where(key.in_(values)).group_by(key)
+        return {row[0]: tuple(row[1:]) for row in self.db.execute(stmt)}
+
+    def list_rows(
+        self, columns: List[ColumnElement], skip: int = 0, limit: int = 100
+    ) -> List[tuple]:
+        """List the given columns of objects as plain tuples, with pagination."""
+        stmt = select(*columns).offset(skip).limit(limit)
+        return list(self.db.execute(stmt).tuples().all())
+
+    def list_rows_after(
+        self,
+        columns: List[ColumnElement],
+        key: ColumnElement,
+        after: Any = None,
+        limit: int = 100,
+    ) -> List[tuple]:
+        """
+        Like `list_after`, but fetch only `columns` as plain tuples instead of
+        building ORM objects.
+        """
+        stmt = select(*columns).order_by(key).limit(limit)
+        if after is not None:
+            stmt = stmt.where(key > after)
+        return list(self.db.execute(stmt).tuples().all())
+
     def get(self, identifier: int) -> Optional[Model]:
         """Get an object by its ID."""
         return self.db.get(self.model, identifier)
@@ -40,6 +111,84 @@ class GeneralRepository(Generic[Model]):
         stmt = select(self.model).filter_by(**filters).order_by(order_by).limit(limit)
         return list(self.db.scalars(stmt).all())
 
+    def find_rows(
+        self,
+        columns: List[ColumnElement],
+        order_by: ColumnElement = None,
+        **filters: Any,
+    ) -> List[tuple]:
+        """Fetch `columns` of every object matching provided filters as plain tuples."""
+        stmt = select(*columns).filter_by(**filters).order_by(order_by)
+        return list(self.db.execute(stmt).all())
+
+    def existing_values(self, column: ColumnElement, values: List[Any]) -> set[Any]:
+        """Return the subset of `values` already stored in `column` (one IN query)."""
+        if not values:
+            return set()
+        stmt = select(column).where(column.in_(values))
+        return set(self.db.scalars(stmt).all())
+
+    def count_by(self, **filters: Any) -> int:
+        """Count the objects matching provided filters."""
+        stmt = select(func.count()).select_from(self.model).filter_by(**filters)
+        return self.db.scalar(stmt)
+
+    def value_at(
+        self,
+        column: ColumnElement,
+        offset: int = 0,
+        order_by: ColumnElement = None,
+        **filters: Any,
+    ) -> Any:
+        """
+        Fetch a single column of the object at `offset` among those matching filters.
+        Returns None when there is no such object.
+        """
+        stmt = (
+            select(column)
+            .select_from(self.model)
+            .filter_by(**filters)
+            .order_by(order_by)
+            .offset(offset)
+            .limit(1)
+        )
+        return self.db.scalar(stmt)
+
+    def stream_values(
+        self, column: ColumnElement, batch_size: int = 1000, **filters: Any
+    ) -> Iterator[Any]:
+        """
+        Iterate over a single column of the objects matching filters,
+        fetching `batch_size` rows at a time (server-side cursor where supported).
+        """
+        stmt = (
+            select(column)
+            .select_from(self.model)
+            .filter_by(**filters)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.db.scalars(stmt)
+
+    def stream_rows(
+        self,
+        columns: List[ColumnElement],
+        order_by: ColumnElement = None,
+        batch_size: int = 1000,
+        **filters: Any,
+    ) -> Iterator[tuple]:
+        """
+        Iterate over `columns` of the objects matching filters as plain tuples,
+        fetching `batch_size` rows at a time (server-side cursor where supported).
+        """
+        stmt = (
+            select(*columns)
+            .select_from(self.model)
+            .filter_by(**filters)
+            .order_by(order_by)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.db.execute(stmt)
+
     def add(self, **fields: Any) -> Model:
         """Create and persist a new object."""
         obj = self.model(**fields)
@@ -48,6 +197,18 @@ class GeneralRepository(Generic[Model]):
         self.db.refresh(obj)
         return obj
 
+    def add_many(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Insert many objects in a single transaction (executemany) and
+        return their primary keys in input order.
+        """
+        if not rows:
+            return []
+        stmt = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+        ids = list(self.db.scalars(stmt, rows).all())
+        self.db.commit()
+        return ids
+
     def update(self, identifier: int, data: Dict[str, Any]) -> Optional[Model]:
         """Partially update an existing object."""
         obj = self.get(identifier)
@@ -0,0 +1,165 @@
+"""
+Data access for idempotency keys: atomic claim, completion, release and purge.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import and_, delete, insert, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.data_access_layer.models import IdempotencyKey
+
+
+def _claim_statements(
+    scope: str,
+    key: str,
+    fingerprint: str,
+    now: datetime,
+    expired_before: datetime,
+    stale_before: datetime,
+):
+    lapsed = delete(IdempotencyKey).where(
+        IdempotencyKey.scope == scope,
+        IdempotencyKey.key == key,
+        or_(
+            IdempotencyKey.created_at < expired_before,
+            # A claim never completed nor released: its request died
+            and_(
+                IdempotencyKey.status_code.is_(None),
+                IdempotencyKey.created_at < stale_before,
+            ),
+        ),
+    )
+    claim = insert(IdempotencyKey).values(
+        scope=scope, key=key, fingerprint=fingerprint, created_at=now
+    )
+    return lapsed, claim
+
+
+class IdempotencyRepository:
+    """
+    Claims keys by inserting their row, so of concurrent requests carrying the
+    same key exactly one proceeds.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def claim(
+        self,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        now: datetime,
+        expired_before: datetime,
+        stale_before: datetime,
+    ) -> IdempotencyKey | None:
+        """
+        Claim `key` in `scope`, replacing a record created before `expired_before`,
+        or a claim still in progress that was made before `stale_before`.
+        Returns None if claimed, or the live record that holds the key.
+        """
+        lapsed, claim = _claim_statements(
+            scope, key, fingerprint, now, expired_before, stale_before
+        )
+        while True:
+            self.db.execute(lapsed)
+            try:
+                self.db.execute(claim)
+            except IntegrityError:
+                self.db.rollback()
+                record = self.db.get(IdempotencyKey, (scope, key))
+                if record is None:
+                    # Released since the insert was refused: claim it again
+                    continue
+                return record
+            self.db.commit()
+            return None
+
+    def complete(self, scope: str, key: str, status_code: int, response: str) -> None:
+        """Store the response produced for a claimed key."""
+        self.db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+            .values(status_code=status_code, response=response)
+        )
+        self.db.commit()
+
+    def release(self, scope: str, key: str) -> None:
+        """Drop a claimed key, so the request may be retried."""
+        self.db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.scope == scope, IdempotencyKey.key == key
+            )
+        )
+        self.db.commit()
+
+    def purge(self, before: datetime) -> int:
+        """Delete the keys created before `before` and return how many there were."""
+        result = self.db.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.created_at < before)
+        )
+        self.db.commit()
+        return result.rowcount
+
+
+class AsyncIdempotencyRepository:
+    """
+    Async counterpart of IdempotencyRepository.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def claim(
+        self,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        now: datetime,
+        expired_before: datetime,
+        stale_before: datetime,
+    ) -> IdempotencyKey | None:
+        """
+        Claim `key` in `scope`, replacing a record created before `expired_before`,
+        or a claim still in progress that was made before `stale_before`.
+        Returns None if claimed, or the live record that holds the key.
+        """
+        lapsed, claim = _claim_statements(
+            scope, key, fingerprint, now, expired_before, stale_before
+        )
+        while True:
+            await self.db.execute(lapsed)
+            try:
+                await self.db.execute(claim)
+            except IntegrityError:
+                await self.db.rollback()
+                record = await self.db.get(IdempotencyKey, (scope, key))
+                if record is None:
+                    # Released since the insert was refused: claim it again
+                    continue
+                return record
+            await self.db.commit()
+            return None
+
+    async def complete(
+        self, scope: str, key: str, status_code: int, response: str
+    ) -> None:
+        """Store the response produced for a claimed key."""
+        await self.db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+            .values(status_code=status_code, response=response)
+        )
+        await self.db.commit()
+
+    async def release(self, scope: str, key: str) -> None:
+        """Drop a claimed key, so the request may be retried."""
+        await self.db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.scope == scope, IdempotencyKey.key == key
+            )
+        )
+        await self.db.commit()
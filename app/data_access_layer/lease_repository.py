@@ -0,0 +1,53 @@
+"""
+Data access for leases: atomic claim, renewal and release of a lease row.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import delete, insert, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.data_access_layer.models import Lease
+
+
+class LeaseRepository:
+    """
+    Claims leases with single conditional statements, so concurrent claimants
+    on SQLite or PostgreSQL can never both succeed.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def claim(
+        self, name: str, holder: str, now: datetime, expires_at: datetime
+    ) -> bool:
+        """
+        Take or renew the lease `name` for `holder` until `expires_at`.
+        Succeeds if the lease is free, lapsed at `now`, or already held by `holder`.
+        """
+        renewed = self.db.execute(
+            update(Lease)
+            .where(Lease.name == name)
+            .where(or_(Lease.holder == holder, Lease.expires_at <= now))
+            .values(holder=holder, expires_at=expires_at)
+        )
+        if renewed.rowcount == 0:
+            try:
+                self.db.execute(
+                    insert(Lease).values(
+                        name=name, holder=holder, expires_at=expires_at
+                    )
+                )
+            except IntegrityError:
+                # Another holder has a live lease
+                self.db.rollback()
+                return False
+        self.db.commit()
+        return True
+
+    def release(self, name: str, holder: str) -> None:
+        """Give up the lease `name` if `holder` holds it."""
+        self.db.execute(delete(Lease).where(Lease.name == name, Lease.holder == holder))
+        self.db.commit()
@@ -0,0 +1,160 @@
+"""
+Versioned schema migrations.
+
+Each module `vNNNN_<name>.py` of this package is one migration, numbered in
+order, with `upgrade(connection)` and `downgrade(connection)` functions. The
+versions applied to a database are recorded in the `schema_migrations` table
+and every migration runs in its own transaction, holding a database-wide lock
+so that runners started together (e.g. every worker with MIGRATE_ON_STARTUP)
+apply each migration once: the others wait, then find it recorded.
+
+The baseline (v0001) only creates the tables missing from databases created
+before migrations existed, so later migrations must be written to be
+idempotent: they check for what they change (e.g. with
+`CREATE INDEX IF NOT EXISTS`).
+"""
+
+import importlib
+import logging
+import pkgutil
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from types import ModuleType
+from typing import Iterator
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Engine,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+)
+
+from app.clock import utcnow
+
+logger = logging.getLogger(__name__)
+
+_MODULE_NAME = re.compile(r"v(\d{4})_(\w+)")
+
+# Key of the Postgres advisory lock serializing migration runners
+_ADVISORY_LOCK_KEY = 0x6D6C6F74
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A numbered schema change with its upgrade and downgrade steps."""
+
+    version: int
+    name: str
+    module: ModuleType
+
+    def upgrade(self, connection: Connection) -> None:
+        self.module.upgrade(connection)
+
+    def downgrade(self, connection: Connection) -> None:
+        self.module.downgrade(connection)
+
+
+@lru_cache
+def migrations() -> tuple[Migration, ...]:
+    """Return every migration of this package in version order."""
+    found = []
+    for module_info in pkgutil.iter_modules(__path__):
+        match = _MODULE_NAME.fullmatch(module_info.name)
+        if match:
+            module = importlib.import_module(f"{__name__}.{module_info.name}")
+            found.append(Migration(int(match[1]), match[2], module))
+    return tuple(sorted(found, key=lambda migration: migration.version))
+
+
+def head() -> int:
+    """Version of the latest migration."""
+    return migrations()[-1].version
+
+
+def current_version(connection: Connection) -> int:
+    """Version the database is at; 0 if no migration was ever applied."""
+    schema_migrations.create(connection, checkfirst=True)
+    return connection.scalar(select(func.max(schema_migrations.c.version))) or 0
+
+
+@contextmanager
+def _locked_transaction(engine: Engine) -> Iterator[Connection]:
+    """
+    Open a transaction holding the migration lock until it ends: a
+    transaction-scoped advisory lock on Postgres, the write lock on SQLite.
+    """
+    with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY}
+            )
+        elif connection.dialect.name == "sqlite":
+            # pysqlite defers BEGIN to the first write; take the lock up front
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+        yield connection
+
+
+def upgrade(engine: Engine, target: int | None = None) -> list[int]:
+    """
+    Apply the pending migrations up to `target` (the head by default) and
+    return the versions applied.
+    """
+    target = head() if target is None else target
+    applied = []
+    for migration in migrations():
+        with _locked_transaction(engine) as connection:
+            if not current_version(connection) < migration.version <= target:
+                continue
+            logger.info("Applying migration %04d %s", migration.version, migration.name)
+            migration.upgrade(connection)
+            connection.execute(
+                insert(schema_migrations).values(
+                    version=migration.version,
+                    name=migration.name,
+                    applied_at=utcnow(),
+                )
+            )
+        applied.append(migration.version)
+    return applied
+
+
+def downgrade(engine: Engine, target: int) -> list[int]:
+    """
+    Revert the applied migrations above `target`, newest first, and return the
+    versions reverted.
+    """
+    reverted = []
+    for migration in reversed(migrations()):
+        with _locked_transaction(engine) as connection:
+            if not target < migration.version <= current_version(connection):
+                continue
+            logger.info(
+                "Reverting migration %04d %s", migration.version, migration.name
+            )
+            migration.downgrade(connection)
+            connection.execute(
+                delete(schema_migrations).where(
+                    schema_migrations.c.version == migration.version
+                )
+            )
+        reverted.append(migration.version)
+    return reverted
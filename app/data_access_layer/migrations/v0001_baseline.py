@@ -0,0 +1,164 @@
+"""
+Baseline: the tables as created by `create_all` before migrations existed.
+
+On an empty database this creates that schema; on a database created by
+earlier releases it only adds the tables that are missing. The tables are
+spelled out here rather than taken from the models, so version 1 stays the
+same schema however the models change; later migrations build on it.
+"""
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+    func,
+    insert,
+    select,
+)
+
+metadata = MetaData()
+
+participants = Table(
+    "participants",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("name", String, nullable=False, index=True),
+    Column("email", String, nullable=False, index=True),
+)
+
+draws = Table(
+    "draws",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("draw_date", Date, nullable=False, unique=True, index=True),
+    Column("winner_id", Integer, ForeignKey("participants.id")),
+)
+
+ballots = Table(
+    "ballots",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("participant_id", Integer, ForeignKey("participants.id"), nullable=False),
+    Column("draw_id", Integer, ForeignKey("draws.id"), nullable=False, index=True),
+    Column("timestamp", DateTime, nullable=False),
+)
+
+draw_results = Table(
+    "draw_results",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("draw_id", Integer, ForeignKey("draws.id"), nullable=False, index=True),
+    Column("rank", Integer, nullable=False),
+    Column("tier", String, nullable=False),
+    Column("participant_id", Integer, ForeignKey("participants.id"), nullable=False),
+    UniqueConstraint("draw_id", "rank"),
+    UniqueConstraint("draw_id", "participant_id"),
+)
+
+ballot_counts = Table(
+    "ballot_counts",
+    metadata,
+    Column("draw_id", Integer, ForeignKey("draws.id"), primary_key=True),
+    Column("participant_id", Integer, ForeignKey("participants.id"), primary_key=True),
+    Column("ballots", Integer, nullable=False),
+)
+
+leases = Table(
+    "leases",
+    metadata,
+    Column("name", String, primary_key=True),
+    Column("holder", String, nullable=False),
+    Column("expires_at", DateTime, nullable=False),
+)
+
+idempotency_keys = Table(
+    "idempotency_keys",
+    metadata,
+    Column("scope", String, primary_key=True),
+    Column("key", String, primary_key=True),
+    Column("fingerprint", String, nullable=False),
+    Column("status_code", Integer),
+    Column("response", String),
+    Column("created_at", DateTime, nullable=False, index=True),
+)
+
+# Per dialect, the statements installing the triggers that maintain ballot_counts.
+# This is their only definition; changing them takes a new migration.
+BALLOT_COUNT_TRIGGERS = {
+    "sqlite": (
+        """
+        CREATE TRIGGER IF NOT EXISTS ballot_counts_insert AFTER INSERT ON ballots
+        BEGIN
+            INSERT INTO ballot_counts (draw_id, participant_id, ballots)
+            VALUES (NEW.draw_id, NEW.participant_id, 1)
+            ON CONFLICT (draw_id, participant_id) DO UPDATE SET ballots = ballots + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS ballot_counts_delete AFTER DELETE ON ballots
+        BEGIN
+            UPDATE ballot_counts SET ballots = ballots - 1
+            WHERE draw_id = OLD.draw_id AND participant_id = OLD.participant_id;
+            DELETE FROM ballot_counts
+            WHERE draw_id = OLD.draw_id AND participant_id = OLD.participant_id
+            AND ballots <= 0;
+        END
+        """,
+    ),
+    "postgresql": (
+        """
+        CREATE OR REPLACE FUNCTION ballot_counts_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO ballot_counts (draw_id, participant_id, ballots)
+                VALUES (NEW.draw_id, NEW.participant_id, 1)
+                ON CONFLICT (draw_id, participant_id)
+                DO UPDATE SET ballots = ballot_counts.ballots + 1;
+                RETURN NEW;
+            END IF;
+            UPDATE ballot_counts SET ballots = ballots - 1
+            WHERE draw_id = OLD.draw_id AND participant_id = OLD.participant_id;
+            DELETE FROM ballot_counts
+            WHERE draw_id = OLD.draw_id AND participant_id = OLD.participant_id
+            AND ballots <= 0;
+            RETURN OLD;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE OR REPLACE TRIGGER ballot_counts_sync
+        AFTER INSERT OR DELETE ON ballots
+        FOR EACH ROW EXECUTE FUNCTION ballot_counts_sync()
+        """,
+    ),
+}
+
+
+def upgrade(connection: Connection) -> None:
+    counts_existed = connection.dialect.has_table(connection, "ballot_counts")
+    metadata.create_all(connection)
+    if counts_existed:
+        return
+    # Fill ballot_counts from the existing ballots and keep it up to date
+    columns = (ballots.c.draw_id, ballots.c.participant_id)
+    connection.execute(
+        insert(ballot_counts).from_select(
+            [*columns, ballot_counts.c.ballots],
+            select(*columns, func.count()).group_by(*columns),
+        )
+    )
+    for statement in BALLOT_COUNT_TRIGGERS.get(connection.dialect.name, ()):
+        connection.exec_driver_sql(statement)
+
+
+def downgrade(connection: Connection) -> None:
+    metadata.drop_all(connection)
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("DROP FUNCTION IF EXISTS ballot_counts_sync()")
@@ -0,0 +1,60 @@
+"""
+Indexes for the hot queries, and unique participant emails.
+
+- ballots (draw_id, id) serves every per-draw scan ordered by id: winner
+  selection, counts and exports. It replaces the single-column draw_id index.
+- ballots (participant_id, draw_id) serves ballot lookups by participant.
+- participants.email becomes unique, which the service layer already enforces.
+"""
+
+from sqlalchemy import Connection, inspect, text
+
+
+def upgrade(connection: Connection) -> None:
+    duplicates = connection.scalar(
+        text(
+            "SELECT count(*) FROM (SELECT email FROM participants "
+            "GROUP BY email HAVING count(*) > 1) AS duplicated"
+        )
+    )
+    if duplicates:
+        raise RuntimeError(
+            f"{duplicates} participant emails are used more than once; "
+            "merge those participants before making emails unique"
+        )
+    connection.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_ballots_draw_id_id ON ballots (draw_id, id)"
+        )
+    )
+    connection.execute(text("DROP INDEX IF EXISTS ix_ballots_draw_id"))
+    connection.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_ballots_participant_id_draw_id "
+            "ON ballots (participant_id, draw_id)"
+        )
+    )
+    if not _is_unique(connection, "participants", "ix_participants_email"):
+        connection.execute(text("DROP INDEX IF EXISTS ix_participants_email"))
+        connection.execute(
+            text("CREATE UNIQUE INDEX ix_participants_email ON participants (email)")
+        )
+
+
+def downgrade(connection: Connection) -> None:
+    connection.execute(text("DROP INDEX IF EXISTS ix_participants_email"))
+    connection.execute(
+        text("CREATE INDEX ix_participants_email ON participants (email)")
+    )
+    connection.execute(text("DROP INDEX IF EXISTS ix_ballots_participant_id_draw_id"))
+    connection.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_ballots_draw_id ON ballots (draw_id)")
+    )
+    connection.execute(text("DROP INDEX IF EXISTS ix_ballots_draw_id_id"))
+
+
+def _is_unique(connection: Connection, table: str, index: str) -> bool:
+    for info in inspect(connection).get_indexes(table):
+        if info["name"] == index:
+            return bool(info["unique"])
+    return False
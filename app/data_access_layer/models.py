@@ -4,7 +4,7 @@ Defines ORM models for the application.
 
 from datetime import datetime, date
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -18,14 +18,14 @@ class Participant(Base):
     Attributes:
         id: Primary key.
         name: Participant name.
-        email: Participant email.
+        email: Participant email, unique.
     """
 
     __tablename__ = "participants"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(nullable=False, index=True)
-    email: Mapped[str] = mapped_column(index=True)
+    email: Mapped[str] = mapped_column(unique=True, index=True)
 
 
 class Draw(Base):
@@ -62,11 +62,105 @@ class Ballot(Base):
     """
 
     __tablename__ = "ballots"
+    __table_args__ = (
+        # Per-draw scans ordered by id: winner selection, counts, exports
+        Index("ix_ballots_draw_id_id", "draw_id", "id"),
+        Index("ix_ballots_participant_id_draw_id", "participant_id", "draw_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     participant_id: Mapped[int] = mapped_column(ForeignKey("participants.id"))
     draw_id: Mapped[int] = mapped_column(ForeignKey("draws.id"))
-    timestamp: Mapped[datetime] = mapped_column(default=datetime.now())
+    timestamp: Mapped[datetime] = mapped_column(default=datetime.now)
 
     participant: Mapped[Participant] = relationship()
     draw: Mapped[Draw] = relationship()
+
+
+class DrawResult(Base):
+    """
+    ORM model for one winner of a draw; a draw has as many as it has prizes.
+
+    Attributes:
+        id: Primary key.
+        draw_id: Foreign key referencing the draw.
+        rank: Position of the winner in the draw, from 1 (the grand prize).
+        tier: Name of the prize tier won.
+        participant_id: Foreign key referencing the winning participant.
+    """
+
+    __tablename__ = "draw_results"
+    __table_args__ = (
+        UniqueConstraint("draw_id", "rank"),
+        UniqueConstraint("draw_id", "participant_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    draw_id: Mapped[int] = mapped_column(ForeignKey("draws.id"), index=True)
+    rank: Mapped[int]
+    tier: Mapped[str]
+    participant_id: Mapped[int] = mapped_column(ForeignKey("participants.id"))
+
+
+class BallotCount(Base):
+    """
+    ORM model for the number of ballots a participant holds in a draw.
+
+    Maintained by database triggers on every insert into and delete from
+    `ballots`, so it never drifts from the ballots themselves. The triggers
+    are installed by the baseline migration, so a schema made by `create_all`
+    alone lacks them.
+
+    Attributes:
+        draw_id: Part of the primary key, the draw.
+        participant_id: Part of the primary key, the participant.
+        ballots: Number of ballots of the participant in the draw.
+    """
+
+    __tablename__ = "ballot_counts"
+
+    draw_id: Mapped[int] = mapped_column(ForeignKey("draws.id"), primary_key=True)
+    participant_id: Mapped[int] = mapped_column(
+        ForeignKey("participants.id"), primary_key=True
+    )
+    ballots: Mapped[int] = mapped_column(default=0)
+
+
+class Lease(Base):
+    """
+    ORM model for a named lease held by at most one process at a time.
+
+    Attributes:
+        name: Primary key, the name of the leased duty.
+        holder: Id of the process holding the lease.
+        expires_at: UTC time the lease lapses unless renewed.
+    """
+
+    __tablename__ = "leases"
+
+    name: Mapped[str] = mapped_column(primary_key=True)
+    holder: Mapped[str]
+    expires_at: Mapped[datetime]
+
+
+class IdempotencyKey(Base):
+    """
+    ORM model for a client-supplied idempotency key and the response it produced.
+
+    Attributes:
+        scope: Part of the primary key, the endpoint the key was sent to.
+        key: Part of the primary key, the Idempotency-Key header value.
+        fingerprint: Hash of the request body the key was first used with.
+        status_code: Status of the stored response; None while in progress.
+        response: JSON body of the stored response.
+        created_at: UTC time the key was first seen.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    scope: Mapped[str] = mapped_column(primary_key=True)
+    key: Mapped[str] = mapped_column(primary_key=True)
+    fingerprint: Mapped[str]
+    status_code: Mapped[int | None]
+    response: Mapped[str | None]
+    created_at: Mapped[datetime] = mapped_column(index=True)
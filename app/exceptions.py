@@ -13,3 +13,17 @@ class ValidationError(Exception):
     """Input data failed business-rule validation."""
 
     pass
+
+
+class ConflictError(Exception):
+    """The request conflicts with one still being processed."""
+
+    pass
+
+
+class RateLimitedError(Exception):
+    """The client sent more requests than it is allowed to."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -3,44 +3,205 @@ FastAPI application instantiation and route definitions, leveraging service laye
 """
 
 import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
-from apscheduler.schedulers.background import BackgroundScheduler
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from sqlalchemy.exc import IntegrityError, DataError
 
-from app.api.v1.draw_endpoints import daily_draw, create_draw
-from app.config import Settings
-from app.data_access_layer.database import engine, Base
+from app.business_logic.ballot_service import BallotService
+from app.business_logic.draw_events import draw_event, get_draw_events
+from app.business_logic.draw_service import DrawService, closed_draw_date
+from app.business_logic.idempotency_service import IdempotencyService
+from app.business_logic.leader_election import LeaderLease
+from app.business_logic.group_commit import get_ballot_write_buffer
+from app.config import Settings, get_settings
+from app.data_access_layer.database import (
+    get_async_engine,
+    get_engine,
+    get_sessionmaker,
+)
+from app.data_access_layer.migrations import upgrade
 from app.api.v1.participant_endpoints import router as participant_router
 from app.api.v1.draw_endpoints import router as draw_router
 from app.api.v1.ballot_endpoints import router as ballot_router
-from app.exceptions import NotFoundError, ValidationError
+from app.exceptions import (
+    ConflictError,
+    NotFoundError,
+    RateLimitedError,
+    ValidationError,
+)
+from app.metrics import (
+    CONTENT_TYPE,
+    MetricsMiddleware,
+    instrument_engine,
+    registry,
+    timed_job,
+)
+from app.rate_limit import LoadSheddingMiddleware, retry_after_header
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
 
 # Initialize settings and logging
-settings = Settings()
+settings = get_settings()
 logging.basicConfig(level=logging.DEBUG if settings.debug else logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create all database tables
-Base.metadata.create_all(bind=engine)
-
 
 # Schedule a draw
+@timed_job("run_daily_draw")
 def run_daily_draw():
-    daily_draw()  # draw a winner
-    create_draw()  # open a new lottery
+    """
+    Draw the winners of the draw closed by the last midnight. The new day's
+    draw was created in advance, so ballots keep flowing into it meanwhile.
+    """
+    db = get_sessionmaker()()
+    try:
+        service = DrawService(db)
+        service.open_upcoming(settings.draw_precreate_days)  # extend the horizon
+        try:
+            drawn = service.draw_winner(closed_draw_date())  # draw a winner
+            # Push the result to subscribed clients instead of having them poll
+            get_draw_events().publish(draw_event(drawn, service.results(drawn.id)))
+        except NotFoundError as exc:
+            logger.warning("Skipping winner selection: %s", exc)
+        BallotService(db).refresh_odds()  # count the new day's draw
+    finally:
+        db.close()
+
+
+def open_upcoming_draws():
+    """Create the draws of today and the coming days that are missing."""
+    db = get_sessionmaker()()
+    try:
+        created = DrawService(db).open_upcoming(settings.draw_precreate_days)
+        logger.info("Opened %d upcoming draws", created)
+    finally:
+        db.close()
+
 
+def load_odds():
+    """Load the odds counters of today's draw, if it is open."""
+    db = get_sessionmaker()()
+    try:
+        BallotService(db).refresh_odds()
+    except NotFoundError as exc:
+        logger.info("Odds counters not loaded: %s", exc)
+    finally:
+        db.close()
 
-scheduler = BackgroundScheduler(timezone="Europe/Amsterdam")
-scheduler.add_job(run_daily_draw, "cron", hour=0, minute=0)
-scheduler.start()
+
+@timed_job("publish_draw_result")
+def publish_draw_result():
+    """
+    Publish tonight's result to this process's subscribers once another
+    process has drawn it: one query per process, however many clients wait.
+    """
+    db = get_sessionmaker()()
+    try:
+        service = DrawService(db)
+        try:
+            draw = service.get_by_attributes({"draw_date": closed_draw_date()})[0]
+        except NotFoundError:
+            return
+        if draw.winner_id is not None:
+            get_draw_events().publish(draw_event(draw, service.results(draw.id)))
+    finally:
+        db.close()
+
+
+@timed_job("purge_idempotency_keys")
+def purge_idempotency_keys():
+    db = get_sessionmaker()()
+    try:
+        purged = IdempotencyService(db).purge_expired()
+        logger.info("Purged %d expired idempotency keys", purged)
+    finally:
+        db.close()
+
+
+def start_scheduler(
+    settings: Settings,
+) -> tuple["BackgroundScheduler", LeaderLease | None]:
+    """
+    Start the scheduler running the midnight draw, as set by `scheduler_mode`.
+    Returns it with the lease this process competes for in leader mode.
+    """
+    # Imported here: APScheduler is a sizeable share of the import time
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    scheduler = BackgroundScheduler(timezone=settings.lottery_timezone)
+    # Just after midnight, once ballots sent before it have committed
+    midnight = {"hour": 0, "minute": 0, "second": settings.draw_close_delay_seconds}
+    lease = None
+    if settings.scheduler_mode == "leader":
+        # Every worker schedules the draw, only the lease holder runs it
+        lease = LeaderLease(
+            get_sessionmaker(), "scheduler", ttl=settings.scheduler_lease_ttl_seconds
+        )
+        scheduler.add_job(
+            lease.acquire, "interval", seconds=settings.scheduler_lease_ttl_seconds / 3
+        )
+        scheduler.add_job(lease.only_leader(run_daily_draw), "cron", **midnight)
+        # The leader publishes as it draws; the others pick the result up
+        scheduler.add_job(
+            publish_draw_result, "cron", hour=0, minute="0-1", second="*/10"
+        )
+        scheduler.add_job(
+            lease.only_leader(purge_idempotency_keys), "interval", hours=1
+        )
+    else:
+        scheduler.add_job(run_daily_draw, "cron", **midnight)
+        scheduler.add_job(purge_idempotency_keys, "interval", hours=1)
+    if settings.scheduler_mode != "off":
+        scheduler.start()
+    return scheduler, lease
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """
+    Migrate the schema, open the upcoming draws, load the odds counters and
+    start the scheduler when serving starts, and stop the background work on
+    shutdown. Importing the app has no side effects.
+    """
+    engine = get_engine()
+    if settings.migrate_on_startup:
+        upgrade(engine)
+    instrument_engine(engine)
+    if settings.async_db:
+        instrument_engine(get_async_engine().sync_engine)
+    open_upcoming_draws()
+    load_odds()
+    scheduler, lease = start_scheduler(settings)
+    try:
+        yield
+    finally:
+        if scheduler.running:
+            scheduler.shutdown()
+        if lease is not None:
+            lease.release()
+        get_draw_events().close_all()
+        write_buffer = get_ballot_write_buffer()
+        if write_buffer is not None:
+            write_buffer.stop()
 
 
 # Instantiate FastAPI
 app = FastAPI(
     title="Midnight Lottery",
     debug=settings.debug,
+    lifespan=lifespan,
 )
+max_in_flight = settings.max_in_flight_requests
+if max_in_flight is None:
+    # One request per connection the pool can hand out
+    max_in_flight = settings.db_pool_size + settings.db_max_overflow
+if max_in_flight:
+    app.add_middleware(LoadSheddingMiddleware, max_in_flight=max_in_flight)
+# Added last so it is outermost and also counts shed requests
+app.add_middleware(MetricsMiddleware)
 
 
 # Register exception handlers
@@ -60,6 +221,24 @@ async def validation_exception_handler(_: Request, exc: ValidationError):
     raise HTTPException(status_code=422, detail=str(exc))
 
 
+@app.exception_handler(ConflictError)
+async def conflict_handler(_: Request, exc: ConflictError):
+    """
+    Handle requests that clash with one still in progress.
+    """
+    raise HTTPException(status_code=409, detail=str(exc))
+
+
+@app.exception_handler(RateLimitedError)
+async def rate_limited_handler(_: Request, exc: RateLimitedError):
+    """
+    Handle clients over their rate limit, telling them when to retry.
+    """
+    raise HTTPException(
+        status_code=429, detail=str(exc), headers=retry_after_header(exc.retry_after)
+    )
+
+
 @app.exception_handler(ValueError)
 async def value_error_handler(_: Request, exc: ValueError):
     """
@@ -92,6 +271,20 @@ def health() -> dict:
     return {"status": "ok"}
 
 
+@app.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+def metrics() -> Response:
+    """
+    Expose request, query, pool and scheduler metrics for scraping.
+    """
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
+if settings.async_db:
+    # Serve the CRUD endpoints with async handlers on the AsyncSession
+    from app.api.v1.async_participant_endpoints import router as participant_router
+    from app.api.v1.async_draw_endpoints import router as draw_router
+    from app.api.v1.async_ballot_endpoints import router as ballot_router
+
 app.include_router(participant_router, prefix="/participants", tags=["Participants"])
 app.include_router(draw_router, prefix="/draws", tags=["Draws"])
 app.include_router(ballot_router, prefix="/ballots", tags=["Ballots"])
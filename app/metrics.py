@@ -0,0 +1,323 @@
+"""
+In-process metrics exposed in the Prometheus text format.
+
+Counters and histograms live in process memory and are rendered on demand by
+GET /metrics, so no external service or client library is needed. With several
+worker processes each one reports its own series; the scraper aggregates them.
+"""
+
+import bisect
+import functools
+import re
+import threading
+import time
+import weakref
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import Pool
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds in seconds; requests and jobs, then the much faster queries
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1, 0.5, 2.5)
+
+_STATEMENT_TYPE = re.compile(r"\s*(\w+)")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class Counter:
+    """
+    A monotonically increasing count per label combination.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, description: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Add `amount` to the series with the given label values."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        """Return the current count of a series."""
+        return self._values.get(label_values, 0.0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {value}"
+            for key, value in values
+        ]
+
+
+class Histogram:
+    """
+    Observations counted into cumulative buckets per label combination.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = REQUEST_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label values -> [per-bucket counts (last one is +Inf), sum]
+        self._values: dict[tuple[str, ...], list[Any]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Record one observation in the series with the given label values."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(label_values)
+            if series is None:
+                series = self._values[label_values] = [
+                    [0] * (len(self.buckets) + 1),
+                    0.0,
+                ]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *label_values: str) -> int:
+        """Return the number of observations in a series."""
+        series = self._values.get(label_values)
+        return sum(series[0]) if series else 0
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = [
+                (key, list(counts), total)
+                for key, (counts, total) in self._values.items()
+            ]
+        lines = []
+        for key, counts, total in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = _format_labels(self.labels + ("le",), key + (le,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {total}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    The set of metrics rendered by GET /metrics.
+    """
+
+    def __init__(self):
+        self._metrics: list[Counter | Histogram] = []
+
+    def register(self, metric: Counter | Histogram) -> Counter | Histogram:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.register(
+    Counter(
+        "http_requests_total",
+        "HTTP requests by route template and status code.",
+        ("method", "route", "status"),
+    )
+)
+http_request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template.",
+        ("method", "route"),
+    )
+)
+db_query_duration = registry.register(
+    Histogram(
+        "db_query_duration_seconds",
+        "Database statement latency by statement type.",
+        ("statement",),
+        buckets=QUERY_BUCKETS,
+    )
+)
+db_query_errors = registry.register(
+    Counter(
+        "db_query_errors_total",
+        "Database statements that raised, by statement type.",
+        ("statement",),
+    )
+)
+db_pool_checkout_wait = registry.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time spent waiting for a connection from the pool.",
+        buckets=QUERY_BUCKETS + REQUEST_BUCKETS[-5:],
+    )
+)
+scheduler_job_duration = registry.register(
+    Histogram(
+        "scheduler_job_duration_seconds",
+        "Scheduled job run time by job and outcome.",
+        ("job", "outcome"),
+    )
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware counting and timing HTTP requests per route template.
+
+    Requests are labelled with the matched route's path (e.g. /draws/{draw_id})
+    rather than the raw URL, so the number of series stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = "500"
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            path = route_template(scope)
+            http_requests.inc(scope["method"], path, status)
+            http_request_duration.observe(elapsed, scope["method"], path)
+
+
+def route_template(scope: dict) -> str:
+    """
+    Return the full path template of the route that served `scope`.
+    """
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or "unmatched"
+
+
+def statement_type(statement: str) -> str:
+    """Return the leading SQL keyword of `statement`, e.g. SELECT."""
+    match = _STATEMENT_TYPE.match(statement)
+    return match.group(1).upper() if match else "OTHER"
+
+
+_instrumented_engines: weakref.WeakSet = weakref.WeakSet()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time every statement run on `engine` and the pool checkouts feeding it.
+    Instrumenting an engine twice has no effect.
+    """
+    if engine in _instrumented_engines:
+        return
+    _instrumented_engines.add(engine)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def stop_timer(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        db_query_duration.observe(
+            time.perf_counter() - started, statement_type(statement)
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def count_error(context):
+        started = (
+            context.connection.info.get("query_started") if context.connection else None
+        )
+        if started:
+            started.pop()
+        db_query_errors.inc(statement_type(context.statement or ""))
+
+    instrument_pool(engine.pool)
+
+
+def instrument_pool(pool: Pool) -> None:
+    """
+    Time how long each checkout from `pool` waits for a connection.
+    """
+    connect = pool.connect
+
+    @functools.wraps(connect)
+    def timed_connect():
+        started = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            db_pool_checkout_wait.observe(time.perf_counter() - started)
+
+    pool.connect = timed_connect
+
+
+def timed_job(name: str) -> Callable:
+    """
+    Decorate a scheduled job so its run time is recorded under `name`.
+    """
+
+    def decorator(job: Callable) -> Callable:
+        @functools.wraps(job)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = job(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                scheduler_job_duration.observe(
+                    time.perf_counter() - started, name, outcome
+                )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,207 @@
+"""
+Admission control: token-bucket rate limits on ballot submissions and a cap on
+requests in flight.
+
+Both reject work before it reaches the database, so a flood from one client or
+a saturated connection pool turns into fast 429/503 answers instead of queued
+requests timing out. State is per process; with several workers each one
+enforces its own limits.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Hashable, Iterable
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from app.config import get_settings
+from app.exceptions import RateLimitedError
+from app.metrics import Counter, registry
+
+requests_rejected = registry.register(
+    Counter(
+        "http_requests_rejected_total",
+        "Requests turned away by rate limiting or load shedding.",
+        ("reason",),
+    )
+)
+
+# Paths that are never shed, so probes and scrapes see an overloaded process;
+# long-lived event streams are not counted as in flight either
+UNSHED_PATHS = frozenset({"/health", "/metrics", "/draws/events"})
+
+
+class TokenBucketLimiter:
+    """
+    One token bucket per key, refilled at `rate` tokens per second up to `burst`.
+    At most `max_keys` buckets are kept; the least recently used go first,
+    which only ever lets a forgotten key start again with a full bucket.
+
+    Taking more tokens than `burst` at once needs a full bucket; the rest is
+    borrowed, leaving the bucket below zero until it refills.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+
+    def acquire(self, key: Hashable, tokens: int = 1) -> float:
+        """
+        Take `tokens` from the bucket of `key`. Returns 0 if they were
+        available, otherwise the seconds until they will be.
+        """
+        now = self.clock()
+        with self._lock:
+            available = self._available(key, now)
+            wait = self._wait(available, tokens)
+            self._store(key, available if wait else available - tokens, now)
+        return wait
+
+    def wait(self, key: Hashable, tokens: int = 1) -> float:
+        """
+        Seconds until `tokens` can be taken from the bucket of `key`, 0 if
+        they can be now. Nothing is taken.
+        """
+        now = self.clock()
+        with self._lock:
+            return self._wait(self._available(key, now), tokens)
+
+    def take(self, key: Hashable, tokens: int = 1) -> None:
+        """Take `tokens` from the bucket of `key`, borrowing any it lacks."""
+        now = self.clock()
+        with self._lock:
+            self._store(key, self._available(key, now) - tokens, now)
+
+    def _available(self, key: Hashable, now: float) -> float:
+        tokens, updated = self._buckets.get(key, (self.burst, now))
+        return min(self.burst, tokens + (now - updated) * self.rate)
+
+    def _wait(self, available: float, tokens: int) -> float:
+        return max(0.0, (min(tokens, self.burst) - available) / self.rate)
+
+    def _store(self, key: Hashable, tokens: float, now: float) -> None:
+        self._buckets.pop(key, None)
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+
+class BallotRateLimiter:
+    """
+    Limits ballot submissions per participant and per client address, one
+    token per ballot.
+    """
+
+    def __init__(self, participant: TokenBucketLimiter, client: TokenBucketLimiter):
+        self.participant = participant
+        self.client = client
+        # Checking and taking from both limiters is one step
+        self._lock = threading.Lock()
+
+    def check(self, participant_ids: Iterable[int], client_host: str | None) -> None:
+        """
+        Charge a submission of ballots for `participant_ids` to the client and
+        to each participant, or raise RateLimitedError without charging anyone
+        if any of them is over its limit.
+        """
+        ballots: dict[int, int] = {}
+        for participant_id in participant_ids:
+            ballots[participant_id] = ballots.get(participant_id, 0) + 1
+        total = sum(ballots.values())
+        with self._lock:
+            wait = max(
+                [
+                    self.client.wait(client_host, total),
+                    *(self.participant.wait(key, n) for key, n in ballots.items()),
+                ]
+            )
+            if not wait:
+                self.client.take(client_host, total)
+                for key, count in ballots.items():
+                    self.participant.take(key, count)
+        if wait:
+            requests_rejected.inc("rate_limited")
+            raise RateLimitedError(
+                "Too many ballots submitted, retry later", retry_after=wait
+            )
+
+
+@lru_cache
+def get_ballot_rate_limiter() -> BallotRateLimiter | None:
+    """
+    Return the process-wide ballot rate limiter, or None when it is disabled.
+    """
+    settings = get_settings()
+    if not settings.ballot_rate_limit_enabled:
+        return None
+    return BallotRateLimiter(
+        participant=TokenBucketLimiter(
+            settings.ballot_rate_per_participant, settings.ballot_burst_per_participant
+        ),
+        client=TokenBucketLimiter(
+            settings.ballot_rate_per_client, settings.ballot_burst_per_client
+        ),
+    )
+
+
+def limit_ballot_rate(request: Request, participant_ids: Iterable[int]) -> None:
+    """
+    Enforce the ballot rate limits, if enabled, for a submission of ballots
+    for `participant_ids` from the client of `request`.
+    """
+    limiter = get_ballot_rate_limiter()
+    if limiter is not None:
+        client_host = request.client.host if request.client else None
+        limiter.check(participant_ids, client_host)
+
+
+def retry_after_header(seconds: float) -> dict[str, str]:
+    """Retry-After header for a wait of `seconds`, rounded up to whole seconds."""
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
+
+
+class LoadSheddingMiddleware:
+    """
+    ASGI middleware answering 503 while `max_in_flight` requests are already
+    being served, instead of letting them queue on the connection pool.
+    """
+
+    def __init__(self, app, max_in_flight: int, retry_after: float = 1.0):
+        self.app = app
+        self.max_in_flight = max_in_flight
+        self.retry_after = retry_after
+        # Only touched on the event loop thread, so no lock is needed
+        self.in_flight = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in UNSHED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        if self.in_flight >= self.max_in_flight:
+            requests_rejected.inc("overloaded")
+            response = JSONResponse(
+                {"detail": "Service overloaded, retry later"},
+                status_code=503,
+                headers=retry_after_header(self.retry_after),
+            )
+            await response(scope, receive, send)
+            return
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
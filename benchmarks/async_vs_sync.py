@@ -0,0 +1,122 @@
+"""
+Compare requests/sec of the sync and async endpoint stacks under high concurrency.
+
+Usage:
+    python -m benchmarks.async_vs_sync --requests 5000 --concurrency 1000
+
+Both stacks are served in-process over ASGI against the same temporary SQLite
+file and answer GET /participants/{id}. Prints one JSON object per mode.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.v1 import async_participant_endpoints, participant_endpoints
+from app.data_access_layer.database import Base, async_url, get_async_db, get_db
+from app.data_access_layer.models import Participant
+
+
+def build_sync_app(db_url: str, pool_size: int) -> FastAPI:
+    # Sync handlers are already capped by the thread pool; an unbounded overflow
+    # keeps threads waiting for a connection from starving session teardown.
+    engine = create_engine(db_url, pool_size=pool_size, max_overflow=-1)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(participant_endpoints.router, prefix="/participants")
+    app.dependency_overrides[get_db] = override_get_db
+    return app
+
+
+def build_async_app(db_url: str, pool_size: int) -> FastAPI:
+    engine = create_async_engine(
+        async_url(db_url), pool_size=pool_size, max_overflow=0, pool_timeout=300
+    )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_participant_endpoints.router, prefix="/participants")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return app
+
+
+async def drive(app: FastAPI, requests: int, concurrency: int, rows: int) -> dict:
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                resp = await client.get(f"/participants/{random.randint(1, rows)}")
+                resp.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "requests_per_sec": requests / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--pool-size", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(db_url)
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.execute(
+                insert(Participant),
+                [{"name": f"P{i}", "email": f"p{i}@x.com"} for i in range(args.rows)],
+            )
+            session.commit()
+        engine.dispose()
+
+        for mode, build in (("sync", build_sync_app), ("async", build_async_app)):
+            app = build(db_url, args.pool_size)
+            result = asyncio.run(drive(app, args.requests, args.concurrency, args.rows))
+            print(json.dumps({"mode": mode, **result}))
+
+
+if __name__ == "__main__":
+    main()
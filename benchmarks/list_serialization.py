@@ -0,0 +1,94 @@
+"""
+Benchmark list serialization: ORM objects through the response model versus plain
+column rows encoded straight to JSON.
+
+Usage:
+    python -m benchmarks.list_serialization --rows 10000 --limit 100
+
+Pages through participants with `list_page` and validates them with the
+List[Participant] response model, as the list endpoint does by default, then with
+`list_page_rows` and `encode_rows` (the FAST_LIST_RESPONSES path), with and
+without orjson. Prints one JSON object per mode with rows/sec.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.api.v1 import fast_json
+from app.api.v1.schemas.participant import Participant as ParticipantSchema
+from app.business_logic.participant_service import ParticipantService
+from app.data_access_layer.database import Base
+from app.data_access_layer.models import Participant
+
+
+def orm_page(service: ParticipantService, adapter: TypeAdapter, cursor, limit):
+    items, cursor = service.list_page(cursor=cursor, limit=limit)
+    # What FastAPI does with a response_model: validate, then encode
+    content = jsonable_encoder(adapter.validate_python(items, from_attributes=True))
+    json.dumps(content).encode()
+    return len(items), cursor
+
+
+def fast_page(service: ParticipantService, fields, cursor, limit):
+    rows, cursor = service.list_page_rows(fields, cursor=cursor, limit=limit)
+    fast_json.encode_rows(rows, ParticipantSchema)
+    return len(rows), cursor
+
+
+def run(session: Session, mode: str, limit: int) -> dict:
+    service = ParticipantService(session)
+    adapter = TypeAdapter(List[ParticipantSchema])
+    fields, _ = fast_json.response_fields(ParticipantSchema)
+    rows, cursor = 0, None
+    started = time.perf_counter()
+    while True:
+        if mode == "response_model":
+            count, cursor = orm_page(service, adapter, cursor, limit)
+        else:
+            count, cursor = fast_page(service, fields, cursor, limit)
+        rows += count
+        session.expunge_all()
+        if cursor is None:
+            break
+    elapsed = time.perf_counter() - started
+    return {"mode": mode, "rows": rows, "limit": limit, "rows_per_sec": rows / elapsed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.execute(
+                insert(Participant),
+                [{"name": f"P{i}", "email": f"p{i}@x.com"} for i in range(args.rows)],
+            )
+            session.commit()
+
+            orjson = fast_json.orjson
+            modes = [("response_model", orjson), ("fast_json", None)]
+            if orjson is not None:
+                modes.append(("fast_orjson", orjson))
+            for mode, encoder in modes:
+                fast_json.orjson = encoder
+                print(json.dumps(run(session, mode, args.limit)))
+            fast_json.orjson = orjson
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
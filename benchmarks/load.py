@@ -0,0 +1,237 @@
+"""
+Load and latency benchmark suite for the API.
+
+Usage:
+    python -m benchmarks.load --participants 10000 --ballots 100000
+    python -m benchmarks.load --scenarios ballot_storm daily_draw --output run.json
+    python -m benchmarks.load --baseline run.json --max-regression 0.2
+
+The real application is served in-process over ASGI against a temporary SQLite
+file seeded with `--participants` participants and `--ballots` ballots in
+today's draw, plus yesterday's drawn draw for `daily-draw` to return. Each
+scenario prints one JSON object with its throughput and p50/p95/p99
+latencies. With --baseline the run is compared with an earlier
+--output file and the script exits with status 1 if a scenario got slower or
+lost throughput by more than --max-regression.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import httpx
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.business_logic.draw_cache import current_draw_cache
+from app.business_logic.draw_service import lottery_today
+from app.config import Settings
+from app.data_access_layer.database import Base, create_tuned_engine, get_db
+from app.data_access_layer.models import Ballot, Draw, Participant
+from app.main import app
+
+
+@dataclass
+class Scenario:
+    """
+    A request mix: `request` issues one request, `reset` (if any) runs untimed
+    before each one. Scenarios with a reset run one request at a time.
+    """
+
+    request: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+    reset: Callable[[], None] | None = None
+
+
+SCENARIOS = ("ballot_storm", "participant_lookup", "list_pagination", "daily_draw")
+
+
+def seed(session_factory: sessionmaker, participants: int, ballots: int) -> int:
+    """Fill a fresh database and return the id of today's draw."""
+    with session_factory() as db:
+        db.execute(
+            insert(Participant),
+            [{"name": f"P{i}", "email": f"p{i}@x.com"} for i in range(participants)],
+        )
+        today = lottery_today()
+        db.execute(
+            insert(Draw), [{"draw_date": today - timedelta(days=1), "winner_id": 1}]
+        )
+        draw_id = db.scalars(
+            insert(Draw).returning(Draw.id), [{"draw_date": today}]
+        ).one()
+        for start in range(0, ballots, 10_000):
+            db.execute(
+                insert(Ballot),
+                [
+                    {
+                        "participant_id": random.randint(1, participants),
+                        "draw_id": draw_id,
+                    }
+                    for _ in range(start, min(start + 10_000, ballots))
+                ],
+            )
+        db.commit()
+    return draw_id
+
+
+def build_scenarios(participants: int) -> dict[str, Scenario]:
+    async def ballot_storm(client: httpx.AsyncClient) -> httpx.Response:
+        participant_id = random.randint(1, participants)
+        return await client.post("/ballots/", json={"participant_id": participant_id})
+
+    async def participant_lookup(client: httpx.AsyncClient) -> httpx.Response:
+        return await client.get(f"/participants/{random.randint(1, participants)}")
+
+    async def list_pagination(client: httpx.AsyncClient) -> httpx.Response:
+        # Jump to a random depth, then fetch the page after it by cursor
+        first = await client.get(
+            "/participants/", params={"skip": random.randint(1, participants)}
+        )
+        cursor = first.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return first
+        return await client.get("/participants/", params={"cursor": cursor})
+
+    async def daily_draw(client: httpx.AsyncClient) -> httpx.Response:
+        # The midnight poll; the winner was drawn by the scheduled job
+        return await client.get("/draws/daily-draw")
+
+    return {
+        "ballot_storm": Scenario(ballot_storm),
+        "participant_lookup": Scenario(participant_lookup),
+        "list_pagination": Scenario(list_pagination),
+        "daily_draw": Scenario(daily_draw),
+    }
+
+
+async def drive(scenario: Scenario, requests: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(1 if scenario.reset else concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def one() -> None:
+            nonlocal errors
+            async with semaphore:
+                if scenario.reset:
+                    scenario.reset()
+                started = time.perf_counter()
+                resp = await scenario.request(client)
+                latencies.append(time.perf_counter() - started)
+                if resp.is_error:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": requests,
+        "concurrency": 1 if scenario.reset else concurrency,
+        "errors": errors,
+        "requests_per_sec": requests / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p95_ms": quantiles[94] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+    }
+
+
+def regressions(
+    results: list[dict], baseline: list[dict], max_regression: float
+) -> list[str]:
+    """
+    Describe every scenario whose p95 latency grew, or whose throughput fell,
+    by more than the fraction `max_regression` relative to `baseline`.
+    """
+    previous = {result["scenario"]: result for result in baseline}
+    found = []
+    for result in results:
+        before = previous.get(result["scenario"])
+        if before is None:
+            continue
+        if result["p95_ms"] > before["p95_ms"] * (1 + max_regression):
+            found.append(
+                f"{result['scenario']}: p95 {before['p95_ms']:.2f} ms"
+                f" -> {result['p95_ms']:.2f} ms"
+            )
+        if result["requests_per_sec"] < before["requests_per_sec"] * (
+            1 - max_regression
+        ):
+            found.append(
+                f"{result['scenario']}: {before['requests_per_sec']:.0f} req/s"
+                f" -> {result['requests_per_sec']:.0f} req/s"
+            )
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--participants", type=int, default=10_000)
+    parser.add_argument("--ballots", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write the results here")
+    parser.add_argument("--baseline", type=Path, help="results of an earlier run")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = Settings(db_url=f"sqlite:///{Path(tmp) / 'bench.db'}")
+        engine = create_tuned_engine(settings)
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+        seed(session_factory, args.participants, args.ballots)
+
+        def override_get_db():
+            db: Session = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        current_draw_cache.invalidate()
+        scenarios = build_scenarios(args.participants)
+        try:
+            results = []
+            for name in args.scenarios or SCENARIOS:
+                result = asyncio.run(
+                    drive(scenarios[name], args.requests, args.concurrency)
+                )
+                results.append({"scenario": name, **result})
+                print(json.dumps(results[-1]))
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+            engine.dispose()
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        found = regressions(results, baseline, args.max_regression)
+        for line in found:
+            print(f"regression: {line}", file=sys.stderr)
+        if found:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
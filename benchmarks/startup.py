@@ -0,0 +1,88 @@
+"""
+Measure cold start: time to import the app and time to answer its first request.
+
+Usage:
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --budget-ms 1500
+
+Every run starts a fresh interpreter against a temporary SQLite file and times
+`import app.main`, then the lifespan startup plus a first GET /health. Prints
+the median of each over all runs as JSON and exits with status 1 if the total
+exceeds --budget-ms.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Runs in the child interpreter; reports milliseconds as JSON on stdout
+PROBE = """
+import json, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app.main.app) as client:
+    client.get("/health").raise_for_status()
+    answered = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_request_ms": (answered - imported) * 1000,
+}))
+"""
+
+
+def measure(db_url: str) -> dict:
+    env = {**os.environ, "DB_URL": db_url, "SCHEDULER_MODE": "local"}
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, help="fail above this total")
+    args = parser.parse_args()
+
+    runs = []
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory() as tmp:
+            runs.append(measure(f"sqlite:///{Path(tmp) / 'bench.db'}"))
+
+    import_ms = statistics.median(run["import_ms"] for run in runs)
+    first_request_ms = statistics.median(run["first_request_ms"] for run in runs)
+    total_ms = statistics.median(
+        run["import_ms"] + run["first_request_ms"] for run in runs
+    )
+    print(
+        json.dumps(
+            {
+                "runs": args.runs,
+                "import_ms": import_ms,
+                "first_request_ms": first_request_ms,
+                "total_ms": total_ms,
+                "budget_ms": args.budget_ms,
+            }
+        )
+    )
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(
+            f"startup took {total_ms:.0f} ms, budget is {args.budget_ms:.0f} ms",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
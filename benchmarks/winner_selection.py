@@ -0,0 +1,94 @@
+"""
+Benchmark winner selection latency and memory as the number of ballots grows.
+
+Usage:
+    python -m benchmarks.winner_selection --sizes 10000 100000 1000000
+
+Prints one JSON object per (size, selector) pair. "legacy" loads every ballot
+of the draw as an ORM object and calls `secrets.choice`, as `daily_draw` used to.
+"""
+
+import argparse
+import json
+import secrets
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.business_logic.winner_selector import WINNER_SELECTORS
+from app.data_access_layer.database import Base
+from app.data_access_layer.general_repository import GeneralRepository
+from app.data_access_layer.models import Ballot, Draw
+
+
+def seed(session: Session, ballots: int, participants: int = 1000) -> int:
+    """Create one draw holding `ballots` ballots and return its id."""
+    draw = Draw(draw_date=date.today())
+    session.add(draw)
+    session.flush()
+    batch = 50_000
+    for start in range(0, ballots, batch):
+        rows = [
+            {"participant_id": i % participants + 1, "draw_id": draw.id}
+            for i in range(start, min(start + batch, ballots))
+        ]
+        session.execute(insert(Ballot), rows)
+    session.commit()
+    return draw.id
+
+
+def legacy_select(repo: GeneralRepository[Ballot], draw_id: int) -> int:
+    ballots = list(repo.db.scalars(select(Ballot).filter_by(draw_id=draw_id)))
+    return secrets.choice(ballots).participant_id
+
+
+def measure(select_winner, repo, draw_id: int, repeat: int) -> dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        select_winner(repo, draw_id)
+        repo.db.expunge_all()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"latency_ms": elapsed / repeat * 1000, "peak_memory_kb": peak / 1024}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--legacy-limit",
+        type=int,
+        default=100_000,
+        help="largest size the legacy full-load selection is run for",
+    )
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+            Base.metadata.create_all(engine)
+            with Session(engine) as session:
+                draw_id = seed(session, size)
+                repo = GeneralRepository(session, Ballot)
+                candidates = {
+                    name: selector_class().select
+                    for name, selector_class in WINNER_SELECTORS.items()
+                }
+                if size <= args.legacy_limit:
+                    candidates["legacy"] = legacy_select
+                for name, select_winner in candidates.items():
+                    result = measure(select_winner, repo, draw_id, args.repeat)
+                    print(json.dumps({"ballots": size, "selector": name, **result}))
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.api.v1 import (
+    async_ballot_endpoints,
+    async_draw_endpoints,
+    async_participant_endpoints,
+)
+from app.business_logic.draw_service import DrawService, closed_draw_date
+from app.config import get_settings
+from app.data_access_layer import migrations
+from app.data_access_layer.database import async_url, get_async_db
+from app.data_access_layer.models import Ballot, Draw
+from app.main import app
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_engine(db_url)
+    migrations.upgrade(sync_engine)
+    sync_engine.dispose()
+    engine = create_async_engine(async_url(db_url), poolclass=NullPool)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    async_app = FastAPI(exception_handlers=app.exception_handlers)
+    async_app.include_router(async_participant_endpoints.router, prefix="/participants")
+    async_app.include_router(async_draw_endpoints.router, prefix="/draws")
+    async_app.include_router(async_ballot_endpoints.router, prefix="/ballots")
+    async_app.dependency_overrides[get_async_db] = override_get_async_db
+    with TestClient(async_app) as client:
+        yield client
+
+
+def test_participant_crud_flow(async_client):
+    resp = async_client.post("/participants/", json={"name": "A", "email": "a@x.com"})
+    assert resp.status_code == status.HTTP_200_OK
+    pid = resp.json()["id"]
+
+    dup = async_client.post("/participants/", json={"name": "B", "email": "a@x.com"})
+    assert dup.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    resp = async_client.patch(f"/participants/{pid}", json={"email": "b@x.com"})
+    assert resp.json()["email"] == "b@x.com"
+    assert [p["id"] for p in async_client.get("/participants/").json()] == [pid]
+    assert "X-Next-Cursor" in async_client.get("/participants/?limit=1").headers
+
+    assert async_client.delete(f"/participants/{pid}").status_code == 200
+    resp = async_client.get(f"/participants/{pid}")
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_ballots_and_daily_draw(async_client):
+    resp = async_client.post("/ballots/", json={"participant_id": 1})
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    draw = async_client.post("/draws/", json={}).json()
+    ballot = async_client.post("/ballots/", json={"participant_id": 3}).json()
+    assert ballot["draw_id"] == draw["id"]
+    assert async_client.get(f"/ballots/{ballot['id']}").json() == ballot
+
+    # The open draw is not drawn by requests
+    resp = async_client.get("/draws/daily-draw")
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    async_client.post("/ballots/", json={"participant_id": 4})
+    odds = async_client.get("/participants/3/odds").json()
+    assert (odds["ballots"], odds["total_ballots"]) == (1, 2)
+    assert async_client.get("/draws/current/odds").json()["participants"] == 2
+
+
+def test_daily_draw(async_client, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'async.db'}")
+    with Session(engine) as db:
+        closed = Draw(draw_date=closed_draw_date())
+        db.add_all([closed, Ballot(participant_id=3, draw=closed)])
+        db.commit()
+        DrawService(db).draw_winner(closed.draw_date)
+    engine.dispose()
+
+    resp = async_client.get("/draws/daily-draw")
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["winner_id"] == 3
+
+
+def test_fast_list_responses(async_client, monkeypatch):
+    for i in range(3):
+        async_client.post("/participants/", json={"name": f"P{i}", "email": f"{i}@x"})
+    async_client.post("/draws/", json={})
+    regular = [async_client.get(path).json() for path in ("/participants/", "/draws/")]
+
+    monkeypatch.setattr(get_settings(), "fast_list_responses", True)
+    fast = [async_client.get(path).json() for path in ("/participants/", "/draws/")]
+    assert fast == regular
+
+    page = async_client.get("/participants/?limit=2")
+    cursor = page.headers["X-Next-Cursor"]
+    rest = async_client.get(f"/participants/?limit=2&cursor={cursor}").json()
+    assert [p["id"] for p in rest] == [3]
+
+
+def test_export_ballots(async_client, monkeypatch):
+    draw = async_client.post("/draws/", json={}).json()
+    for pid in (1, 2, 3):
+        async_client.post("/ballots/", json={"participant_id": pid})
+
+    monkeypatch.setattr(get_settings(), "export_batch_size", 2)
+    resp = async_client.get(f"/draws/{draw['id']}/ballots/export?format=csv")
+    lines = resp.text.splitlines()
+    assert lines[0] == "id,participant_id,draw_id,timestamp"
+    assert [line.split(",")[1] for line in lines[1:]] == ["1", "2", "3"]
+
+    resp = async_client.get("/draws/42/ballots/export")
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_create_with_idempotency_key(async_client):
+    headers = {"Idempotency-Key": "retry-1"}
+    payload = {"name": "A", "email": "a@x.com"}
+    first = async_client.post("/participants/", json=payload, headers=headers)
+    retry = async_client.post("/participants/", json=payload, headers=headers)
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert len(async_client.get("/participants/").json()) == 1
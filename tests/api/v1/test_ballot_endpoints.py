@@ -0,0 +1,125 @@
+import json
+
+from fastapi import status
+
+from app.config import get_settings
+
+
+def add_participants(client, count):
+    for i in range(count):
+        client.post("/participants/", json={"name": f"P{i}", "email": f"p{i}@x.com"})
+
+
+def test_bulk_without_draw(client):
+    resp = client.post("/ballots/bulk", json=[{"participant_id": 1}])
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_bulk_json_array(client):
+    draw = client.post("/draws/", json={}).json()
+    add_participants(client, 2)
+    items = [
+        {"participant_id": 1},
+        {"participant_id": "x"},
+        {"participant_id": 2},
+        {"participant_id": 404},
+    ]
+    resp = client.post("/ballots/bulk", json=items)
+    assert resp.status_code == status.HTTP_200_OK
+    data = resp.json()
+    assert data["created"] == 2 and data["failed"] == 2
+    assert [item["index"] for item in data["items"]] == [0, 1, 2, 3]
+    assert data["items"][1]["id"] is None
+    assert "participant_id" in data["items"][1]["error"]
+    assert data["items"][3] == {
+        "index": 3,
+        "id": None,
+        "error": "Participant 404 not found",
+    }
+
+    created = client.get(f"/ballots/{data['items'][2]['id']}").json()
+    assert created["participant_id"] == 2
+    assert created["draw_id"] == draw["id"]
+
+
+def test_bulk_ndjson(client):
+    client.post("/draws/", json={})
+    add_participants(client, 1)
+    body = "\n".join(
+        [json.dumps({"participant_id": 1}), "{not json", "", json.dumps({})]
+    )
+    resp = client.post(
+        "/ballots/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    data = resp.json()
+    assert data["created"] == 1 and data["failed"] == 2
+    assert data["items"][0]["id"] is not None
+    assert "Invalid JSON" in data["items"][1]["error"]
+    assert "Field required" in data["items"][2]["error"]
+
+
+def test_bulk_rejects_non_array(client):
+    client.post("/draws/", json={})
+    resp = client.post("/ballots/bulk", json={"participant_id": 1})
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_bulk_rejects_oversized_body(client, monkeypatch):
+    client.post("/draws/", json={})
+    add_participants(client, 1)
+    monkeypatch.setattr(get_settings(), "ballot_bulk_max_bytes", 64)
+    resp = client.post("/ballots/bulk", json=[{"participant_id": 1}] * 10)
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "64 bytes" in resp.json()["detail"]
+
+    # Streamed without a Content-Length, it is cut off while received
+    body = (json.dumps({"participant_id": 1}).encode() + b"\n" for _ in range(10))
+    resp = client.post(
+        "/ballots/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert client.get("/ballots/").json() == []
+
+
+def test_list_with_cursor(client):
+    client.post("/draws/", json={})
+    add_participants(client, 5)
+    client.post("/ballots/bulk", json=[{"participant_id": i} for i in range(1, 6)])
+
+    resp = client.get("/ballots/?limit=2")
+    assert [b["participant_id"] for b in resp.json()] == [1, 2]
+    cursor = resp.headers["X-Next-Cursor"]
+    resp = client.get(f"/ballots/?limit=2&cursor={cursor}")
+    assert [b["participant_id"] for b in resp.json()] == [3, 4]
+    resp = client.get(f"/ballots/?limit=2&cursor={resp.headers['X-Next-Cursor']}")
+    assert [b["participant_id"] for b in resp.json()] == [5]
+    assert "X-Next-Cursor" not in resp.headers
+
+    # offset pagination keeps working
+    resp = client.get("/ballots/?skip=3&limit=10")
+    assert [b["participant_id"] for b in resp.json()] == [4, 5]
+
+    resp = client.get("/ballots/?cursor=garbage")
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_create_with_idempotency_key(client):
+    headers = {"Idempotency-Key": "retry-1"}
+    # A failed attempt does not consume the key
+    resp = client.post("/ballots/", json={"participant_id": 1}, headers=headers)
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    client.post("/draws/", json={})
+    first = client.post("/ballots/", json={"participant_id": 1}, headers=headers)
+    retry = client.post("/ballots/", json={"participant_id": 1}, headers=headers)
+    assert retry.status_code == status.HTTP_200_OK
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert len(client.get("/ballots/").json()) == 1
+
+    resp = client.post("/ballots/", json={"participant_id": 2}, headers=headers)
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,255 @@
+import json
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import WebSocketDisconnect, status
+
+from app.business_logic.draw_events import DrawEvent, get_draw_events
+from app.business_logic.draw_service import (
+    DrawService,
+    closed_draw_date,
+    lottery_today,
+)
+from app.config import get_settings
+from app.data_access_layer.models import Ballot, Draw, Participant
+
+
+def draw_tonight(db_session):
+    # What the midnight job does once today's draw closes
+    return DrawService(db_session).draw_winner(lottery_today())
+
+
+def test_daily_draw(client, db_session):
+    resp = client.get("/draws/daily-draw")
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    pid = client.post("/participants/", json={"name": "W", "email": "w@x.com"})
+    pid = pid.json()["id"]
+    closed = Draw(draw_date=closed_draw_date())
+    db_session.add_all([closed, Ballot(participant_id=pid, draw=closed)])
+    db_session.commit()
+    # Requests never draw the winner themselves
+    resp = client.get("/draws/daily-draw")
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert "not been drawn" in resp.json()["detail"]
+
+    DrawService(db_session).draw_winner(closed.draw_date)
+    resp = client.get("/draws/daily-draw")
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["id"] == closed.id
+    assert resp.json()["winner_id"] == pid
+
+
+def test_open_draw_is_cached_briefly(client, db_session):
+    draw = client.post("/draws/", json={}).json()
+
+    resp = client.get(f"/draws/{draw['id']}")
+    etag = resp.headers["ETag"]
+    assert resp.headers["Cache-Control"] == "public, max-age=5"
+    assert "Last-Modified" not in resp.headers
+
+    resp = client.get(f"/draws/{draw['id']}", headers={"If-None-Match": etag})
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+    assert resp.headers["ETag"] == etag
+    assert resp.content == b""
+
+    pid = client.post("/participants/", json={"name": "W", "email": "w@x.com"})
+    client.post("/ballots/", json={"participant_id": pid.json()["id"]})
+    draw_tonight(db_session)
+    resp = client.get(f"/draws/{draw['id']}", headers={"If-None-Match": etag})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["ETag"] != etag
+
+
+def test_finalized_draw_is_immutable(client, db_session):
+    winner = Participant(name="W", email="w@x.com")
+    draw = Draw(draw_date=date(2024, 5, 1), winner=winner)
+    db_session.add(draw)
+    db_session.commit()
+
+    resp = client.get(f"/draws/{draw.id}")
+    assert resp.headers["Cache-Control"] == "public, max-age=86400, immutable"
+    assert resp.headers["Last-Modified"].endswith("GMT")
+
+    etag = f'W/{resp.headers["ETag"]}, "other"'
+    resp = client.get(f"/draws/{draw.id}", headers={"If-None-Match": etag})
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+    assert resp.headers["Cache-Control"].endswith("immutable")
+
+
+def test_list_page_etag(client, db_session):
+    client.post("/draws/", json={})
+    resp = client.get("/draws/")
+    etag = resp.headers["ETag"]
+
+    resp = client.get("/draws/", headers={"If-None-Match": etag})
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+
+    pid = client.post("/participants/", json={"name": "W", "email": "w@x.com"})
+    client.post("/ballots/", json={"participant_id": pid.json()["id"]})
+    draw_tonight(db_session)
+    resp = client.get("/draws/", headers={"If-None-Match": etag})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()[0]["winner_id"] == pid.json()["id"]
+
+
+@pytest.fixture
+def draw_with_ballots(db_session):
+    participants = [Participant(name=f"P{i}", email=f"p{i}@x.com") for i in range(3)]
+    draw = Draw(draw_date=date(2024, 5, 1))
+    db_session.add(draw)
+    db_session.add_all(
+        Ballot(participant=participant, draw=draw, timestamp=datetime(2024, 5, 1, 9))
+        for participant in participants
+    )
+    # A ballot of another draw stays out of the export
+    db_session.add(
+        Ballot(participant=participants[0], draw=Draw(draw_date=date.today()))
+    )
+    db_session.commit()
+    return draw
+
+
+def test_export_ballots_ndjson(client, draw_with_ballots, monkeypatch):
+    monkeypatch.setattr(get_settings(), "export_batch_size", 2)
+    resp = client.get(f"/draws/{draw_with_ballots.id}/ballots/export")
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["Content-Type"] == "application/x-ndjson"
+    assert 'filename="draw-1-ballots.ndjson"' in resp.headers["Content-Disposition"]
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [row["id"] for row in rows] == [1, 2, 3]
+    assert rows[0] == {
+        "id": 1,
+        "participant_id": 1,
+        "draw_id": 1,
+        "timestamp": "2024-05-01T09:00:00",
+    }
+
+
+def test_export_ballots_csv_gzip(client, draw_with_ballots):
+    resp = client.get(
+        f"/draws/{draw_with_ballots.id}/ballots/export?format=csv&gzip=true"
+    )
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Content-Type"].startswith("text/csv")
+    # httpx decompresses transparently
+    lines = resp.text.splitlines()
+    assert lines[0] == "id,participant_id,draw_id,timestamp"
+    assert lines[1] == "1,1,1,2024-05-01T09:00:00"
+    assert len(lines) == 4
+
+
+def test_export_ballots_of_missing_draw(client):
+    resp = client.get("/draws/42/ballots/export")
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_draw_results(client, db_session, monkeypatch):
+    monkeypatch.setattr(get_settings(), "draw_prize_tiers", {"grand": 1, "second": 1})
+    draw = client.post("/draws/", json={}).json()
+    assert client.get(f"/draws/{draw['id']}/results").json() == []
+
+    for pid in (1, 2):
+        client.post("/ballots/", json={"participant_id": pid})
+    winner_id = draw_tonight(db_session).winner_id
+    results = client.get(f"/draws/{draw['id']}/results").json()
+    assert results[0] == {"rank": 1, "tier": "grand", "participant_id": winner_id}
+    assert results[1]["tier"] == "second"
+    assert results[1]["participant_id"] == 3 - winner_id
+
+    assert client.get("/draws/42/results").status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.fixture
+def history(db_session):
+    participants = [Participant(name=f"P{i}", email=f"p{i}@x.com") for i in range(3)]
+    draws = [
+        Draw(draw_date=date(2024, 1, 1) + timedelta(days=i), winner=participants[i % 3])
+        for i in range(150)
+    ]
+    db_session.add_all(draws)
+    db_session.flush()
+    db_session.add_all(
+        Ballot(participant=participant, draw=draw)
+        for draw in draws
+        for participant in (participants[0], *participants[: draw.id % 3])
+    )
+    db_session.commit()
+    # Nothing is served from the identity map
+    db_session.expunge_all()
+    return draws
+
+
+def test_draw_history(client, history):
+    resp = client.get("/draws/history?from=2024-01-02&to=2024-01-04")
+    assert [item["draw_date"][:10] for item in resp.json()] == [
+        "2024-01-02",
+        "2024-01-03",
+        "2024-01-04",
+    ]
+    assert resp.json()[0] == {
+        "id": 2,
+        "draw_date": "2024-01-02T00:00:00",
+        "winner": {"id": 2, "name": "P1", "email": "p1@x.com"},
+        "ballots": 3,
+        "participants": 2,
+    }
+
+    page = client.get("/draws/history?limit=100")
+    rest = client.get(f"/draws/history?cursor={page.headers['X-Next-Cursor']}")
+    assert len(page.json()) == 100 and len(rest.json()) == 50
+
+
+def test_draw_history_query_count_is_constant(client, history, db_engine, capture_sql):
+    captured = capture_sql(db_engine)
+    client.get("/draws/history?limit=10")
+    small = len(captured.statements)
+    captured.clear()
+    assert len(client.get("/draws/history?limit=100").json()) == 100
+    assert len(captured.statements) == small <= 2
+
+
+def test_current_draw_odds(client):
+    assert client.get("/draws/current/odds").status_code == 404
+
+    draw = client.post("/draws/", json={}).json()
+    for pid in (1, 1, 2):
+        client.post("/ballots/", json={"participant_id": pid})
+    resp = client.get("/draws/current/odds")
+    assert resp.json() == {"draw_id": draw["id"], "ballots": 3, "participants": 2}
+
+
+def publish_when_subscribed(event):
+    # The request blocks the test thread; deliver the result from another one
+    def deliver():
+        while not get_draw_events().subscriber_count():
+            time.sleep(0.01)
+        get_draw_events().publish(event)
+        get_draw_events().close_all()
+
+    thread = threading.Thread(target=deliver)
+    thread.start()
+    return thread
+
+
+def test_draw_event_stream(client):
+    get_draw_events().publish(DrawEvent(1, '{"id":1}'))
+    thread = publish_when_subscribed(DrawEvent(2, '{"id":2}'))
+    resp = client.get("/draws/events", headers={"Last-Event-ID": "1"})
+    thread.join()
+
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.text == 'id: 2\nevent: draw-result\ndata: {"id":2}\n\n'
+
+
+def test_draw_event_socket(client):
+    get_draw_events().publish(DrawEvent(1, '{"id":1}'))
+    with client.websocket_connect("/draws/events/ws") as websocket:
+        assert websocket.receive_json() == {"id": 1}
+        get_draw_events().publish(DrawEvent(2, '{"id":2}'))
+        assert websocket.receive_json() == {"id": 2}
+        get_draw_events().close_all()
+        with pytest.raises(WebSocketDisconnect):
+            websocket.receive_text()
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from app.api.v1 import fast_json
+from app.config import get_settings
+
+
+@pytest.fixture
+def seeded(client):
+    for i in range(5):
+        client.post("/participants/", json={"name": f"P{i}", "email": f"p{i}@x.com"})
+    client.post("/draws/", json={})
+    for pid in (1, 2, 3, 2):
+        client.post("/ballots/", json={"participant_id": pid})
+    return client
+
+
+def fetch(client, path, params):
+    resp = client.get(path, params=params)
+    assert resp.status_code == 200
+    # Compare items with their key order, as clients see them
+    items = [list(item.items()) for item in json.loads(resp.content)]
+    return items, resp.headers.get("X-Next-Cursor")
+
+
+PAGES = [
+    ("/participants/", {"limit": 2}),
+    ("/participants/", {"skip": 2, "limit": 2}),
+    ("/draws/", {}),
+    ("/ballots/", {"limit": 3}),
+]
+
+
+@pytest.mark.parametrize("path,params", PAGES)
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_fast_path_matches_response_model(
+    seeded, monkeypatch, path, params, use_orjson
+):
+    regular = fetch(seeded, path, params)
+
+    monkeypatch.setattr(get_settings(), "fast_list_responses", True)
+    if not use_orjson:
+        monkeypatch.setattr(fast_json, "orjson", None)
+
+    assert fetch(seeded, path, params) == regular
+
+
+def test_fast_path_follows_cursor(seeded, monkeypatch):
+    monkeypatch.setattr(get_settings(), "fast_list_responses", True)
+    first = seeded.get("/participants/", params={"limit": 3})
+    cursor = first.headers["X-Next-Cursor"]
+    second = seeded.get("/participants/", params={"limit": 3, "cursor": cursor})
+
+    assert [p["id"] for p in first.json()] == [1, 2, 3]
+    assert [p["id"] for p in second.json()] == [4, 5]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_fast_path_draw_pages_are_conditional(seeded, monkeypatch):
+    monkeypatch.setattr(get_settings(), "fast_list_responses", True)
+    etag = seeded.get("/draws/").headers["ETag"]
+
+    resp = seeded.get("/draws/", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["Cache-Control"] == "public, max-age=5"
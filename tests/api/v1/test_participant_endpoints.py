@@ -51,3 +51,32 @@ def test_errors(client):
     pid = resp.json()["id"]
     bad = client.patch(f"/participants/{pid}", json={"email": 123})
     assert bad.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_import(client):
+    client.post("/participants/", json={"name": "Old", "email": "old@example.com"})
+    body = "name,email\nA,a@example.com\nOld,old@example.com\nNo email,\n"
+    resp = client.post(
+        "/participants/import", content=body, headers={"Content-Type": "text/csv"}
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json() == {"created": 1, "duplicates": 1, "invalid": 1}
+
+    body = '{"name": "B", "email": "b@example.com"}\n'
+    resp = client.post("/participants/import?format=ndjson", content=body)
+    assert resp.json() == {"created": 1, "duplicates": 0, "invalid": 0}
+
+    resp = client.post("/participants/import", content=body)
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_participant_odds(client):
+    client.post("/draws/", json={})
+    ballots = [client.post("/ballots/", json={"participant_id": p}) for p in (1, 1, 2)]
+    client.delete(f"/ballots/{ballots[0].json()['id']}")
+
+    resp = client.get("/participants/1/odds")
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["ballots"] == 1
+    assert resp.json()["total_ballots"] == 2
+    assert resp.json()["chance"] == 0.5
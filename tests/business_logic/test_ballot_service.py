@@ -1,7 +1,23 @@
+import asyncio
+
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
 
 from app.exceptions import NotFoundError
-from app.business_logic.ballot_service import BallotService
+from app.business_logic.ballot_service import AsyncBallotService, BallotService
+from app.business_logic.draw_service import DrawService
+from app.data_access_layer import migrations
+from app.data_access_layer.database import async_url
+from app.data_access_layer.general_repository import GeneralRepository
+from app.data_access_layer.models import Participant
+
+
+def add_participants(db, count):
+    GeneralRepository(db, Participant).add_many(
+        [{"name": f"P{i}", "email": f"p{i}@x.com"} for i in range(count)]
+    )
 
 
 @pytest.fixture
@@ -14,3 +30,74 @@ def test_create_without_draw(service):
     with pytest.raises(NotFoundError) as exc:
         service.create(data)
     assert "has not been created" in str(exc.value)
+
+
+def test_create_many(service, db_session):
+    draw = DrawService(db_session).create(draw_data={})
+    add_participants(db_session, 2)
+    ids = service.create_many(
+        [{"participant_id": 1}, {"participant_id": 404}, {"participant_id": 2}]
+    )
+    assert ids[1] is None  # unknown participant, left out
+    ballots = [service.get(ids[0]), service.get(ids[2])]
+    assert [ballot.participant_id for ballot in ballots] == [1, 2]
+    assert all(ballot.draw_id == draw.id for ballot in ballots)
+    assert service.create_many([]) == []
+
+
+def test_create_uses_cached_draw(service, db_session, capture_sql):
+    draw_service = DrawService(db_session)
+    draw_id = draw_service.create(draw_data={}).id
+    captured = capture_sql(db_session.get_bind())
+    ballot = service.create({"participant_id": 1})
+    assert not any("FROM draws" in statement for statement in captured.statements)
+    assert ballot.draw_id == draw_id
+
+    # deleting the draw invalidates the cache
+    draw_service.delete(draw_id)
+    with pytest.raises(NotFoundError):
+        service.create({"participant_id": 1})
+
+
+def test_export_outlives_the_request_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+    migrations.upgrade(engine)
+    db = Session(engine)
+    draw = DrawService(db).create(draw_data={})
+    add_participants(db, 2)
+    BallotService(db).create_many([{"participant_id": 1}, {"participant_id": 2}])
+
+    rows = BallotService(db).export_rows(draw.id, fields=("participant_id",))
+    db.close()  # as the request ends before the response body is sent
+    assert [row.participant_id for row in rows] == [1, 2]
+    assert engine.pool.checkedout() == 0
+
+    # A client going away mid-stream also returns the connection
+    rows = BallotService(db).export_rows(draw.id)
+    db.close()
+    next(rows)
+    rows.close()
+    assert engine.pool.checkedout() == 0
+    engine.dispose()
+
+
+def test_async_export_outlives_the_request_session(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'export.db'}"
+    sync_engine = create_engine(db_url)
+    migrations.upgrade(sync_engine)
+    with Session(sync_engine) as db:
+        draw_id = DrawService(db).create(draw_data={}).id
+        add_participants(db, 1)
+        BallotService(db).create_many([{"participant_id": 1}])
+    sync_engine.dispose()
+    engine = create_async_engine(async_url(db_url))
+
+    async def export():
+        async with AsyncSession(engine) as db:
+            rows = await AsyncBallotService(db).export_rows(draw_id)
+        exported = [row.participant_id async for row in rows]
+        checked_out = engine.pool.checkedout()
+        await engine.dispose()
+        return exported, checked_out
+
+    assert asyncio.run(export()) == ([1], 0)
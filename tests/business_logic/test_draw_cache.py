@@ -0,0 +1,20 @@
+from datetime import date
+
+from app.business_logic.draw_cache import CurrentDrawCache
+
+
+def test_keyed_by_date():
+    cache = CurrentDrawCache(ttl=60)
+    assert cache.get(date(2025, 1, 1)) is None
+    cache.set(date(2025, 1, 1), 7)
+    assert cache.get(date(2025, 1, 1)) == 7
+    # midnight rollover: another date is a miss
+    assert cache.get(date(2025, 1, 2)) is None
+    cache.invalidate()
+    assert cache.get(date(2025, 1, 1)) is None
+
+
+def test_expires_after_ttl():
+    cache = CurrentDrawCache(ttl=0)
+    cache.set(date(2025, 1, 1), 7)
+    assert cache.get(date(2025, 1, 1)) is None
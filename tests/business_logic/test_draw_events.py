@@ -0,0 +1,99 @@
+import asyncio
+import json
+import threading
+from datetime import date
+
+from app.business_logic.draw_events import DrawEvent, DrawEventBroker, draw_event
+from app.data_access_layer.models import Draw, DrawResult
+
+
+async def collect(subscription, count):
+    events = []
+    async for event in subscription.events():
+        events.append(event.id)
+        if len(events) == count:
+            break
+    return events
+
+
+def test_draw_event_encodes_results():
+    draw = Draw(id=3, draw_date=date(2024, 1, 2), winner_id=7)
+    results = [DrawResult(rank=1, tier="grand", participant_id=7)]
+    event = draw_event(draw, results)
+    assert event.id == 3
+    assert json.loads(event.data) == {
+        "id": 3,
+        "draw_date": "2024-01-02",
+        "winner_id": 7,
+        "results": [{"rank": 1, "tier": "grand", "participant_id": 7}],
+    }
+
+
+def test_publish_fans_out_once_per_draw():
+    broker = DrawEventBroker(max_queued=4)
+
+    async def scenario():
+        first, second = broker.subscribe(), broker.subscribe()
+        assert broker.publish(DrawEvent(1, "{}"))
+        assert not broker.publish(DrawEvent(1, "{}"))  # already published
+        assert broker.publish(DrawEvent(2, "{}"))
+        results = await asyncio.gather(collect(first, 2), collect(second, 2))
+        first.close()
+        assert broker.subscriber_count() == 1
+        return results
+
+    assert asyncio.run(scenario()) == [[1, 2], [1, 2]]
+
+
+def test_new_subscribers_get_the_latest_event_unless_seen():
+    broker = DrawEventBroker(max_queued=4)
+    broker.publish(DrawEvent(5, "{}"))
+
+    async def scenario():
+        fresh = broker.subscribe()
+        caught_up = broker.subscribe(last_event_id=5)
+        broker.publish(DrawEvent(6, "{}"))
+        return await collect(fresh, 2), await collect(caught_up, 1)
+
+    assert asyncio.run(scenario()) == ([5, 6], [6])
+
+
+def test_slow_subscriber_keeps_the_newest_events():
+    broker = DrawEventBroker(max_queued=2)
+
+    async def scenario():
+        subscription = broker.subscribe()
+        for draw_id in (1, 2, 3):
+            broker.publish(DrawEvent(draw_id, "{}"))
+        await asyncio.sleep(0)  # let the queued offers run
+        return await collect(subscription, 2)
+
+    assert asyncio.run(scenario()) == [2, 3]
+
+
+def test_publish_from_another_thread_and_close_all():
+    broker = DrawEventBroker(max_queued=4)
+
+    async def scenario():
+        subscription = broker.subscribe()
+        thread = threading.Thread(
+            target=lambda: (broker.publish(DrawEvent(1, "{}")), broker.close_all())
+        )
+        thread.start()
+        events = [event.id async for event in subscription.events()]
+        thread.join()
+        return events
+
+    assert asyncio.run(scenario()) == [1]
+    assert broker.subscriber_count() == 0
+
+
+def test_keepalive_yields_none_when_idle():
+    broker = DrawEventBroker(max_queued=4)
+
+    async def scenario():
+        subscription = broker.subscribe()
+        events = subscription.events(keepalive=0.01)
+        return await events.__anext__()
+
+    assert asyncio.run(scenario()) is None
@@ -1,9 +1,17 @@
 import pytest
 
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 
-from app.exceptions import ValidationError
-from app.business_logic.draw_service import DrawService
+from app.config import get_settings
+from app.exceptions import NotFoundError, ValidationError
+from app.business_logic.ballot_service import BallotService
+from app.business_logic.draw_service import (
+    DrawService,
+    closed_draw_date,
+    lottery_today,
+)
+from app.business_logic.winner_selector import OffsetWinnerSelector
+from app.data_access_layer.models import Ballot, Draw, DrawResult
 
 
 @pytest.fixture
@@ -13,8 +21,104 @@ def service(db_session):
 
 def test_create_and_unique(service):
     r1 = service.create(draw_data={})
-    assert r1.draw_date == datetime.now().date()
+    assert r1.draw_date == lottery_today()
     # duplicate date business rule
     with pytest.raises(ValidationError) as exc:
         service.create(draw_data={})
     assert "already exists" in str(exc.value)
+
+
+def test_draw_winner(service, db_session):
+    draw = service.create(draw_data={})
+    with pytest.raises(NotFoundError):
+        service.draw_winner(draw.draw_date)
+    BallotService(db_session).create({"participant_id": 7})
+    drawn = service.draw_winner(draw.draw_date)
+    assert drawn.winner_id == 7
+    # an existing winner is kept
+    BallotService(db_session).create({"participant_id": 8})
+    assert service.draw_winner(draw.draw_date).winner_id == 7
+
+
+def test_draw_winners_per_tier(service, db_session, monkeypatch):
+    monkeypatch.setattr(
+        get_settings(), "draw_prize_tiers", {"grand": 1, "second": 2, "voucher": 5}
+    )
+    draw = service.create(draw_data={})
+    for participant_id in (1, 2, 2, 3, 4, 4, 4):
+        BallotService(db_session).create({"participant_id": participant_id})
+
+    drawn = service.draw_winner(draw.draw_date)
+    results = service.results(draw.id)
+    # Only four distinct participants hold ballots
+    assert [(r.rank, r.tier) for r in results] == [
+        (1, "grand"),
+        (2, "second"),
+        (3, "second"),
+        (4, "voucher"),
+    ]
+    assert sorted(r.participant_id for r in results) == [1, 2, 3, 4]
+    assert drawn.winner_id == results[0].participant_id
+
+    # Drawing again keeps the results
+    service.draw_winner(draw.draw_date)
+    assert len(service.results(draw.id)) == 4
+
+
+def test_draw_winner_raced_by_another_process(service, db_session):
+    draw = service.create(draw_data={})
+    for participant_id in (1, 2):
+        BallotService(db_session).create({"participant_id": participant_id})
+
+    class RacedSelector(OffsetWinnerSelector):
+        def sample(self, repo, draw_id, k):
+            # Another process stores its results between the check and the insert
+            db_session.add(
+                DrawResult(draw_id=draw_id, rank=1, tier="grand", participant_id=2)
+            )
+            db_session.commit()
+            return [1]
+
+    drawn = DrawService(db_session, RacedSelector()).draw_winner(draw.draw_date)
+    assert drawn.winner_id == 2
+    assert [r.participant_id for r in service.results(draw.id)] == [2]
+
+
+def test_lottery_date_follows_the_lottery_timezone(monkeypatch):
+    now = datetime(2024, 3, 30, 23, 30, tzinfo=timezone.utc)
+    monkeypatch.setattr(get_settings(), "lottery_timezone", "Europe/Amsterdam")
+    assert lottery_today(now) == date(2024, 3, 31)
+    assert closed_draw_date(now) == date(2024, 3, 30)
+    monkeypatch.setattr(get_settings(), "lottery_timezone", "Pacific/Kiritimati")
+    assert lottery_today(now.replace(hour=10)) == date(2024, 3, 31)
+    monkeypatch.setattr(get_settings(), "lottery_timezone", "Pacific/Pago_Pago")
+    assert lottery_today(now.replace(hour=10)) == date(2024, 3, 29)
+
+
+def test_open_upcoming(service):
+    service.create({})
+    assert service.open_upcoming(2) == 2
+    assert service.open_upcoming(2) == 0
+    dates = [draw.draw_date for draw in service.list_all()]
+    assert dates == [lottery_today() + timedelta(days=day) for day in range(3)]
+
+
+def test_open_upcoming_raced_by_another_process(service, monkeypatch):
+    # Another process creates the draws between the check and the insert
+    monkeypatch.setattr(service.repo, "existing_values", lambda *args: set())
+    service.create({})
+    assert service.open_upcoming(1) == 0
+    assert len(service.list_all()) == 1
+
+
+def test_last_drawn(service, db_session):
+    with pytest.raises(NotFoundError):
+        service.last_drawn()
+    closed = Draw(draw_date=closed_draw_date())
+    db_session.add_all([closed, Ballot(participant_id=4, draw=closed)])
+    db_session.commit()
+    with pytest.raises(NotFoundError, match="not been drawn"):
+        service.last_drawn()
+
+    service.draw_winner(closed.draw_date)
+    assert service.last_drawn().winner_id == 4
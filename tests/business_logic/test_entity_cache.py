@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.business_logic.entity_cache import (
+    LocalCacheBackend,
+    get_entity_cache,
+)
+from app.business_logic.participant_service import ParticipantService
+from app.config import get_settings
+from app.exceptions import NotFoundError
+
+
+@pytest.fixture
+def entity_cache(monkeypatch):
+    monkeypatch.setattr(get_settings(), "entity_cache_enabled", True)
+    get_entity_cache.cache_clear()
+    return get_entity_cache()
+
+
+@pytest.fixture
+def new_session(db_engine):
+    return sessionmaker(bind=db_engine, autoflush=False)
+
+
+@pytest.fixture
+def selects(db_engine, capture_sql):
+    return capture_sql(db_engine).selects
+
+
+def test_local_backend_is_lru_and_bounded():
+    backend = LocalCacheBackend(max_entries=2)
+    backend.set("a", {"id": 1})
+    backend.set("b", {"id": 2})
+    assert backend.get("a") == {"id": 1}
+    backend.set("c", {"id": 3})  # evicts b, the least recently used
+
+    assert backend.get("b") is None
+    assert backend.get("c") == {"id": 3}
+    assert backend.stats() == {"hits": 2, "misses": 1, "evictions": 1, "size": 2}
+
+
+def test_local_backend_expires_entries():
+    backend = LocalCacheBackend(ttl=0)
+    backend.set("a", {"id": 1})
+    assert backend.get("a") is None
+    assert backend.stats()["size"] == 0
+
+
+def test_get_reads_through_across_sessions(entity_cache, new_session, selects):
+    created = ParticipantService(new_session()).create({"name": "A", "email": "a@x"})
+
+    first = ParticipantService(new_session()).get(created.id)
+    before = len(selects())
+    second = ParticipantService(new_session()).get(created.id)
+
+    assert len(selects()) == before  # served from the cache
+    assert (second.id, second.name, second.email) == (first.id, "A", "a@x")
+    assert entity_cache.stats()["hits"] == 1
+
+
+def test_writes_invalidate(entity_cache, new_session):
+    service = ParticipantService(new_session())
+    pid = service.create({"name": "A", "email": "a@x"}).id
+    service.get(pid)
+
+    service.update(pid, {"name": "B"})
+    assert ParticipantService(new_session()).get(pid).name == "B"
+
+    service.delete(pid)
+    with pytest.raises(NotFoundError):
+        ParticipantService(new_session()).get(pid)
+
+
+def test_cached_entity_can_be_updated(entity_cache, new_session):
+    pid = ParticipantService(new_session()).create({"name": "A", "email": "a@x"}).id
+    ParticipantService(new_session()).get(pid)
+
+    db = new_session()
+    cached = ParticipantService(db).get(pid)
+    cached.name = "C"
+    db.commit()
+    assert ParticipantService(new_session()).repo.get(pid).name == "C"
+
+
+def test_disabled_by_default(db_session):
+    assert get_entity_cache() is None
+    assert ParticipantService(db_session).cache is None
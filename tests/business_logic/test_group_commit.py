@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from app.business_logic.ballot_service import BallotService
+from app.business_logic.draw_service import DrawService
+from app.business_logic.group_commit import GroupCommitBuffer
+from app.data_access_layer.models import Ballot
+
+
+@pytest.fixture
+def buffer(db_engine):
+    buffer = GroupCommitBuffer(
+        sessionmaker(bind=db_engine), Ballot, max_rows=5, interval=0.2
+    )
+    try:
+        yield buffer
+    finally:
+        buffer.stop()
+
+
+def test_concurrent_submissions_share_commits(buffer, db_engine, db_session):
+    commits = []
+    event.listen(db_engine, "commit", lambda conn: commits.append(conn))
+    rows = [{"participant_id": i, "draw_id": 1} for i in range(10)]
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        ids = list(pool.map(lambda row: buffer.submit(row).result(), rows))
+
+    assert len(set(ids)) == 10
+    assert len(commits) < 10
+    stored = {b.id: b.participant_id for b in db_session.query(Ballot).all()}
+    assert {stored[ballot_id] for ballot_id in ids} == set(range(10))
+
+
+def test_bad_row_only_fails_its_caller(buffer):
+    good = buffer.submit({"participant_id": 1, "draw_id": 1})
+    bad = buffer.submit({"participant_id": None, "draw_id": 1})
+    assert good.result() > 0
+    with pytest.raises(IntegrityError):
+        bad.result()
+
+
+def test_ballot_service_with_buffer(buffer, db_session):
+    draw = DrawService(db_session).create(draw_data={})
+    service = BallotService(db_session, write_buffer=buffer)
+    ballot = service.create({"participant_id": 4})
+    assert ballot.draw_id == draw.id
+    assert service.get(ballot.id).participant_id == 4
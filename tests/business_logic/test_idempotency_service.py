@@ -0,0 +1,78 @@
+import pytest
+
+from app.business_logic.idempotency_service import IdempotencyService
+from app.exceptions import ConflictError, ValidationError
+
+
+@pytest.fixture
+def service(db_session, clock):
+    return IdempotencyService(db_session, ttl=60, clock=clock, lease=10)
+
+
+def test_replays_completed_request(service):
+    assert service.begin("POST /x", "k1", {"a": 1}) is None
+    service.complete("POST /x", "k1", 200, {"id": 7})
+
+    stored = service.begin("POST /x", "k1", {"a": 1})
+    assert stored.status_code == 200
+    assert stored.body == {"id": 7}
+    # Keys are scoped per endpoint
+    assert service.begin("POST /y", "k1", {"a": 1}) is None
+
+
+def test_rejects_reuse_and_concurrent_retry(service):
+    service.begin("POST /x", "k1", {"a": 1})
+    with pytest.raises(ConflictError):
+        service.begin("POST /x", "k1", {"a": 1})
+    with pytest.raises(ValidationError):
+        service.begin("POST /x", "k1", {"a": 2})
+
+
+def test_abandoned_key_runs_again(service):
+    service.begin("POST /x", "k1", {"a": 1})
+    service.abandon("POST /x", "k1")
+    assert service.begin("POST /x", "k1", {"a": 1}) is None
+
+
+def test_claim_of_a_dead_worker_is_taken_over(service, clock):
+    # The worker dies between begin and complete/abandon
+    service.begin("POST /x", "k1", {"a": 1})
+    clock.advance(9)
+    with pytest.raises(ConflictError):
+        service.begin("POST /x", "k1", {"a": 1})
+
+    clock.advance(2)
+    assert service.begin("POST /x", "k1", {"a": 1}) is None
+    service.complete("POST /x", "k1", 201, {"id": 3})
+    # A completed key is replayed for the whole TTL, past the lease
+    clock.advance(30)
+    assert service.begin("POST /x", "k1", {"a": 1}).status_code == 201
+
+
+def test_keys_expire(service, clock):
+    service.begin("POST /x", "old", {})
+    service.complete("POST /x", "old", 200, {"id": 1})
+    clock.advance(30)
+    service.begin("POST /x", "new", {})
+    clock.advance(31)
+
+    assert service.purge_expired() == 1
+    # An expired key is claimed afresh even before it is purged
+    clock.advance(60)
+    assert service.begin("POST /x", "new", {"b": 2}) is None
+
+
+def test_key_released_during_a_claim_is_claimed_again(service, db_session, monkeypatch):
+    service.begin("POST /x", "k1", {"a": 1})
+    get = db_session.get
+
+    def released_get(*args, **kwargs):
+        # The holder fails and frees the key just after our insert was refused
+        monkeypatch.setattr(db_session, "get", get)
+        service.abandon("POST /x", "k1")
+        return get(*args, **kwargs)
+
+    monkeypatch.setattr(db_session, "get", released_get)
+    assert service.begin("POST /x", "k1", {"a": 1}) is None
+    with pytest.raises(ConflictError):
+        service.begin("POST /x", "k1", {"a": 1})
@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.business_logic.leader_election import LeaderLease
+from app.data_access_layer.models import Lease
+
+
+@pytest.fixture
+def make_lease(db_engine, clock):
+    session_factory = sessionmaker(bind=db_engine, autoflush=False)
+
+    def make(holder):
+        return LeaderLease(
+            session_factory, "scheduler", ttl=30, holder=holder, clock=clock
+        )
+
+    return make
+
+
+def test_only_one_process_leads(make_lease, db_session):
+    a, b = make_lease("a"), make_lease("b")
+
+    assert a.acquire() is True
+    assert b.acquire() is False
+    assert a.acquire() is True  # heartbeat renews
+    assert db_session.get(Lease, "scheduler").holder == "a"
+
+
+def test_lapsed_lease_fails_over(make_lease, clock):
+    a, b = make_lease("a"), make_lease("b")
+    assert a.acquire()
+
+    clock.advance(20)
+    assert a.acquire()  # renewed until 23:59:50
+    clock.advance(20)
+    assert not b.acquire()
+
+    clock.advance(11)  # a stopped sending heartbeats
+    assert b.acquire()
+    assert not a.acquire()
+    assert not a.is_leader
+
+
+def test_release_hands_over_immediately(make_lease):
+    a, b = make_lease("a"), make_lease("b")
+    assert a.acquire()
+    a.release()
+    assert b.acquire()
+
+
+def test_only_leader_runs_job_once(make_lease):
+    runs = []
+
+    def job():
+        runs.append(1)
+        return "ran"
+
+    workers = [make_lease(f"w{i}") for i in range(8)]
+    results = [worker.only_leader(job)() for worker in workers]
+
+    assert runs == [1]
+    assert results.count("ran") == 1
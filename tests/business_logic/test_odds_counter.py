@@ -0,0 +1,132 @@
+import pytest
+
+from app.business_logic.ballot_service import BallotService
+from app.business_logic.draw_service import DrawService
+from app.business_logic.odds_counter import OddsCounter, get_current_odds
+from app.config import get_settings
+from app.data_access_layer.general_repository import GeneralRepository
+from app.data_access_layer.models import Ballot, Participant
+
+
+def test_counts_follow_adds_and_removes():
+    counter = OddsCounter(ttl=60)
+    counter.load(1, {7: 2, 8: 1})
+    assert counter.is_loaded(1) and not counter.is_loaded(2)
+
+    counter.add(1, [7, 9])
+    counter.add(2, [7])  # another draw is ignored
+    assert counter.ballots_of(7) == (3, 5)
+    assert counter.totals() == (5, 3)
+
+    counter.remove(1, 8)
+    counter.remove(1, 8)  # never below zero
+    assert counter.ballots_of(8) == (0, 4)
+    assert counter.totals() == (4, 2)
+
+
+def test_counters_expire_after_ttl():
+    counter = OddsCounter(ttl=0)
+    counter.load(1, {})
+    assert not counter.is_loaded(1)
+
+
+def test_ballots_counted_during_a_load_are_applied():
+    counter = OddsCounter(ttl=60)
+    with counter.loading(1) as token:
+        counter.add(1, [7])  # entered while the load's query runs
+        counter.add(1, [8])
+        counter.remove(1, 8)
+        counter.load(1, {7: 1}, token)
+    assert counter.ballots_of(7) == (2, 2)
+    assert counter.ballots_of(8) == (0, 2)
+    assert counter.is_loaded(1)
+
+
+def test_one_load_of_a_draw_at_a_time():
+    counter = OddsCounter(ttl=60)
+    counter.load(1, {7: 1})
+    with counter.loading(1) as token:
+        with counter.loading(1) as concurrent:
+            assert concurrent is None
+        with counter.loading(2) as other_draw:
+            assert other_draw is not None
+        counter.load(1, {7: 1}, token)
+    with counter.loading(1) as token:
+        assert token is not None
+
+
+def test_process_counters_built_from_settings_on_first_use(monkeypatch):
+    monkeypatch.setattr(get_settings(), "odds_resync_seconds", 5)
+    assert get_current_odds().ttl == 5
+    assert get_current_odds() is get_current_odds()
+
+
+@pytest.fixture
+def service(db_session):
+    DrawService(db_session).create({})
+    GeneralRepository(db_session, Participant).add_many(
+        [{"name": f"P{i}", "email": f"p{i}@x.com"} for i in range(2)]
+    )
+    return BallotService(db_session)
+
+
+def test_odds_follow_ballots_without_queries(service, db_session, capture_sql):
+    created = service.create({"participant_id": 1})
+    service.create_many([{"participant_id": 1}, {"participant_id": 2}])
+    assert service.participant_odds(1) == {
+        "participant_id": 1,
+        "draw_id": created.draw_id,
+        "ballots": 2,
+        "total_ballots": 3,
+        "chance": 2 / 3,
+    }
+
+    captured = capture_sql(db_session.get_bind())
+    service.create({"participant_id": 3})
+    service.delete(created.id)
+    captured.clear()
+
+    assert service.odds() == {
+        "draw_id": created.draw_id,
+        "ballots": 3,
+        "participants": 3,
+    }
+    assert service.participant_odds(1)["ballots"] == 1
+    assert service.participant_odds(404)["chance"] == 0.0
+    assert captured.statements == []
+
+
+def test_odds_loaded_from_ballot_counts(service, db_session):
+    draw_id = service.current_draw_id()
+    # Written around the service, as another worker process would
+    GeneralRepository(db_session, Ballot).add_many(
+        [{"participant_id": 5, "draw_id": draw_id}] * 4
+    )
+    assert service.participant_odds(5)["ballots"] == 4
+
+    get_current_odds().invalidate()
+    assert service.odds()["ballots"] == 4
+
+
+def test_ballot_during_a_load_does_not_reload(
+    service, db_session, capture_sql, monkeypatch
+):
+    draw_id = service.current_draw_id()
+    find_rows = GeneralRepository.find_rows
+
+    def raced_find_rows(repo, *args, **kwargs):
+        rows = find_rows(repo, *args, **kwargs)
+        # Another request counts a ballot before the load completes
+        GeneralRepository(db_session, Ballot).add_many(
+            [{"participant_id": 5, "draw_id": draw_id}]
+        )
+        get_current_odds().add(draw_id, [5])
+        return rows
+
+    monkeypatch.setattr(GeneralRepository, "find_rows", raced_find_rows)
+    get_current_odds().invalidate()
+    assert service.participant_odds(5)["ballots"] == 1
+
+    captured = capture_sql(db_session.get_bind())
+    assert service.odds()["ballots"] == 1
+    assert captured.statements == []
@@ -0,0 +1,38 @@
+from datetime import date
+
+import pytest
+
+from app.business_logic.draw_service import DrawService
+from app.business_logic.pagination import decode_cursor, encode_cursor
+from app.business_logic.participant_service import ParticipantService
+from app.exceptions import ValidationError
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(42), int) == 42
+    assert decode_cursor(encode_cursor(date(2025, 1, 2)), date) == date(2025, 1, 2)
+    with pytest.raises(ValidationError):
+        decode_cursor("not-a-cursor", int)
+
+
+def test_list_page_walks_all_items(db_session):
+    service = ParticipantService(db_session)
+    for i in range(5):
+        service.create({"name": f"P{i}", "email": f"p{i}@example.com"})
+    seen, cursor = [], None
+    while True:
+        page, cursor = service.list_page(cursor=cursor, limit=2)
+        seen.extend(p.email for p in page)
+        if cursor is None:
+            break
+    assert seen == [f"p{i}@example.com" for i in range(5)]
+
+
+def test_draws_paged_by_date(db_session):
+    service = DrawService(db_session)
+    for day in (3, 1, 2):
+        service.repo.add(draw_date=date(2025, 1, day))
+    page, cursor = service.list_page(limit=2)
+    assert [d.draw_date.day for d in page] == [1, 2]
+    page, cursor = service.list_page(cursor=cursor, limit=2)
+    assert [d.draw_date.day for d in page] == [3] and cursor is None
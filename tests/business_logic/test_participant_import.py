@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from app.business_logic.participant_import import (
+    achunked,
+    aiter_records,
+    chunked,
+    iter_records,
+)
+
+
+def test_csv_records():
+    lines = ["name,email\n", "A,a@x.com\n", "\n", '"B, Jr.","b\n', 'x@y.com"\n']
+    assert list(iter_records(lines, "csv")) == [
+        {"name": "A", "email": "a@x.com"},
+        {"name": "B, Jr.", "email": "b\nx@y.com"},
+    ]
+
+
+def test_ndjson_records():
+    lines = ['{"name": "A", "email": "a@x.com"}\n', "oops\n", "\n"]
+    assert list(iter_records(lines, "ndjson")) == [
+        {"name": "A", "email": "a@x.com"},
+        {},
+    ]
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        list(iter_records([], "xml"))
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_async_records_across_chunk_boundaries():
+    async def body():
+        for chunk in [b"name,em", b"ail\nA,a@x.c", "om\nÉ,é".encode()[:-1], b"\xa9@x"]:
+            yield chunk
+
+    async def collect():
+        return [chunk async for chunk in achunked(aiter_records(body(), "csv"), size=1)]
+
+    assert asyncio.run(collect()) == [
+        [{"name": "A", "email": "a@x.com"}],
+        [{"name": "É", "email": "é@x"}],
+    ]
@@ -55,3 +55,44 @@ def test_delete_and_not_found(service):
     assert d.id == r.id
     with pytest.raises(NotFoundError):
         service.delete(9999)
+
+
+def test_import_records(service):
+    service.create({"name": "Old", "email": "old@example.com"})
+    records = [
+        {"name": "A", "email": "a@example.com"},
+        {"name": "Old again", "email": "old@example.com"},
+        {"name": "A again", "email": "a@example.com"},
+        {"name": "", "email": "blank@example.com"},
+        {"email": "noname@example.com"},
+        ["not", "a", "record"],
+        {"name": "B", "email": "b@example.com"},
+    ]
+    report = service.import_records(records, chunk_size=2)
+    assert report == {"created": 2, "duplicates": 2, "invalid": 3}
+    emails = {p.email for p in service.list_all()}
+    assert emails == {"old@example.com", "a@example.com", "b@example.com"}
+
+
+def test_import_raced_by_another_import(service, monkeypatch):
+    existing_values = service.repo.existing_values
+    checks = []
+
+    def raced_existing_values(column, values):
+        checks.append(values)
+        taken = existing_values(column, values)
+        if len(checks) == 1:
+            # Another import takes an email between the check and the insert
+            service.create({"name": "Other", "email": "b@example.com"})
+        return taken
+
+    monkeypatch.setattr(service.repo, "existing_values", raced_existing_values)
+    records = [
+        {"name": "A", "email": "a@example.com"},
+        {"name": "B", "email": "b@example.com"},
+    ]
+    report = service.import_chunk(records)
+    assert report == {"created": 1, "duplicates": 1, "invalid": 0}
+    assert len(checks) == 2
+    emails = {p.email: p.name for p in service.list_all()}
+    assert emails == {"a@example.com": "A", "b@example.com": "Other"}
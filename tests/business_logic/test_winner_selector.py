@@ -0,0 +1,102 @@
+import random
+from datetime import date
+
+import pytest
+
+from app.business_logic.winner_selector import (
+    FenwickTree,
+    IdRangeWinnerSelector,
+    OffsetWinnerSelector,
+    ReservoirWinnerSelector,
+    WeightedWinnerSelector,
+    get_winner_selector,
+)
+from app.data_access_layer.general_repository import GeneralRepository
+from app.data_access_layer.models import Ballot, Draw
+
+SELECTORS = [
+    OffsetWinnerSelector(),
+    IdRangeWinnerSelector(),
+    ReservoirWinnerSelector(batch_size=2),
+    WeightedWinnerSelector(),
+]
+
+
+@pytest.fixture
+def repo(db_session):
+    return GeneralRepository(db_session, Ballot)
+
+
+@pytest.fixture
+def draws(db_session):
+    draw_repo = GeneralRepository(db_session, Draw)
+    first = draw_repo.add(draw_date=date(2025, 1, 1))
+    second = draw_repo.add(draw_date=date(2025, 1, 2))
+    return first, second
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_select_only_from_draw(selector, repo, draws):
+    first, second = draws
+    # interleave ballots of both draws so ids of a draw are not contiguous
+    for participant_id in range(1, 6):
+        repo.add(participant_id=participant_id, draw_id=first.id)
+        repo.add(participant_id=100 + participant_id, draw_id=second.id)
+    for _ in range(20):
+        assert selector.select(repo, first.id) in range(1, 6)
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_select_empty_draw(selector, repo, draws):
+    assert selector.select(repo, draws[0].id) is None
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_every_ballot_can_win(selector, repo, draws, monkeypatch):
+    for participant_id in range(1, 4):
+        repo.add(participant_id=participant_id, draw_id=draws[0].id)
+    # a seeded source keeps the test deterministic
+    rng = random.Random(0)
+    monkeypatch.setattr(
+        "app.business_logic.winner_selector.secrets.randbelow", rng.randrange
+    )
+    winners = {selector.select(repo, draws[0].id) for _ in range(60)}
+    assert winners == {1, 2, 3}
+
+
+def test_unknown_selector():
+    with pytest.raises(ValueError):
+        get_winner_selector("nope")
+
+
+def test_weighted_selector_follows_ballot_counts(repo, draws, monkeypatch):
+    # Participant 2 holds ballots 1..3 of the cumulative weight, 1 holds 0
+    for participant_id in (1, 2, 2, 2):
+        repo.add(participant_id=participant_id, draw_id=draws[0].id)
+    selector = WeightedWinnerSelector()
+    picks = iter([0, 1, 3])
+    monkeypatch.setattr(
+        "app.business_logic.winner_selector.secrets.randbelow", lambda _: next(picks)
+    )
+    assert [selector.select(repo, draws[0].id) for _ in range(3)] == [1, 2, 2]
+
+
+def test_fenwick_tree_find():
+    weights = [3, 0, 1, 4, 2]
+    tree = FenwickTree(weights)
+    expected = [i for i, weight in enumerate(weights) for _ in range(weight)]
+    assert [tree.find(point) for point in range(tree.total)] == expected
+
+    tree.add(0, -3)
+    assert tree.total == 7
+    assert tree.find(0) == 2
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_sample_distinct_participants(selector, repo, draws):
+    for participant_id in (1, 1, 1, 2, 3, 3, 4):
+        repo.add(participant_id=participant_id, draw_id=draws[0].id)
+    winners = selector.sample(repo, draws[0].id, 3)
+    assert len(winners) == 3 and len(set(winners)) == 3
+    assert set(selector.sample(repo, draws[0].id, 10)) == {1, 2, 3, 4}
+    assert selector.sample(repo, draws[1].id, 3) == []
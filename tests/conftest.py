@@ -1,18 +1,118 @@
+from datetime import datetime, timedelta
+from typing import Any
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from app.data_access_layer.database import Base
+from app.business_logic.draw_cache import get_current_draw_cache
+from app.business_logic.draw_events import get_draw_events
+from app.business_logic.entity_cache import get_entity_cache
+from app.business_logic.odds_counter import get_current_odds
+from app.data_access_layer import migrations
+from app.data_access_layer.database import get_db
 from app.main import app
+from app.rate_limit import get_ballot_rate_limiter
+
+
+class FakeClock:
+    """Stands in for a clock: returns `now`, which only moves by `advance`."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        if isinstance(self.now, datetime):
+            self.now += timedelta(seconds=seconds)
+        else:
+            self.now += seconds
+
+
+class SQLCapture:
+    """The statements an engine sends to the database, with their parameters."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.executed: list[tuple[str, Any]] = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.executed.append((statement, parameters))
+
+    @property
+    def statements(self) -> list[str]:
+        return [statement for statement, _ in self.executed]
+
+    def selects(self) -> list[tuple[str, Any]]:
+        return [
+            (statement, parameters)
+            for statement, parameters in self.executed
+            if statement.lstrip().startswith("SELECT")
+        ]
+
+    def clear(self) -> None:
+        self.executed.clear()
+
+    def stop(self) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+@pytest.fixture
+def clock():
+    """A wall clock (UTC datetimes) set to just before midnight."""
+    return FakeClock(datetime(2025, 1, 1, 23, 59))
+
+
+@pytest.fixture
+def monotonic_clock():
+    """A monotonic clock (float seconds)."""
+    return FakeClock(100.0)
+
+
+@pytest.fixture
+def capture_sql():
+    """Start capturing the statements of an engine until the test ends."""
+    captures = []
+
+    def capture(engine: Engine) -> SQLCapture:
+        captures.append(SQLCapture(engine))
+        return captures[-1]
+
+    yield capture
+    for captured in captures:
+        captured.stop()
+
+
+def reset_process_state():
+    get_draw_events().close_all()
+    get_draw_events.cache_clear()
+    get_current_draw_cache.cache_clear()
+    get_current_odds.cache_clear()
+    get_entity_cache.cache_clear()
+    get_ballot_rate_limiter.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_process_caches():
+    # Every test gets a fresh database, so process-local caches must not leak
+    reset_process_state()
+    yield
+    reset_process_state()
 
 
 @pytest.fixture(scope="function")
 def db_engine():
     engine = create_engine(
-        "sqlite:///:memory:", connect_args={"check_same_thread": False}
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
-    Base.metadata.create_all(bind=engine)
+    migrations.upgrade(engine)
     try:
         yield engine
     finally:
@@ -31,7 +131,7 @@ def db_session(db_engine):
 
 
 @pytest.fixture
-def client(db_session, monkeypatch):
+def client(db_session):
     # Override the get_db dependency to use the test session
     def override_get_db():
         try:
@@ -39,5 +139,8 @@ def client(db_session, monkeypatch):
         finally:
             pass
 
-    monkeypatch.setattr("app.data_access_layer.database.get_db", override_get_db)
-    return TestClient(app)
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
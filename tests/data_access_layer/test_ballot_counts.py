@@ -0,0 +1,48 @@
+from sqlalchemy import create_engine, insert, select
+
+from app.data_access_layer import migrations
+from app.data_access_layer.migrations import v0001_baseline
+from app.data_access_layer.general_repository import GeneralRepository
+from app.data_access_layer.models import Ballot, BallotCount
+
+
+def counts(db):
+    stmt = select(
+        BallotCount.draw_id, BallotCount.participant_id, BallotCount.ballots
+    ).order_by(BallotCount.draw_id, BallotCount.participant_id)
+    return [tuple(row) for row in db.execute(stmt)]
+
+
+def test_counts_follow_inserts_and_deletes(db_session):
+    repo = GeneralRepository(db_session, Ballot)
+    first = repo.add(participant_id=1, draw_id=1)
+    repo.add_many(
+        [{"participant_id": 1, "draw_id": 1}, {"participant_id": 2, "draw_id": 1}]
+    )
+    repo.add(participant_id=1, draw_id=2)
+    assert counts(db_session) == [(1, 1, 2), (1, 2, 1), (2, 1, 1)]
+
+    repo.delete(first.id)
+    repo.delete(repo.find_by(participant_id=2)[0].id)
+    assert counts(db_session) == [(1, 1, 1), (2, 1, 1)]
+
+
+def test_counts_backfilled_when_table_is_created(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    # A database of a release that predates ballot_counts
+    tables = [
+        table
+        for table in v0001_baseline.metadata.sorted_tables
+        if table.name != "ballot_counts"
+    ]
+    v0001_baseline.metadata.create_all(engine, tables=tables)
+    with engine.begin() as connection:
+        rows = [{"participant_id": p, "draw_id": 1} for p in (1, 1, 2)]
+        connection.execute(insert(Ballot), rows)
+
+    migrations.upgrade(engine)
+    with engine.begin() as connection:
+        assert counts(connection) == [(1, 1, 2), (1, 2, 1)]
+        connection.execute(insert(Ballot), [{"participant_id": 2, "draw_id": 1}])
+        assert counts(connection) == [(1, 1, 2), (1, 2, 2)]
+    engine.dispose()
@@ -0,0 +1,76 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.config import Settings
+from app.data_access_layer.database import create_tuned_engine, get_async_engine
+
+
+def read_pragmas(connection) -> dict:
+    return {
+        pragma: connection.execute(text(f"PRAGMA {pragma}")).scalar()
+        for pragma in (
+            "journal_mode",
+            "synchronous",
+            "busy_timeout",
+            "cache_size",
+            "mmap_size",
+        )
+    }
+
+
+EXPECTED = {
+    "journal_mode": "wal",
+    "synchronous": 1,  # NORMAL
+    "busy_timeout": 5000,
+    "cache_size": -64000,
+    "mmap_size": 268435456,
+}
+
+
+def test_sqlite_pragmas_active(tmp_path):
+    engine = create_tuned_engine(Settings(db_url=f"sqlite:///{tmp_path / 't.db'}"))
+    try:
+        with engine.connect() as connection:
+            assert read_pragmas(connection) == EXPECTED
+        assert engine.pool.size() == 10
+        assert engine.pool._pre_ping
+    finally:
+        engine.dispose()
+
+
+def test_sqlite_pragmas_follow_settings(tmp_path):
+    settings = Settings(
+        db_url=f"sqlite:///{tmp_path / 't.db'}",
+        sqlite_journal_mode="DELETE",
+        sqlite_synchronous="FULL",
+        sqlite_busy_timeout_ms=100,
+    )
+    engine = create_tuned_engine(settings)
+    try:
+        with engine.connect() as connection:
+            pragmas = read_pragmas(connection)
+        assert pragmas["journal_mode"] == "delete"
+        assert pragmas["synchronous"] == 2
+        assert pragmas["busy_timeout"] == 100
+    finally:
+        engine.dispose()
+
+
+def test_async_sqlite_pragmas_active(tmp_path, monkeypatch):
+    settings = Settings(db_url=f"sqlite:///{tmp_path / 't.db'}")
+    monkeypatch.setattr("app.data_access_layer.database.get_settings", lambda: settings)
+    get_async_engine.cache_clear()
+
+    async def check():
+        engine = get_async_engine()
+        try:
+            async with engine.connect() as connection:
+                return await connection.run_sync(read_pragmas)
+        finally:
+            await engine.dispose()
+
+    try:
+        assert asyncio.run(check()) == EXPECTED
+    finally:
+        get_async_engine.cache_clear()
@@ -48,3 +48,11 @@ def test_delete(repo):
     deleted = repo.delete(r.id)
     assert deleted.id == r.id
     assert repo.get(r.id) is None
+
+
+def test_list_after(repo):
+    ids = [repo.add(name=f"K{i}", email=f"k{i}@example.com").id for i in range(5)]
+    first = repo.list_after(Participant.id, limit=2)
+    assert [r.id for r in first] == ids[:2]
+    rest = repo.list_after(Participant.id, after=first[-1].id, limit=10)
+    assert [r.id for r in rest] == ids[2:]
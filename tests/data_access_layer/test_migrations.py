@@ -0,0 +1,122 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, inspect, insert, text
+
+from app.data_access_layer import migrations
+from app.data_access_layer.models import Participant
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'lottery.db'}")
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def indexes(engine, table):
+    return {
+        info["name"]: (tuple(info["column_names"]), bool(info["unique"]))
+        for info in inspect(engine).get_indexes(table)
+    }
+
+
+def version(engine):
+    with engine.begin() as connection:
+        return migrations.current_version(connection)
+
+
+def test_upgrade_empty_database_to_head(engine):
+    assert migrations.upgrade(engine) == [m.version for m in migrations.migrations()]
+    assert version(engine) == migrations.head()
+    assert indexes(engine, "ballots") == {
+        "ix_ballots_draw_id_id": (("draw_id", "id"), False),
+        "ix_ballots_participant_id_draw_id": (("participant_id", "draw_id"), False),
+    }
+    assert indexes(engine, "participants")["ix_participants_email"] == (
+        ("email",),
+        True,
+    )
+    # Nothing left to apply
+    assert migrations.upgrade(engine) == []
+
+
+def test_upgrade_database_created_before_migrations(engine):
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE participants (id INTEGER PRIMARY KEY, name, email)")
+        )
+        connection.execute(
+            text("CREATE INDEX ix_participants_email ON participants (email)")
+        )
+        connection.execute(
+            text(
+                "CREATE TABLE ballots (id INTEGER PRIMARY KEY, "
+                "participant_id INTEGER, draw_id INTEGER)"
+            )
+        )
+        connection.execute(text("CREATE INDEX ix_ballots_draw_id ON ballots (draw_id)"))
+        connection.execute(
+            insert(Participant), [{"name": "Ada", "email": "ada@example.com"}]
+        )
+
+    migrations.upgrade(engine)
+
+    assert version(engine) == migrations.head()
+    assert "ix_ballots_draw_id" not in indexes(engine, "ballots")
+    assert indexes(engine, "participants")["ix_participants_email"][1]
+    with engine.begin() as connection:
+        assert connection.scalar(text("SELECT count(*) FROM participants")) == 1
+
+
+def test_downgrade_then_upgrade_again(engine):
+    migrations.upgrade(engine)
+
+    assert migrations.downgrade(engine, 1) == [2]
+    assert version(engine) == 1
+    assert indexes(engine, "ballots") == {"ix_ballots_draw_id": (("draw_id",), False)}
+    assert not indexes(engine, "participants")["ix_participants_email"][1]
+
+    assert migrations.upgrade(engine) == [2]
+    assert "ix_ballots_draw_id_id" in indexes(engine, "ballots")
+
+
+def test_unique_emails_refused_while_duplicates_exist(engine):
+    migrations.upgrade(engine, 1)
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_participants_email"))
+        rows = [{"name": name, "email": "same@example.com"} for name in ("A", "B")]
+        connection.execute(insert(Participant), rows)
+
+    with pytest.raises(RuntimeError, match="used more than once"):
+        migrations.upgrade(engine)
+    # The failed migration is rolled back and not recorded
+    assert version(engine) == 1
+
+
+def test_concurrent_runners_apply_each_migration_once(engine):
+    # Workers starting together on a fresh database, each with its own engine
+    engines = [create_engine(engine.url) for _ in range(4)]
+    start = threading.Barrier(len(engines))
+    applied, errors = [], []
+
+    def run(worker_engine):
+        start.wait()
+        try:
+            applied.extend(migrations.upgrade(worker_engine))
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            worker_engine.dispose()
+
+    threads = [threading.Thread(target=run, args=(e,)) for e in engines]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(applied) == [m.version for m in migrations.migrations()]
+    assert version(engine) == migrations.head()
@@ -0,0 +1,117 @@
+"""
+Every query on the hot paths must be served by an index: no table scans, not
+even of a covering index, and no sorting of rows that an index could return
+in order.
+"""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.business_logic.ballot_service import BallotService
+from app.business_logic.draw_service import DrawService, lottery_today
+from app.business_logic.participant_service import ParticipantService
+from app.business_logic.winner_selector import WINNER_SELECTORS
+from app.data_access_layer import migrations
+from app.data_access_layer.general_repository import GeneralRepository
+from app.data_access_layer.models import Ballot, Draw, Participant
+
+TODAY = lottery_today()
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    migrations.upgrade(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    participants = GeneralRepository(session, Participant)
+    participants.add_many(
+        [{"name": f"P{i}", "email": f"p{i}@example.com"} for i in range(20)]
+    )
+    draws = GeneralRepository(session, Draw)
+    for day in range(3):
+        draw = draws.add(draw_date=TODAY - timedelta(days=day))
+        GeneralRepository(session, Ballot).add_many(
+            [{"participant_id": i % 20 + 1, "draw_id": draw.id} for i in range(100)]
+        )
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def queries(engine, capture_sql):
+    return capture_sql(engine).selects
+
+
+def full_scans(engine, queries):
+    """The plan steps of the captured queries that an index should avoid."""
+    scans = []
+    with engine.connect() as connection:
+        for statement, parameters in queries:
+            plan = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+            for detail in (row[-1] for row in plan):
+                if detail.startswith(("SCAN", "USE TEMP B-TREE FOR ORDER BY")):
+                    scans.append((detail, statement))
+    return scans
+
+
+@pytest.mark.parametrize("selector", sorted(WINNER_SELECTORS))
+def test_winner_selection_uses_indexes(engine, db, queries, selector):
+    service = DrawService(db, selector=WINNER_SELECTORS[selector]())
+    service.draw_winner(TODAY - timedelta(days=1))
+    service.results(2)
+    assert queries()
+    assert full_scans(engine, queries()) == []
+
+
+def test_request_paths_use_indexes(engine, db, queries):
+    participants = ParticipantService(db)
+    participants.create({"name": "New", "email": "new@example.com"})
+    participants.import_chunk(
+        [{"name": "Dup", "email": "p1@example.com"}, {"name": "X", "email": "x@a.b"}]
+    )
+    ballots = BallotService(db)
+    ballots.create({"participant_id": 1})
+    list(ballots.export_rows(1))
+    DrawService(db).history(TODAY - timedelta(days=2), TODAY, None, 10)
+    assert queries()
+    assert full_scans(engine, queries()) == []
+
+
+@pytest.mark.parametrize(
+    "service_class", [BallotService, DrawService, ParticipantService]
+)
+def test_keyset_pages_use_indexes(engine, db, capture_sql, service_class):
+    service = service_class(db)
+    _, cursor = service.list_page(limit=2)
+    assert cursor
+    captured = capture_sql(engine)
+    service.list_page(cursor=cursor, limit=2)
+    service.list_page_rows([service.pagination_key], cursor=cursor, limit=2)
+    assert captured.selects()
+    assert full_scans(engine, captured.selects()) == []
+
+
+def test_participant_by_email_uses_index(engine, db, queries):
+    assert ParticipantService(db).repo.find_by(email="p3@example.com")
+    assert queries()
+    assert full_scans(engine, queries()) == []
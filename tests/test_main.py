@@ -0,0 +1,82 @@
+import json
+import subprocess
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+
+import app.main
+from app.business_logic.ballot_service import BallotService
+from app.business_logic.draw_events import get_draw_events
+from app.business_logic.draw_service import (
+    DrawService,
+    closed_draw_date,
+    lottery_today,
+)
+from app.data_access_layer.models import Ballot, Draw
+from app.main import app as application
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_import_has_no_side_effects(tmp_path):
+    db_path = tmp_path / "lottery.db"
+    subprocess.run(
+        [sys.executable, "-c", "import app.main"],
+        cwd=ROOT,
+        env={"DB_URL": f"sqlite:///{db_path}", "PATH": ""},
+        check=True,
+        capture_output=True,
+    )
+    assert not db_path.exists()
+
+
+def test_lifespan_creates_tables_and_stops_scheduler(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 't.db'}")
+    monkeypatch.setattr(app.main, "get_engine", lambda: engine)
+    monkeypatch.setattr(app.main, "get_sessionmaker", lambda: sessionmaker(engine))
+    schedulers = []
+    start_scheduler = app.main.start_scheduler
+
+    def record(settings):
+        scheduler, lease = start_scheduler(settings)
+        schedulers.append(scheduler)
+        return scheduler, lease
+
+    monkeypatch.setattr(app.main, "start_scheduler", record)
+
+    with TestClient(application) as client:
+        assert client.get("/health").status_code == 200
+        assert inspect(engine).has_table("draws")
+        assert schedulers[0].running
+
+    assert not schedulers[0].running
+    engine.dispose()
+
+
+def test_daily_draw_job(db_engine, monkeypatch):
+    monkeypatch.setattr(app.main, "get_sessionmaker", lambda: sessionmaker(db_engine))
+    db = sessionmaker(db_engine)()
+    closed = Draw(draw_date=closed_draw_date())
+    db.add_all([closed, Ballot(participant_id=7, draw=closed)])
+    db.commit()
+
+    app.main.run_daily_draw()
+
+    # The closed draw is drawn and its result pushed to subscribers
+    assert get_draw_events().latest.id == closed.id
+    assert json.loads(get_draw_events().latest.data)["winner_id"] == 7
+    # The open draw and the next ones exist before their day starts
+    upcoming = [lottery_today() + timedelta(days=day) for day in range(3)]
+    assert len(DrawService(db).get_by_attributes({}, limit=10)) == 4
+    assert DrawService(db).get_by_attributes({"draw_date": upcoming[-1]})
+    assert BallotService(db).create({"participant_id": 1}).draw_id != closed.id
+
+    # Other workers pick the result up without publishing it twice
+    latest = get_draw_events().latest
+    app.main.publish_draw_result()
+    assert get_draw_events().latest is latest
+    db.close()
@@ -0,0 +1,93 @@
+import pytest
+from fastapi import status
+from sqlalchemy import text
+
+from app.metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    db_pool_checkout_wait,
+    db_query_duration,
+    http_request_duration,
+    http_requests,
+    instrument_engine,
+    scheduler_job_duration,
+    statement_type,
+    timed_job,
+)
+
+
+def test_counter_and_histogram_render_prometheus_text():
+    registry = MetricsRegistry()
+    hits = registry.register(Counter("hits_total", "Hits.", ("path",)))
+    latency = registry.register(
+        Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    )
+    hits.inc('/a"b')
+    hits.inc('/a"b')
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE hits_total counter" in lines
+    assert 'hits_total{path="/a\\"b"} 2.0' in lines
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_sum 5.55" in lines
+    assert "latency_seconds_count 3" in lines
+
+
+def test_statement_type():
+    assert statement_type("  select 1") == "SELECT"
+    assert statement_type("INSERT INTO ballots VALUES (?)") == "INSERT"
+    assert statement_type("") == "OTHER"
+
+
+def test_requests_are_labelled_by_route_template(client):
+    before = http_requests.value("GET", "/draws/{draw_id}", "404")
+    timed = http_request_duration.count("GET", "/draws/{draw_id}")
+
+    assert client.get("/draws/123").status_code == status.HTTP_404_NOT_FOUND
+    assert client.get("/draws/456").status_code == status.HTTP_404_NOT_FOUND
+
+    assert http_requests.value("GET", "/draws/{draw_id}", "404") == before + 2
+    assert http_request_duration.count("GET", "/draws/{draw_id}") == timed + 2
+
+
+def test_metrics_endpoint(client):
+    client.get("/health")
+    resp = client.get("/metrics")
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/health",status="200"}' in resp.text
+    assert "# TYPE db_query_duration_seconds histogram" in resp.text
+
+
+def test_instrument_engine_times_queries_and_checkouts(db_engine):
+    instrument_engine(db_engine)
+    selects = db_query_duration.count("SELECT")
+    checkouts = db_pool_checkout_wait.count()
+
+    with db_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert db_query_duration.count("SELECT") == selects + 1
+    assert db_pool_checkout_wait.count() == checkouts + 1
+
+
+def test_timed_job_records_outcome():
+    @timed_job("test_job")
+    def job(fail):
+        if fail:
+            raise RuntimeError("boom")
+        return "done"
+
+    assert job(False) == "done"
+    with pytest.raises(RuntimeError):
+        job(True)
+
+    assert scheduler_job_duration.count("test_job", "success") == 1
+    assert scheduler_job_duration.count("test_job", "error") == 1
@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import ASGITransport, AsyncClient
+
+from app import main
+from app.config import get_settings
+from app.exceptions import RateLimitedError
+from app.rate_limit import (
+    BallotRateLimiter,
+    LoadSheddingMiddleware,
+    TokenBucketLimiter,
+)
+
+
+def test_token_bucket_refills_at_rate(monotonic_clock):
+    limiter = TokenBucketLimiter(rate=2.0, burst=3, clock=monotonic_clock)
+
+    assert [limiter.acquire("a") for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire("a") == pytest.approx(0.5)
+    assert limiter.acquire("b") == 0  # buckets are per key
+
+    monotonic_clock.advance(0.5)
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") > 0
+
+
+def test_token_bucket_bounds_keys(monotonic_clock):
+    limiter = TokenBucketLimiter(rate=1.0, burst=1, max_keys=2, clock=monotonic_clock)
+    for key in ("a", "b", "c"):
+        limiter.acquire(key)
+    assert list(limiter._buckets) == ["b", "c"]
+
+
+def test_token_bucket_lends_beyond_burst(monotonic_clock):
+    limiter = TokenBucketLimiter(rate=1.0, burst=2, clock=monotonic_clock)
+    assert limiter.wait("a", 5) == 0
+    limiter.take("a", 5)
+    assert limiter.acquire("a") == pytest.approx(4.0)
+
+
+def test_rejected_ballot_charges_nobody(monotonic_clock):
+    limiter = BallotRateLimiter(
+        participant=TokenBucketLimiter(rate=1.0, burst=1, clock=monotonic_clock),
+        client=TokenBucketLimiter(rate=1.0, burst=2, clock=monotonic_clock),
+    )
+    limiter.check([1], "host")
+    with pytest.raises(RateLimitedError):
+        limiter.check([1], "host")
+    limiter.check([2], "host")  # the participant's rejection cost the client nothing
+    with pytest.raises(RateLimitedError):
+        limiter.check([3], "host")
+    limiter.check([3], "other")
+
+
+def test_ballots_over_limit_get_429(client, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "ballot_rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "ballot_burst_per_participant", 2)
+    client.post("/draws/", json={})
+
+    for _ in range(2):
+        resp = client.post("/ballots/", json={"participant_id": 1})
+        assert resp.status_code == status.HTTP_200_OK
+    resp = client.post("/ballots/", json={"participant_id": 1})
+    assert resp.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert resp.headers["Retry-After"] == "1"
+
+    resp = client.post("/ballots/", json={"participant_id": 2})
+    assert resp.status_code == status.HTTP_200_OK
+    assert len(client.get("/ballots/").json()) == 3
+
+
+def test_load_shedding_over_max_in_flight():
+    app = FastAPI()
+    release = asyncio.Event()
+
+    @app.get("/slow")
+    async def slow():
+        await release.wait()
+        return {}
+
+    @app.get("/health")
+    async def health():
+        return {}
+
+    app.add_middleware(LoadSheddingMiddleware, max_in_flight=1)
+
+    async def run():
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://t") as http:
+            first = asyncio.create_task(http.get("/slow"))
+            await asyncio.sleep(0.01)
+            shed = await http.get("/slow")
+            health = await http.get("/health")
+            release.set()
+            return (await first), shed, health
+
+    first, shed, probe = asyncio.run(run())
+    assert first.status_code == status.HTTP_200_OK
+    assert shed.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert shed.headers["Retry-After"] == "1"
+    assert probe.status_code == status.HTTP_200_OK
+
+
+def test_replayed_ballot_is_not_charged(client, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "ballot_rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "ballot_burst_per_participant", 1)
+    client.post("/draws/", json={})
+
+    headers = {"Idempotency-Key": "retry-1"}
+    for _ in range(2):
+        resp = client.post("/ballots/", json={"participant_id": 1}, headers=headers)
+        assert resp.status_code == status.HTTP_200_OK
+    resp = client.post("/ballots/", json={"participant_id": 1})
+    assert resp.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+def test_bulk_ballots_charged_per_item(client, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "ballot_rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "ballot_burst_per_client", 3)
+    client.post("/draws/", json={})
+    for i in range(2):
+        client.post("/participants/", json={"name": f"P{i}", "email": f"p{i}@x.com"})
+
+    items = [{"participant_id": 1}, {"participant_id": 2}]
+    assert client.post("/ballots/bulk", json=items).json()["created"] == 2
+    resp = client.post("/ballots/bulk", json=items)
+    assert resp.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert len(client.get("/ballots/").json()) == 2
+
+
+def test_load_shedding_defaults_to_pool_capacity():
+    settings = get_settings()
+    shedding = [m for m in main.app.user_middleware if m.cls is LoadSheddingMiddleware]
+    assert [m.kwargs["max_in_flight"] for m in shedding] == [
+        settings.db_pool_size + settings.db_max_overflow
+    ]